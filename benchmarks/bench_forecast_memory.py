@@ -0,0 +1,63 @@
+"""
+Benchmark for the memory a cached forecast needs, in memory and in the persistent store. The precomputed
+summaries are part of the in memory size and are reported separately as well, they are not pickled but rebuilt
+when a forecast from the store is used.
+
+Run from the project root with: python -m benchmarks.bench_forecast_memory
+"""
+import gc
+import json
+import pickle
+import tracemalloc
+
+from benchmarks.common import load_config, build_forecast_response
+from rhasspy_weather.api import openweathermap
+from rhasspy_weather.data_types.location import Location
+
+payloads = {
+    "standard 3-hourly forecast (40 entries)": (40, 3),
+    "hourly forecast (120 entries)": (120, 1)
+}
+forecast_count = 50
+
+
+def measure(count: int, step_hours: int):
+    # every forecast gets its own json decoded response, like forecasts fetched from the api
+    encoded = json.dumps(build_forecast_response(count, step_hours))
+    location = Location("Berlin")
+    location.set_lat_and_lon(52.5244, 13.4105)
+    openweathermap.parse_forecast(json.loads(encoded)["list"], location)
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    forecasts = []
+    for _ in range(forecast_count):
+        forecasts.append(openweathermap.parse_forecast(json.loads(encoded)["list"], location))
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    pickled = pickle.dumps(forecasts[0], pickle.HIGHEST_PROTOCOL)
+
+    # forecasts loaded from the store have no summaries yet
+    restored = [pickle.loads(pickled) for _ in range(forecast_count)]
+    gc.collect()
+    tracemalloc.start()
+    before_summaries = tracemalloc.get_traced_memory()[0]
+    for forecast in restored:
+        forecast.summarize()
+    gc.collect()
+    after_summaries = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / forecast_count, (after_summaries - before_summaries) / forecast_count, len(pickled)
+
+
+def main():
+    load_config()
+    for name, (count, step_hours) in payloads.items():
+        in_memory, summaries, pickled = measure(count, step_hours)
+        print(f"{name:<45} {in_memory:>10.0f} bytes in memory (summaries {summaries:.0f}) {pickled:>8} bytes pickled")
+
+
+if __name__ == "__main__":
+    main()
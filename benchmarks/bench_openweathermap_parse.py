@@ -0,0 +1,32 @@
+"""
+Benchmark for parsing Open Weather Map forecast responses.
+
+Run from the project root with: python -m benchmarks.bench_openweathermap_parse
+"""
+import timeit
+
+from benchmarks.common import load_config, build_forecast_response, print_result
+from rhasspy_weather.api import openweathermap
+from rhasspy_weather.data_types.location import Location
+
+payloads = {
+    "standard 3-hourly forecast (40 entries)": (40, 3),
+    "3-hourly forecast (120 entries)": (120, 3),
+    "hourly forecast (120 entries)": (120, 1),
+    "hourly forecast (480 entries)": (480, 1)
+}
+
+
+def main():
+    load_config()
+    for name, (count, step_hours) in payloads.items():
+        response = build_forecast_response(count, step_hours)
+        location = Location("Berlin")
+        location.set_lat_and_lon(response["city"]["coord"]["lat"], response["city"]["coord"]["lon"])
+        number = max(1, 4000 // count)
+        seconds = min(timeit.repeat(lambda: openweathermap.parse_forecast(response["list"], location), number=number, repeat=5))
+        print_result(name, seconds, number, "parse")
+
+
+if __name__ == "__main__":
+    main()
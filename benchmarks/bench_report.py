@@ -0,0 +1,42 @@
+"""
+Benchmark for building weather reports from forecasts with more and more entries per day.
+
+Run from the project root with: python -m benchmarks.bench_report
+"""
+import datetime
+import timeit
+
+from benchmarks.common import load_config, build_forecast_response, print_result
+from rhasspy_weather.api import openweathermap
+from rhasspy_weather.data_types.location import Location
+from rhasspy_weather.data_types.report import WeatherReport
+from rhasspy_weather.data_types.request import WeatherRequest, DateType, Grain, ForecastType
+
+payloads = {
+    "3-hourly (8 entries/day)": (40, 3),
+    "hourly (24 entries/day)": (120, 1),
+    "quarter-hourly (96 entries/day)": (480, 0.25),
+    "5-minutely (288 entries/day)": (1440, 1 / 12)
+}
+intervals = {
+    "whole day": None,
+    "afternoon": (datetime.time(14), datetime.time(18))
+}
+
+
+def main():
+    load_config()
+    location = Location("Berlin")
+    location.set_lat_and_lon(52.5244, 13.4105)
+    tomorrow = datetime.date.today() + datetime.timedelta(days=1)
+    for name, (count, step_hours) in payloads.items():
+        weather = openweathermap.parse_forecast(build_forecast_response(count, step_hours)["list"], location)
+        request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.FULL)
+        for interval_name, interval in intervals.items():
+            number = 2000
+            seconds = min(timeit.repeat(lambda: WeatherReport(request, weather, interval).speech[ForecastType.FULL], number=number, repeat=5))
+            print_result(f"{name}, {interval_name}", seconds, number, "report")
+
+
+if __name__ == "__main__":
+    main()
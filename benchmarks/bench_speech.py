@@ -0,0 +1,57 @@
+"""
+Benchmark for formulating the answers of weather reports in both locales, the weather is summarized once,
+only the sentences are built again and again. Filling an answer string in a single pass (utils.fill_placeholders)
+is also compared to filling it in two str.format passes that put back the placeholders filled later, as the
+reports did before.
+
+Run from the project root with: python -m benchmarks.bench_speech
+"""
+import datetime
+import timeit
+
+from benchmarks.common import load_config, build_forecast_response
+from rhasspy_weather.api import openweathermap
+from rhasspy_weather.data_types.condition import ConditionType
+from rhasspy_weather.data_types.location import Location
+from rhasspy_weather.data_types.report import WeatherReport
+from rhasspy_weather.data_types.request import WeatherRequest, DateType, Grain, ForecastType
+from rhasspy_weather.data_types.temperature import TemperatureType
+from rhasspy_weather.utils import utils
+
+locales = {
+    "german": "Regenschirm",
+    "english": "umbrella"
+}
+
+
+def main():
+    tomorrow = datetime.date.today() + datetime.timedelta(days=1)
+    for locale, item in locales.items():
+        load_config(locale)
+        location = Location("Berlin")
+        location.set_lat_and_lon(52.5244, 13.4105)
+        weather = openweathermap.parse_forecast(build_forecast_response()["list"], location)
+        requested = {ForecastType.FULL: None, ForecastType.TEMPERATURE: TemperatureType.COLD,
+                     ForecastType.CONDITION: ConditionType.RAIN, ForecastType.ITEM: item}
+        for forecast_type, requested_value in requested.items():
+            request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, forecast_type)
+            request.requested = requested_value
+            report = WeatherReport(request, weather)
+            number = 5000
+            seconds = min(timeit.repeat(report.report, number=number, repeat=5))
+            print(f"{locale + ', ' + forecast_type.name.lower():<45} {number / seconds:>12.0f} sentences/s")
+
+        config = load_config(locale)
+        answers = config.locale.condition_answers[ConditionType.GENERAL] + config.locale.condition_answers[ConditionType.RAIN]["true"]
+        weather = "leichter Regen, Bewölkt und Windstille"
+        number = 20000
+        seconds = min(timeit.repeat(lambda: [utils.format_string(x.format(weather=weather, when="{when}", where="{where}").format(
+            when="morgen", where="", temperature="{temperature}", weather="{weather}")) for x in answers], number=number, repeat=5))
+        print(f"{locale + ', two str.format passes':<45} {number * len(answers) / seconds:>12.0f} sentences/s")
+        seconds = min(timeit.repeat(lambda: [utils.format_string(utils.fill_placeholders(x, weather=weather, when="morgen"))
+                                             for x in answers], number=number, repeat=5))
+        print(f"{locale + ', single pass':<45} {number * len(answers) / seconds:>12.0f} sentences/s")
+
+
+if __name__ == "__main__":
+    main()
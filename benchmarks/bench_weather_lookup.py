@@ -0,0 +1,41 @@
+"""
+Benchmark for looking up forecast entries for a time or an interval, compared to scanning all entries of the day.
+
+Run from the project root with: python -m benchmarks.bench_weather_lookup
+"""
+import datetime
+import timeit
+
+from benchmarks.common import load_config, build_forecast_response, print_result
+from rhasspy_weather.api import openweathermap
+from rhasspy_weather.data_types.location import Location
+
+intervals = {
+    "whole day": (datetime.time.min, datetime.time.max),
+    "afternoon": (datetime.time(14), datetime.time(18)),
+    "point in time": (datetime.time(15), datetime.time(15))
+}
+
+
+def scan(entries, interval):
+    return [x for x in entries if interval[0] <= x.time < interval[1] or x.time <= interval[1] <= x.end_time]
+
+
+def main():
+    load_config()
+    location = Location("Berlin")
+    location.set_lat_and_lon(52.5244, 13.4105)
+    for count, step_hours in [(40, 3), (120, 1)]:
+        weather = openweathermap.parse_forecast(build_forecast_response(count, step_hours)["list"], location)
+        date = datetime.date.today() + datetime.timedelta(days=1)
+        entries = weather.get_weather_for_date(date)
+        for name, interval in intervals.items():
+            number = 20000
+            seconds = min(timeit.repeat(lambda: weather.get_weather_at_interval(date, interval), number=number, repeat=5))
+            print_result(f"{len(entries)} entries/day, {name}", seconds, number, "lookup")
+            seconds = min(timeit.repeat(lambda: scan(entries, interval), number=number, repeat=5))
+            print_result(f"{len(entries)} entries/day, {name} (scan)", seconds, number, "lookup")
+
+
+if __name__ == "__main__":
+    main()
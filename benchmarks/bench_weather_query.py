@@ -0,0 +1,46 @@
+"""
+Benchmark for summarizing arbitrary time ranges of a forecast with the range index, compared to summarizing
+the entries of the range one by one.
+
+Run from the project root with: python -m benchmarks.bench_weather_query
+"""
+import datetime
+import timeit
+
+from benchmarks.common import load_config, build_forecast_response, print_result
+from rhasspy_weather.api import openweathermap
+from rhasspy_weather.data_types.forecast_columns import to_timestamp
+from rhasspy_weather.data_types.location import Location
+from rhasspy_weather.data_types.weather_summary import WeatherSummary
+
+ranges = {
+    "afternoon": (datetime.timedelta(days=1, hours=14), datetime.timedelta(days=1, hours=18)),
+    "one day": (datetime.timedelta(days=1), datetime.timedelta(days=2)),
+    "three days": (datetime.timedelta(days=1), datetime.timedelta(days=4))
+}
+
+
+def summarize_entries(weather, start, end):
+    columns = weather.columns
+    first, last = columns.get_index_range(to_timestamp(start.date(), start.time()), to_timestamp(end.date(), end.time()))
+    return WeatherSummary.from_entries(columns.aggregate(first, last), columns.entries[first:last])
+
+
+def main():
+    load_config()
+    location = Location("Berlin")
+    location.set_lat_and_lon(52.5244, 13.4105)
+    today = datetime.datetime.combine(datetime.date.today(), datetime.time.min)
+    for count, step_hours in [(40, 3), (480, 1)]:
+        weather = openweathermap.parse_forecast(build_forecast_response(count, step_hours)["list"], location)
+        weather.range_index
+        for name, (start, end) in ranges.items():
+            number = 2000
+            seconds = min(timeit.repeat(lambda: weather.query(today + start, today + end), number=number, repeat=5))
+            print_result(f"{count} entries, {name}", seconds, number, "query")
+            seconds = min(timeit.repeat(lambda: summarize_entries(weather, today + start, today + end), number=number, repeat=5))
+            print_result(f"{count} entries, {name} (entry by entry)", seconds, number, "query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import datetime
+import os
+import random
+import tempfile
+from pathlib import Path
+
+import rhasspy_weather.data_types.config as cf
+
+# (id, main, description) of the weather conditions used in the generated payloads
+weather_conditions = [
+    (500, "Rain", "light rain"),
+    (501, "Rain", "moderate rain"),
+    (600, "Snow", "light snow"),
+    (800, "Clear", "clear sky"),
+    (801, "Clouds", "few clouds"),
+    (803, "Clouds", "broken clouds"),
+    (211, "Thunderstorm", "thunderstorm"),
+    (741, "Fog", "fog")
+]
+
+
+def load_config(locale: str = "german"):
+    """
+    Loads a config based on config.default with a dummy api key and without the persistent cache,
+    so benchmarks never touch the network or the users forecast store.
+
+    Args:
+        locale: (optional) name of the locale to use, default is german
+
+    """
+    default_config = os.path.join(str(Path(__file__).parent.parent), "rhasspy_weather", "config.default")
+    config = open(default_config, "r").read()
+    config = config.replace("api_key=", "api_key=benchmark").replace("persistent=True", "persistent=False")
+    config = config.replace("locale=german", "locale=" + locale).replace("output=log, console", "output=return")
+    config_file = tempfile.NamedTemporaryFile("w", suffix=".ini", delete=False)
+    config_file.write(config)
+    config_file.close()
+    cf.set_config_path(config_file.name)
+    return cf.get_config()
+
+
+def build_forecast_list(count: int = 40, step_hours: float = 3, seed: int = 42) -> list:
+    """
+    Builds a synthetic "list" part of an Open Weather Map forecast response
+
+    Args:
+        count: number of entries, the free api returns 40
+        step_hours: hours between two entries
+        seed: seed for the random values
+
+    Returns:
+        list of forecast entries like the api returns them
+
+    """
+    rng = random.Random(seed)
+    now = datetime.datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+    start = now + datetime.timedelta(hours=step_hours - now.hour % step_hours)
+    forecast_list = []
+    for x in range(count):
+        date_and_time = start + datetime.timedelta(hours=x * step_hours)
+        owm_id, main, description = rng.choice(weather_conditions)
+        forecast_list.append({
+            "dt": int(date_and_time.replace(tzinfo=datetime.timezone.utc).timestamp()),
+            "main": {"temp": round(rng.uniform(-5, 30), 2), "pressure": rng.randint(990, 1030), "humidity": rng.randint(20, 100)},
+            "weather": [{"id": owm_id, "main": main, "description": description, "icon": "01d"}],
+            "wind": {"speed": round(rng.uniform(0, 15), 2), "deg": rng.randint(0, 359)},
+            "dt_txt": date_and_time.strftime("%Y-%m-%d %H:%M:%S")
+        })
+    return forecast_list
+
+
+def build_forecast_response(count: int = 40, step_hours: float = 3, seed: int = 42) -> dict:
+    """
+    Builds a complete synthetic Open Weather Map forecast response for Berlin, see build_forecast_list
+    """
+    return {
+        "cod": "200",
+        "message": 0,
+        "cnt": count,
+        "list": build_forecast_list(count, step_hours, seed),
+        "city": {"id": 2950159, "name": "Berlin", "coord": {"lat": 52.5244, "lon": 13.4105}, "country": "DE"}
+    }
+
+
+def print_result(name: str, seconds: float, calls: int, unit: str = "call"):
+    print(f"{name:<45} {seconds / calls * 1e6:>12.1f} µs/{unit}")
@@ -3,6 +3,7 @@ Answer Rhasspy GetForecast intents received via mqtt in a hermes like fashion
 """
 
 import paho.mqtt.client as mqtt
+import asyncio
 import datetime
 import json
 import logging
@@ -16,6 +17,9 @@ logfile = os.path.join(os.path.dirname(os.path.abspath(__file__)), '/tmp/rhasspy
 root_logger = custom_logger(logfile)
 log = logging.getLogger(__name__)
 
+# intents are answered on this loop, so the paho network loop never waits for the weather api
+loop = asyncio.get_event_loop()
+
 def speech(text):
     global o
     o["speech"] = {"text": text}
@@ -48,16 +52,20 @@ def on_message(client, userdata, msg):
             print(json.dumps(o))
         elif intent.startswith("GetWeatherForecast"):
             log.info("Detected Weather Intent")
-            try:
-                forecast = weather.get_weather_forecast(o, config_path="../rhasspy_weather_config.ini")
-                print(json.dumps(o))
-            except Exception as e:
-                log.error(f'Error handling intent {o}:{e}')
+            asyncio.run_coroutine_threadsafe(answer_weather_intent(o), loop)
         else:
             log.info("No intent found.")
             print(json.dumps(o))
 
 
+async def answer_weather_intent(o):
+    try:
+        forecast = await weather.get_weather_forecast_async(o, config_path="../rhasspy_weather_config.ini")
+        print(json.dumps(o))
+    except Exception as e:
+        log.error(f'Error handling intent {o}:{e}')
+
+
 client = mqtt.Client()
 # Insert mqtt credentials here
 client.username_pw_set(username="",password="")
@@ -67,4 +75,8 @@ client.on_message = on_message
 # Insert mqtt brokerer details here
 client.connect("127.0.0.1", 1883, 60)
 
-client.loop_forever()
+# keeps the forecast for the configured locations warm if prefetch is enabled in the config
+weather.start_prefetcher(config_path="../rhasspy_weather_config.ini")
+
+client.loop_start()
+loop.run_forever()
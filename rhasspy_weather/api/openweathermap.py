@@ -4,14 +4,18 @@ import logging
 import requests
 
 from rhasspy_weather.data_types.config import get_config
-from rhasspy_weather.data_types.condition import WeatherCondition, ConditionType
+from rhasspy_weather.data_types.condition import ConditionType, get_condition
 from rhasspy_weather.data_types.error import ErrorCode, WeatherError, ConfigError
 from rhasspy_weather.data_types.weather import Weather
 from rhasspy_weather.data_types.weather_at_time import WeatherAtTime
+from rhasspy_weather.utils import http
+from rhasspy_weather.utils.rate_limit import RateLimiter, parse_rate_limit, parse_retry_after
 
 log = logging.getLogger(__name__)
 
 api_key = None
+timeout = http.default_timeout
+rate_limiter = RateLimiter()
 
 
 def get_weather(location):
@@ -33,54 +37,84 @@ def get_weather(location):
     else:
         url_location = f"q={location.city}"
     forecast_url = f"http://api.openweathermap.org/data/2.5/forecast?{url_location}&APPID={api_key}&units={config.units}&lang={config.locale.language_code}"
+    if not rate_limiter.acquire():
+        raise WeatherError(ErrorCode.API_TIMEOUT_ERROR, "Rate limit for openweathermap reached, not calling the api.")
     try:
-        response = requests.get(forecast_url)
-        response = response.json()
+        http_response = http.get_session().get(forecast_url, timeout=timeout)
+        if http_response.status_code == 429:
+            rate_limiter.throttled(parse_retry_after(http_response.headers.get("Retry-After")))
+            raise WeatherError(ErrorCode.API_TIMEOUT_ERROR, "Openweathermap rate limit reached.")
+        if http_response.status_code >= 500:
+            rate_limiter.failed()
+            raise WeatherError(ErrorCode.NO_NETWORK_ERROR, f"Openweathermap answered with status {http_response.status_code}.")
+        response = http_response.json()
 
         if str(response["cod"]) == "400":
             raise WeatherError(ErrorCode.LOCATION_ERROR, response["message"])
         elif str(response["cod"]) == "401":
             raise WeatherError(ErrorCode.API_ERROR)
         elif str(response["cod"]) == "429":
-            raise WeatherError(ErrorCode.API_TIMEOUT_ERROR)
+            rate_limiter.throttled()
+            raise WeatherError(ErrorCode.API_TIMEOUT_ERROR, "Openweathermap rate limit reached.")
         elif str(response["cod"]) == "404":
             raise WeatherError(ErrorCode.LOCATION_ERROR)
+    except requests.exceptions.Timeout:
+        rate_limiter.failed()
+        raise WeatherError(ErrorCode.NO_NETWORK_ERROR, "Weather could not be fetched in time.")
+    except (requests.exceptions.ConnectionError, ValueError):
+        rate_limiter.failed()
+        raise WeatherError(ErrorCode.NO_NETWORK_ERROR, "Weather could not be fetched.")
+    # the api answered, a forecast that can't be parsed is no reason to back off
+    rate_limiter.succeeded()
 
-        # Parse the output of Open Weather Map's forecast endpoint
+    # Parse the output of Open Weather Map's forecast endpoint
+    try:
         if not (hasattr(location, "lat") and hasattr(location, "lon")):
             location.set_lat_and_lon(response["city"]["coord"]["lat"], response["city"]["coord"]["lon"])
 
-        forecasts = {}
-        for x in response["list"]:
-            if str(datetime.date.fromtimestamp(x["dt"])) not in forecasts:
-                forecasts[str(datetime.date.fromtimestamp(x["dt"]))] = \
-                    list(filter(lambda forecast: datetime.date.fromtimestamp(forecast["dt"]) == datetime.date.fromtimestamp(x["dt"]), response["list"]))
-
-        weather = Weather()
-        for key, forecast in forecasts.items():
-            condition_list = []
-            weather_condition = [x["weather"][0]["main"] for x in forecast]
-            weather_description = [x["weather"][0]["description"] for x in forecast]
-            weather_id = [x["weather"][0]["id"] for x in forecast]
-            for x in range(len(weather_condition)):
-                temp_condition = WeatherCondition(__get_severity_from_open_weather_map_id(weather_id[x]), weather_description[x], __get_condition_type(weather_id[x]))
-                condition_list.append(temp_condition)
-
-            __parse_weather(
-                weather,
-                datetime.datetime.strptime(key, "%Y-%m-%d").date(),
-                location,
-                3,
-                [datetime.datetime.strptime(x, "%H:%M:%S").time() for x in [x["dt_txt"].split(" ")[1] for x in forecast]],
-                [x["main"]["temp"] for x in forecast],
-                condition_list,
-                [x["main"]["pressure"] for x in forecast],
-                [x["main"]["humidity"] for x in forecast],
-                [x["wind"]["speed"] for x in forecast],
-                [x["wind"]["deg"] for x in forecast]
-            )
-    except (requests.exceptions.ConnectionError, ValueError):
-        raise WeatherError(ErrorCode.NO_NETWORK_ERROR, "Weather could not be fetched.")
+        weather = parse_forecast(response["list"], location)
+    except (KeyError, IndexError, TypeError, ValueError):
+        raise WeatherError(ErrorCode.API_ERROR, "The forecast from openweathermap could not be parsed.")
+    return weather
+
+
+def parse_forecast(forecast_list, location) -> Weather:
+    """
+    Parses the list of forecasts returned by Open Weather Map's forecast endpoint into a Weather object.
+    Entries are added to the day they belong to in a single pass, the length of the interval an entry
+    covers is taken from the distance between the first two entries (3 hours for the free forecast).
+    Sunrise and sunset for all days of the forecast are calculated up front in one go, the summaries for
+    days and FixedTimes right after parsing.
+
+    Args:
+        forecast_list: the "list" part of the api response
+        location: Location object the forecast is for
+
+    Returns:
+        Weather object
+
+    """
+    interval = 3
+    if len(forecast_list) > 1:
+        interval = max(1, (forecast_list[1]["dt"] - forecast_list[0]["dt"]) // 3600)
+
+    if forecast_list:
+        first_day = datetime.date.fromtimestamp(forecast_list[0]["dt"])
+        last_day = datetime.date.fromtimestamp(forecast_list[-1]["dt"])
+        location.prepare_sun_times([first_day + datetime.timedelta(days=i) for i in range((last_day - first_day).days + 1)])
+
+    weather = Weather()
+    for forecast in forecast_list:
+        owm_weather = forecast["weather"][0]
+        owm_id = owm_weather["id"]
+        condition = get_condition(__get_severity_from_open_weather_map_id(owm_id), __get_condition_type(owm_id), owm_weather["description"])
+        date = datetime.date.fromtimestamp(forecast["dt"])
+        time = datetime.time.fromisoformat(forecast["dt_txt"].partition(" ")[2])
+        main = forecast["main"]
+        wind = forecast["wind"]
+        weather_at_time = WeatherAtTime(date, time, main["temp"], condition, main["pressure"], main["humidity"], wind["speed"], wind["deg"], interval, location)
+        weather.add_weather(date, weather_at_time)
+    weather.summarize()
     return weather
 
 
@@ -93,13 +127,24 @@ def parse_config(config):
     Returns: Nothing
 
     """
-    global api_key
+    global api_key, timeout, rate_limiter
     section = config.get_external_section("OpenWeatherMap")
 
     if section is not None:
         api_key = section.get("api_key")
         if api_key is None or api_key is "":
             raise ConfigError("API Error", "API is set to OpenWeatherMap yet no API-Key is found. Please refer to 'config.default' for an example config.")
+        timeout = http.parse_timeout(section)
+        rate_limiter = parse_rate_limit(section)
+
+
+def get_rate_limit_stats():
+    """
+    Counters of the rate limiter, to see how close the api key is to its quota
+
+    Returns: dict, see RateLimiter.stats
+    """
+    return rate_limiter.stats
 
 
 # parses the weather condition into my own format (WeatherCondition)
@@ -176,9 +221,3 @@ def __get_condition_type(owm_id):
         return ConditionType.MIST
     else:
         return ConditionType.MISC
-
-
-def __parse_weather(weather: Weather, date, location, interval, time, temperature, weather_condition_list, pressure, humidity, wind_speed, wind_direction):
-    for x in range(len(time)):
-        weather_at_time = WeatherAtTime(date, time[x], temperature[x], weather_condition_list[x], pressure[x], humidity[x], wind_speed[x], wind_direction[x], interval, location)
-        weather.add_weather(date, weather_at_time)
@@ -0,0 +1,521 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
+from typing import Optional, Callable, Hashable, Tuple, List, Union
+
+from rhasspy_weather.data_types.config import get_config
+from rhasspy_weather.data_types.error import ErrorCode, WeatherError
+from rhasspy_weather.data_types.location import Location
+from rhasspy_weather.data_types.weather import Weather
+from rhasspy_weather.store import ForecastStore, default_store_path
+
+log = logging.getLogger(__name__)
+
+
+class ForecastCache:
+    """
+    Size bounded in-memory cache for parsed forecasts.
+
+    Entries expire ttl seconds after they were fetched, or later if an expiry is given when they are added
+    (prefetched forecasts stay valid until the next refresh). Expired entries are kept for another max_stale seconds,
+    so they can still be used if a new forecast can't be fetched (fast enough). If the cache is full the least
+    recently used entry is evicted.
+    """
+    def __init__(self, ttl: int = 600, max_entries: int = 32, max_stale: int = 0):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_stale = max_stale
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def get(self, key: str) -> Optional[Weather]:
+        """
+        Looks up a forecast
+
+        Args:
+            key: cache key, see get_cache_key
+
+        Returns:
+            the cached Weather object or None if there is no entry or the entry is expired
+
+        """
+        entry = self.get_entry(key)
+        if entry is None or time.time() > entry[0]:
+            return None
+        return entry[1]
+
+    def get_entry(self, key: str) -> Optional[Tuple[float, Weather]]:
+        """
+        Looks up a forecast including expired ones that expired at most max_stale seconds ago
+
+        Args:
+            key: cache key, see get_cache_key
+
+        Returns:
+            a tuple of the time the forecast expires and the Weather object or None if there is no entry
+
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+            if time.time() <= entry[0] + self.max_stale:
+                self.__entries.move_to_end(key)
+                return entry
+            del self.__entries[key]
+        get_report_cache().invalidate(entry[1].version)
+        return None
+
+    def put(self, key: str, weather: Weather, fetched: float = None, expires: float = None):
+        """
+        Adds a forecast to the cache, evicting the least recently used entries if the cache is full.
+        The cached reports of a replaced or evicted forecast are dropped.
+
+        Args:
+            key: cache key, see get_cache_key
+            weather: the parsed forecast
+            fetched: (optional) timestamp of when the forecast was fetched, default is now
+            expires: (optional) timestamp until the forecast is valid, it is valid for at least ttl seconds
+
+        """
+        if fetched is None:
+            fetched = time.time()
+        expires = fetched + self.ttl if expires is None else max(expires, fetched + self.ttl)
+        with self.__lock:
+            dropped = [self.__entries[key][1]] if key in self.__entries else []
+            self.__entries[key] = (expires, weather)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_entries:
+                dropped.append(self.__entries.popitem(last=False)[1][1])
+        for old_weather in dropped:
+            if old_weather is not weather:
+                get_report_cache().invalidate(old_weather.version)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+
+class ReportCache:
+    """
+    Size bounded cache for the part of weather reports that doesn't depend on the phrasing (see ReportData),
+    keyed by request fingerprint and forecast version. A forecast that changed or was fetched again has a new
+    version, so a report is never built from an older forecast. Entries of forecasts that are replaced or evicted
+    in the forecast cache are dropped right away.
+    """
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.__entries = OrderedDict()
+        self.__versions = {}
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def get(self, fingerprint: Hashable, version: int):
+        """
+        Looks up the data of a report
+
+        Args:
+            fingerprint: fingerprint of the request, see WeatherRequest.fingerprint
+            version: version of the forecast, see Weather.version
+
+        Returns:
+            the cached data or None
+
+        """
+        with self.__lock:
+            data = self.__entries.get((fingerprint, version))
+            if data is not None:
+                self.__entries.move_to_end((fingerprint, version))
+            return data
+
+    def put(self, fingerprint: Hashable, version: int, data):
+        """
+        Adds the data of a report, evicting the least recently used entries if the cache is full
+
+        Args:
+            fingerprint: fingerprint of the request, see WeatherRequest.fingerprint
+            version: version of the forecast, see Weather.version
+            data: the data to cache
+
+        """
+        with self.__lock:
+            self.__entries[(fingerprint, version)] = data
+            self.__entries.move_to_end((fingerprint, version))
+            self.__versions.setdefault(version, set()).add(fingerprint)
+            while len(self.__entries) > self.max_entries:
+                (old_fingerprint, old_version), _ = self.__entries.popitem(last=False)
+                self.__discard(old_fingerprint, old_version)
+
+    def invalidate(self, version: int):
+        """
+        Drops the data of all reports for a version of a forecast
+
+        Args:
+            version: version of the forecast, see Weather.version
+
+        """
+        with self.__lock:
+            for fingerprint in self.__versions.pop(version, ()):
+                self.__entries.pop((fingerprint, version), None)
+
+    def __discard(self, fingerprint: Hashable, version: int):
+        fingerprints = self.__versions.get(version)
+        if fingerprints is not None:
+            fingerprints.discard(fingerprint)
+            if not fingerprints:
+                del self.__versions[version]
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+            self.__versions.clear()
+
+
+def __has_coordinates(location: Location) -> bool:
+    return hasattr(location, "lat") and hasattr(location, "lon")
+
+
+def get_cache_key(location: Location, units: str, language_code: str) -> str:
+    """
+    Builds the key a forecast is cached under.
+
+    Args:
+        location: Location object
+        units: units from the config
+        language_code: language code of the locale
+
+    Returns:
+        the cache key
+
+    """
+    return f"{location.key}|{units}|{language_code}"
+
+
+__forecast_cache = None
+
+
+def get_forecast_cache() -> ForecastCache:
+    global __forecast_cache
+    if __forecast_cache is None:
+        config = get_config()
+        __forecast_cache = ForecastCache(config.cache_ttl, config.cache_max_entries, config.max_stale)
+    return __forecast_cache
+
+
+__report_cache = None
+
+
+def get_report_cache() -> ReportCache:
+    global __report_cache
+    if __report_cache is None:
+        __report_cache = ReportCache()
+    return __report_cache
+
+
+__forecast_store = None
+
+
+def get_forecast_store() -> Optional[ForecastStore]:
+    """
+    Returns the persistent forecast store or None if it is disabled in the config
+    """
+    global __forecast_store
+    config = get_config()
+    if not config.cache_persistent:
+        return None
+    if __forecast_store is None:
+        __forecast_store = ForecastStore(config.cache_path or default_store_path)
+        __forecast_store.remove_expired(config.cache_ttl + config.max_stale)
+    return __forecast_store
+
+
+__coordinates = {}
+__coordinates_lock = threading.Lock()
+
+
+def resolve_coordinates(location: Location) -> bool:
+    """
+    Sets latitude and longitude of a location that only has a city name or zipcode, if its coordinates are known
+    from an earlier request.
+
+    Args:
+        location: Location object, changed in place
+
+    Returns:
+        True if the location has coordinates afterwards, else False
+
+    """
+    if __has_coordinates(location):
+        return True
+    name_key = location.key
+    with __coordinates_lock:
+        coordinates = __coordinates.get(name_key)
+    if coordinates is None:
+        store = get_forecast_store()
+        if store is not None:
+            coordinates = store.get_coordinates(name_key)
+            if coordinates is not None:
+                with __coordinates_lock:
+                    __coordinates[name_key] = coordinates
+    if coordinates is None:
+        return False
+    log.debug(f"Using known coordinates for '{name_key}'")
+    location.set_lat_and_lon(*coordinates)
+    return True
+
+
+def remember_coordinates(name_key: str, lat: float, lon: float):
+    """
+    Saves the coordinates of a city name or zipcode for later requests
+
+    Args:
+        name_key: the normalized city name or zipcode, see Location.key
+        lat: latitude
+        lon: longitude
+
+    """
+    with __coordinates_lock:
+        __coordinates[name_key] = (float(lat), float(lon))
+    store = get_forecast_store()
+    if store is not None:
+        store.put_coordinates(name_key, float(lat), float(lon))
+
+
+__in_flight = {}
+__in_flight_lock = threading.Lock()
+
+
+def fetch_once(key: str, fetch: Callable[[], Weather], cached: Callable[[], Optional[Weather]] = None) -> Weather:
+    """
+    Runs fetch, unless another thread is already running a fetch for the same key. In that case it waits for
+    that fetch and returns its result (or raises its error), so concurrent requests only cause one api call.
+    A request that missed the cache right before an earlier fetch stored its result and finished would start
+    a second fetch, so cached is checked again first.
+
+    Args:
+        key: cache key, see get_cache_key
+        fetch: function getting the weather
+        cached: (optional) function returning a valid cached forecast or None
+
+    Returns:
+        Weather object
+
+    Raises:
+        WeatherError: if the fetch fails
+
+    """
+    with __in_flight_lock:
+        future = __in_flight.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = Future()
+            __in_flight[key] = future
+
+    if not is_leader:
+        log.debug(f"Waiting for running request for '{key}'")
+        return future.result()
+
+    try:
+        weather = cached() if cached is not None else None
+        if weather is None:
+            weather = fetch()
+        else:
+            log.debug(f"Weather for '{key}' was stored by the previous request")
+        future.set_result(weather)
+        return weather
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with __in_flight_lock:
+            del __in_flight[key]
+
+
+def get_weather(location: Location) -> Weather:
+    """
+    Gets the weather for a location from the cache and only asks the api if there is no valid entry.
+    Known city names and zipcodes are replaced by their coordinates first, so they share the entry with requests
+    for those coordinates. The in-memory cache is checked first, then the persistent store (if enabled).
+    Concurrent requests for the same location share one request to the api.
+
+    If stale_while_revalidate is enabled and there only is an expired forecast, a new one is fetched in the
+    background. If that takes longer than the latency budget or fails, the expired forecast is returned.
+    Without stale_while_revalidate the expired forecast is only returned while the api is rate limited.
+
+    Args:
+        location: Location object
+
+    Returns:
+        Weather object
+
+    Raises:
+        WeatherError: if the weather has to be fetched and the api fails
+
+    """
+    config = get_config()
+    if config.cache_enabled:
+        resolve_coordinates(location)
+    key = get_cache_key(location, config.units, config.locale.language_code)
+    if not config.cache_enabled:
+        return fetch_once(key, lambda: config.api.get_weather(location))
+
+    entry = get_forecast_cache().get_entry(key)
+    if entry is None:
+        entry = __load_from_store(key)
+    if entry is not None:
+        expires, weather = entry
+        if time.time() <= expires:
+            log.debug(f"Using cached weather for '{key}'")
+            return weather
+        if config.stale_while_revalidate:
+            return __revalidate(location, key, weather)
+        try:
+            return fetch_once(key, lambda: __fetch_from_api(location, key), lambda: get_forecast_cache().get(key))
+        except WeatherError as e:
+            if e.error_code != ErrorCode.API_TIMEOUT_ERROR:
+                raise
+            log.warning(f"Api is rate limited, using expired forecast for '{key}'")
+            return weather
+
+    return fetch_once(key, lambda: __fetch_from_api(location, key), lambda: get_forecast_cache().get(key))
+
+
+def __load_from_store(key: str) -> Optional[Tuple[float, Weather]]:
+    """loads the weather from the persistent store (if enabled) and adds it to the in-memory cache, returns the expiry and the weather"""
+    config = get_config()
+    store = get_forecast_store()
+    if store is None:
+        return None
+    entry = store.get(key, config.cache_ttl + get_forecast_cache().max_stale)
+    if entry is None:
+        return None
+    log.debug(f"Loaded weather for '{key}' from store")
+    get_forecast_cache().put(key, entry[1], entry[0])
+    return entry[0] + config.cache_ttl, entry[1]
+
+
+__revalidate_executor = None
+__revalidate_executor_lock = threading.Lock()
+
+
+def __get_revalidate_executor() -> ThreadPoolExecutor:
+    """the thread pool for background refreshes, created on first use"""
+    global __revalidate_executor
+    with __revalidate_executor_lock:
+        if __revalidate_executor is None:
+            __revalidate_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="rhasspy_weather_revalidate")
+    return __revalidate_executor
+
+
+def __revalidate(location: Location, key: str, stale_weather: Weather) -> Weather:
+    """fetches a new forecast in the background and waits for it at most for the latency budget"""
+    config = get_config()
+    future = __get_revalidate_executor().submit(fetch_once, key, lambda: __fetch_from_api(location, key), lambda: get_forecast_cache().get(key))
+    try:
+        return future.result(timeout=config.latency_budget)
+    except TimeoutError:
+        log.info(f"No new weather for '{key}' within {config.latency_budget}s, using expired forecast")
+    except WeatherError as e:
+        log.warning(f"Can't refresh weather for '{key}', using expired forecast: {e.description}")
+    return stale_weather
+
+
+def __fetch_from_api(location: Location, key: str, expires: float = None) -> Weather:
+    """asks the api for the weather and adds it to the caches, see ForecastCache.put for expires"""
+    config = get_config()
+    cache = get_forecast_cache()
+    store = get_forecast_store()
+    name_key = None if __has_coordinates(location) else location.key
+    weather = config.api.get_weather(location)
+    fetched = time.time()
+    if name_key is not None and __has_coordinates(location):
+        remember_coordinates(name_key, location.lat, location.lon)
+    # the api fills in coordinates for city and zipcode requests, so the forecast can be found under those as well
+    resolved_key = get_cache_key(location, config.units, config.locale.language_code)
+    for new_key in {key, resolved_key}:
+        cache.put(new_key, weather, fetched, expires)
+        if store is not None:
+            store.put(new_key, weather, fetched)
+    return weather
+
+
+def refresh_weather(location: Location, expires: float = None) -> Weather:
+    """
+    Fetches the weather for a location from the api even if there is a valid cached forecast and replaces that.
+
+    Args:
+        location: Location object
+        expires: (optional) timestamp until the new forecast stays valid in the cache, at least ttl seconds
+
+    Returns:
+        Weather object
+
+    Raises:
+        WeatherError: if the api fails
+
+    """
+    config = get_config()
+    if config.cache_enabled:
+        resolve_coordinates(location)
+    key = get_cache_key(location, config.units, config.locale.language_code)
+    if not config.cache_enabled:
+        return fetch_once(key, lambda: config.api.get_weather(location))
+    return fetch_once(key, lambda: __fetch_from_api(location, key, expires))
+
+
+def get_weather_many(locations: List[Location], max_workers: int = 8) -> List[Union[Weather, WeatherError]]:
+    """
+    Gets the weather for several locations at once. Locations that are not cached are fetched in parallel on
+    a bounded thread pool, so the whole batch takes about as long as the slowest single request.
+
+    Args:
+        locations: list of Location objects
+        max_workers: (optional) maximum number of parallel api requests, default matches the size of the http connection pool
+
+    Returns:
+        list with a Weather object or the WeatherError for each location, in the same order as locations
+
+    """
+    def get_weather_or_error(location: Location) -> Union[Weather, WeatherError]:
+        try:
+            return get_weather(location)
+        except WeatherError as e:
+            return e
+
+    if len(locations) <= 1:
+        return [get_weather_or_error(location) for location in locations]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(locations)), thread_name_prefix="rhasspy_weather_batch") as executor:
+        return list(executor.map(get_weather_or_error, locations))
+
+
+async def get_weather_async(location: Location) -> Weather:
+    """
+    Coroutine version of get_weather. A forecast in the in-memory cache is returned right away, everything that
+    needs the persistent store or the api runs in the default executor, so the event loop is never blocked.
+
+    Args:
+        location: Location object
+
+    Returns:
+        Weather object
+
+    Raises:
+        WeatherError: if the weather has to be fetched and the api fails
+
+    """
+    config = get_config()
+    if config.cache_enabled:
+        weather = get_forecast_cache().get(get_cache_key(location, config.units, config.locale.language_code))
+        if weather is not None:
+            log.debug("Using cached weather")
+            return weather
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, get_weather, location)
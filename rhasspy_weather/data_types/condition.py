@@ -18,6 +18,8 @@ class ConditionType(WeatherType, Enum):
 
 
 class WeatherCondition:
+    __slots__ = ("severity", "description", "condition_type")
+
     def __init__(self, severity, description, condition_type: ConditionType):
         self.severity = severity
         self.description = description
@@ -39,22 +41,64 @@ class WeatherCondition:
 
 
 class WindCondition(WeatherCondition):
-    def __init__(self, wind_speed, wind_direction):
-        config = get_config()
-        if config.units == "imperial":
+    __slots__ = ()
+
+    def __init__(self, severity):
+        super().__init__(severity, "", ConditionType.WIND)
+
+    @staticmethod
+    def get_severity(wind_speed) -> int:
+        """beaufort number of a wind speed in the configured units"""
+        if get_config().units == "imperial":
             wind_speed = wind_speed / 2.237
-        severity = normal_round((wind_speed / 0.836) * (2 / 3))
+        return normal_round((wind_speed / 0.836) * (2 / 3))
+
+    @staticmethod
+    def get_compass_direction(wind_direction) -> str:
+        """compass direction (N, NE, ...) of a wind direction in degrees"""
+        return compass_directions[int((wind_direction / 45) + 0.5) % 8]
+
+
+compass_directions = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
+
+# conditions are shared between all forecast entries, there is only one object for every combination of
+# locale, condition type, severity and description. Shared conditions must not be changed.
+__conditions = {}
+
+
+def get_condition(severity, condition_type: ConditionType, description: str = "") -> WeatherCondition:
+    """
+    Returns the shared WeatherCondition for a condition type and severity, creating it on first use
+
+    Args:
+        severity: severity of the condition
+        condition_type: ConditionType
+        description: (optional) description, if empty the description from the locale is used
+
+    Returns:
+        WeatherCondition
+
+    """
+    key = (get_config().locale.__name__, condition_type, severity, description)
+    condition = __conditions.get(key)
+    if condition is None:
+        if condition_type == ConditionType.WIND and description == "":
+            condition = WindCondition(severity)
+        else:
+            condition = WeatherCondition(severity, description, condition_type)
+        condition = __conditions.setdefault(key, condition)
+    return condition
+
 
-        compass_index = int((wind_direction / 45) + 0.5) % 8
-        compass_directions = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
+def get_wind_condition(wind_speed) -> WeatherCondition:
+    """
+    Returns the shared WindCondition for a wind speed
 
-        self.wind_speed = wind_speed
-        self.wind_direction = compass_directions[compass_index]
+    Args:
+        wind_speed: wind speed in the configured units
 
-        description = ""
-        try:
-            self.description = config.locale.conditions[ConditionType.WIND][severity]
-        except KeyError:
-            self.description = ""
-        super().__init__(severity, description, ConditionType.WIND)
+    Returns:
+        WindCondition
 
+    """
+    return get_condition(WindCondition.get_severity(wind_speed), ConditionType.WIND)
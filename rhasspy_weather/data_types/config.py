@@ -14,7 +14,8 @@ config_path = os.path.join(str(Path(__file__).parent.parent.parent), 'config.ini
 config_sections = {
     "General": "__parse_section_general",
     "Weather": "__parse_section_weather",
-    "Location": "__parse_section_location"
+    "Location": "__parse_section_location",
+    "Cache": "__parse_section_cache"
 }
 
 
@@ -38,11 +39,25 @@ class WeatherConfig:
 
         self.location = None
 
+        self.cache_enabled = True
+        self.cache_ttl = 600
+        self.cache_max_entries = 32
+        self.cache_persistent = False
+        self.cache_path = None
+        self.stale_while_revalidate = False
+        self.max_stale = 86400
+        self.latency_budget = 1.0
+        self.prefetch = False
+        self.prefetch_locations = []
+        self.prefetch_delay = 600
+        self.update_interval = 10800
+
         self.__config_parser = configparser.ConfigParser(allow_no_value=True)
         self.__config_parser.read(current_config_path)
 
         for section, function_string in config_sections.items():
-            getattr(self, "_WeatherConfig" + function_string)(self.__config_parser[section])
+            section_proxy = self.__config_parser[section] if self.__config_parser.has_section(section) else None
+            getattr(self, "_WeatherConfig" + function_string)(section_proxy)
 
         log.info("Config Loaded")
 
@@ -71,6 +86,25 @@ class WeatherConfig:
             log.error(f"Required section {section} is missing. Please refer to 'config.default' for an example config.")
         self.location = Location(self.__get_option_with_default_value(section, "city", "Berlin"), section.get("zipcode"), section.get("country_code"), section.get("lat"), section.get("lon"))
 
+    def __parse_section_cache(self, section):
+        if section is None:
+            log.info("No cache section found, using default cache settings.")
+            return
+        # the cache options are optional, config files from before they existed don't have them
+        self.cache_enabled = self.__get_option_with_default_value(section, "enabled", True, "bool", True)
+        self.cache_ttl = self.__get_option_with_default_value(section, "ttl", 600, "int", True)
+        self.cache_max_entries = self.__get_option_with_default_value(section, "max_entries", 32, "int", True)
+        self.cache_persistent = self.__get_option_with_default_value(section, "persistent", False, "bool", True)
+        self.cache_path = section.get("path") or None
+        self.stale_while_revalidate = self.__get_option_with_default_value(section, "stale_while_revalidate", False, "bool", True)
+        self.max_stale = self.__get_option_with_default_value(section, "max_stale", 86400, "int", True)
+        self.latency_budget = self.__get_option_with_default_value(section, "latency_budget", 1.0, "float", True)
+        self.prefetch = self.__get_option_with_default_value(section, "prefetch", False, "bool", True)
+        prefetch_locations = section.get("prefetch_locations") or ""
+        self.prefetch_locations = [Location(city.strip()) for city in prefetch_locations.split(",") if city.strip() != ""]
+        self.prefetch_delay = self.__get_option_with_default_value(section, "prefetch_delay", 600, "int", True)
+        self.update_interval = self.__get_option_with_default_value(section, "update_interval", 10800, "int", True)
+
     def get_external_section(self, section_name):
         if self.__config_parser.has_section(section_name):
             return self.__config_parser[section_name]
@@ -145,7 +179,7 @@ class WeatherConfig:
             raise ConfigError("No locale found", "There is no module in the locale folder that matches the locale name in your config.")
 
     @staticmethod
-    def __get_option_with_default_value(section: configparser.SectionProxy, option, default_value, data_type: str = ""):
+    def __get_option_with_default_value(section: configparser.SectionProxy, option, default_value, data_type: str = "", optional: bool = False):
         if section is not None and option in section:
             try:
                 if data_type == "bool":
@@ -163,7 +197,10 @@ class WeatherConfig:
                     return temp
             except ValueError:
                 return default_value
-        log.error(f"Setting '{option}' is missing from config. Please refer to 'config.default' for an example config.")
+        if optional:
+            log.debug(f"Optional setting '{option}' is missing from config, using the default value '{default_value}'.")
+        else:
+            log.error(f"Setting '{option}' is missing from config. Please refer to 'config.default' for an example config.")
         return default_value
 
 
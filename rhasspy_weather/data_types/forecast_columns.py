@@ -0,0 +1,159 @@
+import datetime
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import List, Sequence, Tuple
+
+from rhasspy_weather.data_types.weather_at_time import WeatherAtTime
+
+
+def to_timestamp(date: datetime.date, time: datetime.time) -> int:
+    """
+    Turns a local date and time into a number that can be compared and searched. It is the number of seconds since
+    the start of the proleptic gregorian calendar, without time zones, so days always have 24 hours.
+    Microseconds are dropped, the forecasts don't have them and time.max must stay before midnight.
+
+    Args:
+        date: local date
+        time: local time
+
+    Returns:
+        seconds as int
+
+    """
+    return date.toordinal() * 86400 + time.hour * 3600 + time.minute * 60 + time.second
+
+
+def find_index_range(starts: Sequence, ends: Sequence, start, end) -> Tuple[int, int]:
+    """
+    Finds the entries for a time range in sorted lists of start and end times with binary searches.
+    Entries starting in [start, end) are selected, as well as the entries that are still going on at end.
+    Those always form one continuous range, as long as the end times are sorted as well, which they are
+    if all entries cover the same length of time.
+
+    Args:
+        starts: sorted start times of the entries
+        ends: end times of the entries, in the same order
+        start: start of the range
+        end: end of the range
+
+    Returns:
+        tuple of the index of the first entry and the index after the last entry
+
+    """
+    first_starting = bisect_left(starts, start)
+    after_starting = bisect_left(starts, end)
+    first_running = bisect_left(ends, end)
+    after_running = bisect_right(starts, end)
+    if first_starting >= after_starting:
+        return (first_running, after_running) if first_running < after_running else (0, 0)
+    if first_running >= after_running:
+        return first_starting, after_starting
+    return min(first_starting, first_running), max(after_starting, after_running)
+
+
+class ForecastAggregate:
+    """
+    Minimum, maximum and mean of the numeric values of a range of forecast entries
+    """
+    __slots__ = ("count", "min_temperature", "max_temperature", "mean_temperature", "min_pressure", "max_pressure",
+                 "mean_pressure", "min_humidity", "max_humidity", "mean_humidity", "max_wind_speed", "mean_wind_speed")
+
+    def __init__(self, count: int, min_temperature: float, max_temperature: float, mean_temperature: float,
+                 min_pressure: float, max_pressure: float, mean_pressure: float, min_humidity: float, max_humidity: float,
+                 mean_humidity: float, max_wind_speed: float, mean_wind_speed: float):
+        self.count = count
+        self.min_temperature = min_temperature
+        self.max_temperature = max_temperature
+        self.mean_temperature = mean_temperature
+        self.min_pressure = min_pressure
+        self.max_pressure = max_pressure
+        self.mean_pressure = mean_pressure
+        self.min_humidity = min_humidity
+        self.max_humidity = max_humidity
+        self.mean_humidity = mean_humidity
+        self.max_wind_speed = max_wind_speed
+        self.mean_wind_speed = mean_wind_speed
+
+    @classmethod
+    def from_arrays(cls, temperature: array, pressure: array, humidity: array, wind_speed: array):
+        """aggregates the values of (slices of) forecast columns"""
+        count = len(temperature)
+        return cls(count, min(temperature), max(temperature), sum(temperature) / count, min(pressure), max(pressure),
+                   sum(pressure) / count, min(humidity), max(humidity), sum(humidity) / count, max(wind_speed),
+                   sum(wind_speed) / count)
+
+    def __str__(self):
+        return f"[count: {self.count}, min_temp: {self.min_temperature}, max_temp: {self.max_temperature}]"
+
+
+class ForecastColumns:
+    """
+    Columnar version of a forecast. Every value of the entries is kept in its own array, sorted by time, so
+    aggregating a time range only needs two binary searches and a few min/max/sum calls over array slices
+    instead of walking WeatherAtTime objects.
+    """
+    def __init__(self, entries: List[WeatherAtTime]):
+        entries = sorted(entries, key=lambda x: (x.date, x.time))
+        self.entries = entries
+        self.starts = array("d", (to_timestamp(x.date, x.time) for x in entries))
+        self.ends = array("d", (to_timestamp(x.date, x.end_time) for x in entries))
+        self.temperature = array("d", (x.temperature for x in entries))
+        self.pressure = array("d", (x.pressure for x in entries))
+        self.humidity = array("d", (x.humidity for x in entries))
+        self.wind_speed = array("d", (x.wind_speed for x in entries))
+        # conditions are shared objects, the column holds an index into the list of distinct conditions
+        self.conditions = []
+        condition_ids = {}
+        for x in entries:
+            if id(x.main_condition) not in condition_ids:
+                condition_ids[id(x.main_condition)] = len(self.conditions)
+                self.conditions.append(x.main_condition)
+        self.condition_ids = array("i", (condition_ids[id(x.main_condition)] for x in entries))
+
+    def __len__(self):
+        return len(self.starts)
+
+    def get_index_range(self, start: int, end: int) -> Tuple[int, int]:
+        """
+        Finds the entries for a time range, see find_index_range
+
+        Args:
+            start: timestamp, see to_timestamp
+            end: timestamp, see to_timestamp
+
+        Returns:
+            tuple of the index of the first entry and the index after the last entry
+
+        """
+        return find_index_range(self.starts, self.ends, start, end)
+
+    def aggregate(self, first: int, last: int) -> ForecastAggregate:
+        """
+        Aggregates the entries from index first to index last (exclusive)
+
+        Args:
+            first: index of the first entry
+            last: index after the last entry
+
+        Returns:
+            ForecastAggregate or None if the range is empty
+
+        """
+        if last <= first:
+            return None
+        return ForecastAggregate.from_arrays(self.temperature[first:last], self.pressure[first:last],
+                                             self.humidity[first:last], self.wind_speed[first:last])
+
+    def aggregate_between(self, start: datetime.datetime, end: datetime.datetime) -> ForecastAggregate:
+        """
+        Aggregates all entries for a time range, which may span several days
+
+        Args:
+            start: local start of the range
+            end: local end of the range
+
+        Returns:
+            ForecastAggregate or None if there are no entries for the range
+
+        """
+        return self.aggregate(*self.get_index_range(to_timestamp(start.date(), start.time()), to_timestamp(end.date(), end.time())))
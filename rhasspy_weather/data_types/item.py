@@ -35,8 +35,12 @@ class WeatherItem:
     def is_for_weather_type(self, weather_type: WeatherType):
         return weather_type in self.weather_types
 
-    def format_for_output(self, sentence="{article} {noun} {verb}"):
+    def get_template_values(self) -> dict:
+        """values for the placeholders {article}, {noun} and {verb} of the answers"""
         from rhasspy_weather.data_types.config import get_config
         locale = get_config().locale
 
-        return utils.remove_excessive_whitespaces(sentence.format(article=self.article, noun=self.name, verb=locale.grammar[self.noun_type], when="{when}", where="{where}", weather="{weather}"))
+        return {"article": self.article, "noun": self.name, "verb": locale.grammar[self.noun_type]}
+
+    def format_for_output(self, sentence="{article} {noun} {verb}"):
+        return utils.remove_excessive_whitespaces(sentence.format(**self.get_template_values(), when="{when}", where="{where}", weather="{weather}"))
@@ -1,32 +1,65 @@
+from rhasspy_weather.utils import sun_times
+
+
 class Location:
     def __init__(self, city, zipcode=None, country_code=None, lat=None, lon=None):
         self.city = city
         self.name = city  # used for output only, intended for custom queries like how is the weather at grandmas (not implemented yet)
+        self.sunrise = None
+        self.sunset = None
         if lat and lon:
-            self.lat = lat
-            self.lon = lon
-            self.sunrise, self.sunset = self.calculate_sunrise_and_sunset(lat, lon)
+            self.set_lat_and_lon(lat, lon)
         if zipcode and country_code:
             self.zipcode = zipcode
             self.country_code = country_code
-        self.sunrise = None
-        self.sunset = None
 
     def set_lat_and_lon(self, lat, lon):
         self.lat = float(lat)
         self.lon = float(lon)
-        self.sunrise, self.sunset = self.calculate_sunrise_and_sunset(lat, lon)
+        self.sunrise, self.sunset = self.calculate_sunrise_and_sunset(self.lat, self.lon)
 
     def set_zipcode(self, zipcode, country_code):
         self.zipcode = zipcode
         self.country_code = country_code
 
-    @staticmethod
-    def calculate_sunrise_and_sunset(lat, lon):
-        import suntime
+    def get_sunrise_and_sunset(self, date=None):
+        """
+        Sunrise and sunset at this location on a specific day
 
-        sun = suntime.Sun(lat, lon)
-        sunrise = sun.get_local_sunrise_time().time()
-        sunset = sun.get_local_sunset_time().time()
+        Args:
+            date: (optional) the day, default is today
 
-        return sunrise, sunset
+        Returns:
+            tuple of local sunrise and sunset time, (None, None) if the location has no coordinates
+
+        """
+        if not (hasattr(self, "lat") and hasattr(self, "lon")):
+            return None, None
+        return sun_times.get_sunrise_and_sunset(self.lat, self.lon, date)
+
+    def prepare_sun_times(self, dates):
+        """
+        Calculates sunrise and sunset for several days at once, so later lookups for those days are cheap
+
+        Args:
+            dates: the days that will be looked up
+
+        """
+        if hasattr(self, "lat") and hasattr(self, "lon"):
+            sun_times.get_sun_times(self.lat, self.lon, dates)
+
+    @property
+    def key(self) -> str:
+        """
+        Normalized location that identifies it, coordinates are preferred over zipcodes and zipcodes over city
+        names, same as the api does it
+        """
+        if hasattr(self, "lat") and hasattr(self, "lon"):
+            return f"{round(float(self.lat), 2)},{round(float(self.lon), 2)}"
+        elif hasattr(self, "zipcode") and hasattr(self, "country_code"):
+            return f"zip:{self.zipcode},{self.country_code}".lower()
+        return f"city:{self.city.strip().lower()}"
+
+    @staticmethod
+    def calculate_sunrise_and_sunset(lat, lon):
+        return sun_times.get_sunrise_and_sunset(lat, lon)
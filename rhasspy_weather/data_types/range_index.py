@@ -0,0 +1,157 @@
+from array import array
+from itertools import accumulate
+from typing import Callable, Dict, List, Optional, Sequence
+
+from rhasspy_weather.data_types.condition import ConditionType, WeatherCondition
+from rhasspy_weather.data_types.forecast_columns import ForecastAggregate, ForecastColumns
+
+
+class SparseTable:
+    """
+    Answers range queries for an idempotent function (min, max, ...) in constant time after O(n log n) preparation.
+    Level k holds the result for every range of length 2^k, a query combines the two (overlapping) ranges of the
+    largest power of two that fit into it.
+    """
+    def __init__(self, values: Sequence, combine: Callable, typecode: str = "d"):
+        self.combine = combine
+        self.levels = [array(typecode, values)]
+        length = 1
+        while length * 2 <= len(values):
+            previous = self.levels[-1]
+            self.levels.append(array(typecode, map(combine, previous[:len(previous) - length], previous[length:])))
+            length *= 2
+
+    def query(self, first: int, last: int):
+        """
+        Combines the values from index first to index last (exclusive), the range must not be empty
+
+        Args:
+            first: index of the first value
+            last: index after the last value
+
+        Returns:
+            the combined value
+
+        """
+        level = (last - first).bit_length() - 1
+        values = self.levels[level]
+        return self.combine(values[first], values[last - (1 << level)])
+
+
+class ForecastRangeIndex:
+    """
+    Range query structure for a forecast. Minimum and maximum of the numeric columns and the most severe condition
+    of every condition type come from sparse tables, sums and condition counts from prefix sums, so every range is
+    summarized in constant time (per condition type), no matter how many entries it covers.
+    """
+    def __init__(self, columns: ForecastColumns):
+        self.columns = columns
+        self.min_temperature = SparseTable(columns.temperature, min)
+        self.max_temperature = SparseTable(columns.temperature, max)
+        self.min_pressure = SparseTable(columns.pressure, min)
+        self.max_pressure = SparseTable(columns.pressure, max)
+        self.min_humidity = SparseTable(columns.humidity, min)
+        self.max_humidity = SparseTable(columns.humidity, max)
+        self.max_wind_speed = SparseTable(columns.wind_speed, max)
+        self.temperature_sums = self.__prefix_sums(columns.temperature)
+        self.pressure_sums = self.__prefix_sums(columns.pressure)
+        self.humidity_sums = self.__prefix_sums(columns.humidity)
+        self.wind_speed_sums = self.__prefix_sums(columns.wind_speed)
+
+        # for every condition type: the condition of every entry (None if it doesn't have one of that type),
+        # a sparse table to find the entry with the most severe one and prefix sums of the occurrences
+        self.conditions: Dict[ConditionType, List[Optional[WeatherCondition]]] = {}
+        for index, weather_at_time in enumerate(columns.entries):
+            for condition in [weather_at_time.main_condition] + weather_at_time.other_conditions:
+                entry_conditions = self.conditions.setdefault(condition.condition_type, [None] * len(columns))
+                if entry_conditions[index] is None or condition.severity > entry_conditions[index].severity:
+                    entry_conditions[index] = condition
+        self.most_severe = {}
+        self.condition_counts = {}
+        for condition_type, entry_conditions in self.conditions.items():
+            self.most_severe[condition_type] = SparseTable([self.__severity_key(x, index) for index, x in enumerate(entry_conditions)], max, "q")
+            self.condition_counts[condition_type] = self.__prefix_sums([x is not None for x in entry_conditions], "q")
+
+    def __severity_key(self, condition: Optional[WeatherCondition], index: int) -> int:
+        """
+        Combines severity and index of an entry into one number, the highest one belongs to the most severe condition
+        and of those to the earliest entry. That way the builtin max can be used for the sparse table.
+        """
+        if condition is None:
+            return -1
+        return condition.severity * len(self.columns) + len(self.columns) - 1 - index
+
+    def __index_from_severity_key(self, key: int) -> int:
+        return len(self.columns) - 1 - key % len(self.columns)
+
+    @staticmethod
+    def __prefix_sums(values: Sequence, typecode: str = "d") -> array:
+        return array(typecode, [0]) + array(typecode, accumulate(values))
+
+    def aggregate(self, first: int, last: int) -> ForecastAggregate:
+        """
+        Aggregates the entries from index first to index last (exclusive), same result as ForecastColumns.aggregate
+
+        Args:
+            first: index of the first entry
+            last: index after the last entry
+
+        Returns:
+            ForecastAggregate or None if the range is empty
+
+        """
+        if last <= first:
+            return None
+        count = last - first
+        return ForecastAggregate(count, self.min_temperature.query(first, last), self.max_temperature.query(first, last),
+                                 (self.temperature_sums[last] - self.temperature_sums[first]) / count,
+                                 self.min_pressure.query(first, last), self.max_pressure.query(first, last),
+                                 (self.pressure_sums[last] - self.pressure_sums[first]) / count,
+                                 self.min_humidity.query(first, last), self.max_humidity.query(first, last),
+                                 (self.humidity_sums[last] - self.humidity_sums[first]) / count,
+                                 self.max_wind_speed.query(first, last),
+                                 (self.wind_speed_sums[last] - self.wind_speed_sums[first]) / count)
+
+    def get_conditions(self, first: int, last: int) -> List[WeatherCondition]:
+        """
+        The most severe condition of every condition type that occurs from index first to index last (exclusive).
+        They are ordered by the first entry that has the most severe condition of a type, within an entry the main
+        condition comes first.
+
+        Args:
+            first: index of the first entry
+            last: index after the last entry
+
+        Returns:
+            list of WeatherCondition objects
+
+        """
+        found = []
+        for condition_type, most_severe in self.most_severe.items():
+            key = most_severe.query(first, last)
+            if key >= 0:
+                index = self.__index_from_severity_key(key)
+                condition = self.conditions[condition_type][index]
+                weather_at_time = self.columns.entries[index]
+                position = 0 if weather_at_time.main_condition is condition else 1 + weather_at_time.other_conditions.index(condition)
+                found.append((index, position, condition))
+        return [condition for index, position, condition in sorted(found, key=lambda x: x[:2])]
+
+    def get_condition_counts(self, first: int, last: int) -> Dict[ConditionType, int]:
+        """
+        How many entries from index first to index last (exclusive) have a condition of each condition type
+
+        Args:
+            first: index of the first entry
+            last: index after the last entry
+
+        Returns:
+            dict of ConditionType and count, types that don't occur are left out
+
+        """
+        counts = {}
+        for condition_type, prefix_sums in self.condition_counts.items():
+            count = prefix_sums[last] - prefix_sums[first]
+            if count > 0:
+                counts[condition_type] = count
+        return counts
@@ -1,44 +1,93 @@
 import datetime
-import math
 import random
-from typing import Tuple, List
+from typing import List, Optional, Tuple
 
+from rhasspy_weather.cache import get_report_cache
 from rhasspy_weather.data_types import item_list
-from rhasspy_weather.data_types.condition import ConditionType
+from rhasspy_weather.data_types.condition import ConditionType, WeatherCondition
 from rhasspy_weather.data_types.config import get_config
 from rhasspy_weather.data_types.error import WeatherError, ErrorCode
 from rhasspy_weather.data_types.request import DateType, Grain, ForecastType, WeatherRequest
 from rhasspy_weather.data_types.temperature import TemperatureType
 from rhasspy_weather.data_types.weather import Weather
+from rhasspy_weather.data_types.weather_summary import WeatherSummary
 from rhasspy_weather.utils import utils
 
 
+class ReportData:
+    """
+    The part of a WeatherReport that doesn't depend on the phrasing: the summary of the weather, the most severe
+    condition of every type and the conditions as they are said. It is cached, see cache.ReportCache.
+    For a detailed report periods holds the same data for every part of the day (morning, afternoon, evening),
+    for a report over several days days holds it for every day.
+    """
+    __slots__ = ("summary", "conditions", "condition_text", "periods", "days")
+
+    def __init__(self, summary: WeatherSummary, periods: List[Tuple[Tuple[datetime.time, datetime.time], "ReportData"]] = None,
+                 days: List[Tuple[datetime.date, "ReportData"]] = None):
+        self.summary = summary
+        # the most severe condition of every type, in the order of the summary
+        self.conditions = {x.condition_type: x for x in summary.conditions}
+        self.condition_text = None
+        self.periods = periods
+        self.days = days
+
+    def get_output_condition_list(self, clouds_and_clear_exclusive: bool = False) -> List[str]:
+        """
+        Method that creates a list of condition descriptions to be used for output, see WeatherReport.get_output_condition_list
+
+        Args:
+            clouds_and_clear_exclusive: only add one of clouds and clear sky
+
+        Returns:
+            A list containing the descriptions of the weather conditions that apply
+
+        """
+        if len(self.conditions) == 1:
+            return [next(iter(self.conditions.values())).description]
+
+        clouds_count = self.summary.condition_counts.get(ConditionType.CLOUDS, 0)
+        clear_count = self.summary.condition_counts.get(ConditionType.CLEAR, 0)
+        conditions = []
+        for condition_type, condition in self.conditions.items():
+            if clouds_and_clear_exclusive:
+                if condition_type == ConditionType.CLOUDS and clouds_count < clear_count:
+                    continue
+                if condition_type == ConditionType.CLEAR and clear_count <= clouds_count:
+                    continue
+            # sun and stars have no description in the locales, they are only used for the condition questions
+            if condition.description:
+                conditions.append(condition.description)
+        return conditions
+
+    def format_conditions(self, locale) -> str:
+        """the conditions combined with the words of the locale, formatted once"""
+        if self.condition_text is None:
+            self.condition_text = locale.combine_conditions(self.get_output_condition_list())
+        return self.condition_text
+
+
 class WeatherReport:
     """
     Class containing information about the weather for a specific WeatherRequest, as well as the answers formulated for TTS.
     """
     def __init__(self, request: WeatherRequest, weather_information: Weather, interval: Tuple[datetime.time, datetime.time] = None):
-        if not (request.grain == Grain.DAY or request.grain == Grain.HOUR):
+        if not (request.grain == Grain.DAY or request.grain == Grain.HOUR or request.grain == Grain.WEEK):
             raise WeatherError(ErrorCode.NOT_IMPLEMENTED_ERROR)
 
         self.config = get_config()
 
         self.request = request
 
-        self.__weather = []
-        self.speech = {}
-        self.min_temperature = math.inf
-        self.max_temperature = -math.inf
-        self.min_pressure = math.inf
-        self.max_pressure = -math.inf
-        self.min_humidity = math.inf
-        self.max_humidity = -math.inf
-        self.weather_condition_list = []
-        self.__change_count = 0
-        self.__condition_counts = {}
+        self.__weather_information = weather_information
+        self.__weather = None
+        self.__speech = {}
 
         if interval:
             self.interval = interval
+        elif request.grain == Grain.WEEK:
+            # whole days from request_date to end_date
+            self.interval = (datetime.time.min, datetime.time.max)
         else:
             if request.date_type == DateType.FIXED:
                 if request.grain == Grain.DAY:
@@ -53,35 +102,172 @@ class WeatherReport:
                 else:
                     raise WeatherError(ErrorCode.NOT_IMPLEMENTED_ERROR)
 
-        self.__weather = self.__weather + weather_information.get_weather_at_interval(request.request_date, self.interval)
-
-        if not self.__weather:
+        # the same question about the same forecast always has the same data, only the answer is formulated anew.
+        # The summaries are precomputed when the forecast is ingested, the entries and answers are only worked out
+        # when they are used
+        report_cache = get_report_cache() if self.config.cache_enabled else None
+        fingerprint = (request.fingerprint, self.interval)
+        self.__data = report_cache.get(fingerprint, weather_information.version) if report_cache else None
+        if self.__data is None:
+            if request.grain == Grain.WEEK:
+                self.__data = self.__get_range_data(weather_information)
+            else:
+                summary = weather_information.get_summary(request.request_date, self.interval)
+                if summary is None:
+                    raise WeatherError(ErrorCode.NO_WEATHER_FOR_DAY_ERROR)
+                self.__data = ReportData(summary, self.__get_periods(weather_information))
+            if report_cache is not None:
+                report_cache.put(fingerprint, weather_information.version, self.__data)
+
+    def __get_periods(self, weather_information: Weather) -> Optional[List[Tuple[Tuple[datetime.time, datetime.time], ReportData]]]:
+        """
+        the data for every part of the day of a detailed report, None if the request isn't detailed or not for the
+        whole day. The summaries of the FixedTimes are calculated together with the one of the whole day when the
+        forecast is ingested, so this doesn't go over the entries again. Parts of the day without weather (the past
+        of today) are left out.
+        """
+        if len(self.request.times) < 2 or self.interval != (datetime.time.min, datetime.time.max):
+            return None
+        periods = []
+        for period in self.request.times:
+            summary = weather_information.get_summary(self.request.request_date, period)
+            if summary is not None:
+                periods.append((period, ReportData(summary)))
+        return periods
+
+    def __get_range_data(self, weather_information: Weather) -> ReportData:
+        """
+        the data for a request over several days: the summary of all of them from the range index and the day
+        summaries calculated when the forecast was ingested, nothing is fetched or walked again
+        """
+        days = weather_information.get_daily_summaries(self.request.request_date, self.request.end_date)
+        if not days:
+            if self.request.request_date > datetime.datetime.now(self.config.timezone).date():
+                raise WeatherError(ErrorCode.FUTURE_WEATHER_ERROR)
             raise WeatherError(ErrorCode.NO_WEATHER_FOR_DAY_ERROR)
+        summary = weather_information.query(datetime.datetime.combine(days[0][0], datetime.time.min),
+                                            datetime.datetime.combine(days[-1][0], datetime.time.max))
+        return ReportData(summary, days=[(date, ReportData(day_summary)) for date, day_summary in days])
 
-        self.__apply_weather()
-        self.report()
+    @property
+    def is_detailed(self) -> bool:
+        """True if the answer is split into parts of the day, which is only done for general questions"""
+        return bool(self.__data.periods) and self.request.forecast_type != ForecastType.ITEM and \
+            not isinstance(self.request.requested, (TemperatureType, ConditionType))
 
     def __str__(self):
-        return f"[count: {self.__change_count}, min_temp: {self.min_temperature}, max_temp: {self.max_temperature}]"
+        return f"[count: {self.__data.summary.count}, min_temp: {self.min_temperature}, max_temp: {self.max_temperature}]"
+
+    @property
+    def speech(self) -> dict:
+        """answers by ForecastType, the answer for the requested forecast type is formulated on first access"""
+        if self.request.forecast_type not in self.__speech:
+            self.report()
+        return self.__speech
 
     def report(self):
         """Method that turns the weather information into text according to the WeatherRequest"""
-        if self.request.forecast_type == ForecastType.TEMPERATURE:
+        if self.is_detailed:
+            self.report_detail()
+        elif self.request.forecast_type == ForecastType.TEMPERATURE:
             self.report_temperature()
         elif self.request.forecast_type == ForecastType.CONDITION:
             self.report_condition()
         elif self.request.forecast_type == ForecastType.FULL:
-            self.report_temperature()
-            self.report_condition()
             self.report_full()
         elif self.request.forecast_type == ForecastType.ITEM:
             self.report_item()
 
-        self.speech[self.request.forecast_type] = self.format_when_and_where(self.speech[self.request.forecast_type], self.get_output_date_and_time(), self.get_output_location())
-
     def report_temperature(self):
         """Method that turns temperature information into text"""
-        general_answer = random.choice(self.config.locale.temperature_answers[TemperatureType.GENERAL])
+        answer = self.__temperature_answer(self.get_output_date_and_time(), self.get_output_location()) + self.__range_answer()
+        self.__speech[ForecastType.TEMPERATURE] = utils.format_string(answer)
+
+    def report_condition(self):
+        """Method that turns condition information into text"""
+        answer = self.__condition_answer(self.get_output_date_and_time(), self.get_output_location()) + self.__range_answer()
+        self.__speech[ForecastType.CONDITION] = utils.format_string(answer)
+
+    def report_full(self):
+        """Method that turns temperature and condition information into text"""
+        # when and where are only said in the first sentence
+        temperature_answer = utils.format_string(self.__temperature_answer())
+        answer = self.__condition_answer(self.get_output_date_and_time(), self.get_output_location()) + " " + temperature_answer
+        self.__speech[ForecastType.FULL] = utils.format_string(answer + self.__range_answer())
+
+    def __range_answer(self) -> str:
+        """
+        the sentences about single days of a request over several days, added to the answer for all of them:
+        the warmest (or coldest) day and the days with rain, snow or thunderstorms if there are some without.
+        Empty if there is weather for only one of the days.
+        """
+        days = self.__data.days
+        if days is None or len(days) < 2:
+            return ""
+        locale = self.config.locale
+        forecast_type = self.request.forecast_type
+        answer = ""
+        if forecast_type != ForecastType.CONDITION:
+            if self.request.requested == TemperatureType.COLD:
+                date, data = min(days, key=lambda x: x[1].summary.aggregate.min_temperature)
+                temperature = data.summary.aggregate.min_temperature
+                range_answer = random.choice(locale.range_answers["coldest"])
+            else:
+                date, data = max(days, key=lambda x: x[1].summary.aggregate.max_temperature)
+                temperature = data.summary.aggregate.max_temperature
+                range_answer = random.choice(locale.range_answers["warmest"])
+            answer = answer + " " + utils.fill_placeholders(range_answer, day=locale.weekday_names[date.weekday()],
+                                                      temperature=locale.format_temperature_output(temperature, temperature))
+        if forecast_type != ForecastType.TEMPERATURE:
+            for condition_type, condition_answers in locale.range_answers.items():
+                if not isinstance(condition_type, ConditionType):
+                    continue
+                if isinstance(self.request.requested, ConditionType) and condition_type != self.request.requested:
+                    continue
+                condition_days = [locale.weekday_names[date.weekday()] for date, data in days if condition_type in data.conditions]
+                if 0 < len(condition_days) < len(days):
+                    answer = answer + " " + utils.fill_placeholders(random.choice(condition_answers), days=locale.combine_conditions(condition_days))
+        return answer
+
+    def report_detail(self):
+        """Method that turns the weather of every part of the day into text, one combined answer"""
+        locale = self.config.locale
+        forecast_type = self.request.forecast_type
+        if forecast_type == ForecastType.TEMPERATURE:
+            introduction = random.choice(locale.temperature_answers["general_temperature_full"])
+        else:
+            introduction = random.choice(locale.condition_answers["general_weather_full"])
+        answer = utils.fill_placeholders(introduction, when=self.get_output_date_and_time(), where=self.get_output_location())
+        for period, data in self.__data.periods:
+            values = {"period": self.get_output_period(period)}
+            if forecast_type != ForecastType.TEMPERATURE:
+                values["weather"] = data.format_conditions(locale)
+            if forecast_type != ForecastType.CONDITION:
+                aggregate = data.summary.aggregate
+                values["temperature"] = locale.format_temperature_output(aggregate.min_temperature, aggregate.max_temperature)
+            answer = answer + " " + utils.fill_placeholders(random.choice(locale.detail_answers[forecast_type.value]), **values)
+        self.__speech[forecast_type] = utils.format_string(answer)
+
+    def get_output_period(self, period: Tuple[datetime.time, datetime.time]) -> str:
+        """
+        Name of a part of the day for output, from the locale for FixedTimes
+
+        Args:
+            period: start and end time
+
+        Returns:
+            the name, or start and end time if it isn't one of the FixedTimes
+
+        """
+        for fixed_time, name in self.config.locale.fixed_times.items():
+            if fixed_time.value == period:
+                return name
+        return f"{period[0]:%H:%M} - {period[1]:%H:%M}"
+
+    def __temperature_answer(self, when: str = "", where: str = "") -> str:
+        locale = self.config.locale
+        general_answer = random.choice(locale.temperature_answers[TemperatureType.GENERAL])
+        temperature_output = locale.format_temperature_output(self.min_temperature, self.max_temperature)
         if self.request.forecast_type == ForecastType.TEMPERATURE and type(self.request.requested) == TemperatureType:
             temperature_type = self.request.requested
             response_type = "false"
@@ -91,117 +277,88 @@ class WeatherReport:
             elif temperature_type == TemperatureType.WARM:
                 if self.min_temperature >= self.config.temperature_warm_from:
                     response_type = "true"
-            self.speech[ForecastType.TEMPERATURE] = random.choice(self.config.locale.temperature_answers[temperature_type][response_type]) + " "
-            general_answer = self.format_when_and_where(general_answer)
-        else:
-            self.speech[ForecastType.TEMPERATURE] = ""
+            answer = utils.fill_placeholders(random.choice(locale.temperature_answers[temperature_type][response_type]), when=when, where=where)
+            return answer + " " + utils.format_string(utils.fill_placeholders(general_answer, temperature=temperature_output))
+        return utils.fill_placeholders(general_answer, temperature=temperature_output, when=when, where=where)
 
-        temperature_output = self.config.locale.format_temperature_output(self.min_temperature, self.max_temperature)
-        temperature_answer = general_answer.format(temperature=temperature_output, when="{when}", where="{where}")
-        self.speech[ForecastType.TEMPERATURE] = self.speech[ForecastType.TEMPERATURE] + temperature_answer
-
-    def report_condition(self):
-        """Method that turns condition information into text"""
+    def __condition_answer(self, when: str = "", where: str = "") -> str:
+        locale = self.config.locale
+        values = {"weather": self.format_conditions(), "when": when, "where": where}
         if self.request.forecast_type == ForecastType.CONDITION and type(self.request.requested) == ConditionType:
             condition_type = self.request.requested
             response_type = "false"
             additional_information = ""
-            if condition_type in [x.condition_type for x in self.weather_condition_list]:
+            if condition_type in self.__data.conditions:
                 response_type = "true"
-                prefix = random.choice(self.config.locale.general_answers["affirmative"])
+                prefix = utils.fill_placeholders(random.choice(locale.general_answers["affirmative"]), **values)
             else:
-                prefix = random.choice(self.config.locale.general_answers["negative"])
-                additional_information = " " + random.choice(self.config.locale.general_answers["weather"])
-            self.speech[ForecastType.CONDITION] = prefix + ", " + random.choice(self.config.locale.condition_answers[condition_type][response_type]) + additional_information
-        else:
-            self.speech[ForecastType.CONDITION] = random.choice(self.config.locale.condition_answers[ConditionType.GENERAL])
-
-        self.speech[ForecastType.CONDITION] = self.speech[ForecastType.CONDITION].format(weather=self.format_conditions(), when="{when}", where="{where}")
-
-    def report_full(self):
-        self.speech[ForecastType.FULL] = self.speech[ForecastType.CONDITION] + " " + self.format_when_and_where(self.speech[ForecastType.TEMPERATURE])
-        self.speech[ForecastType.FULL] = self.speech[ForecastType.FULL].format(weather=self.format_conditions(), when="{when}", where="{where}")
+                prefix = utils.fill_placeholders(random.choice(locale.general_answers["negative"]), **values)
+                additional_information = " " + utils.fill_placeholders(random.choice(locale.general_answers["weather"]), **values)
+            return prefix + ", " + utils.fill_placeholders(random.choice(locale.condition_answers[condition_type][response_type]), **values) + additional_information
+        return utils.fill_placeholders(random.choice(locale.condition_answers[ConditionType.GENERAL]), **values)
 
     def report_item(self):
         """Method that turns item information into text"""
+        locale = self.config.locale
         requested_item = item_list.items.get_item(self.request.requested)
-        true_conditions = []
-        false_conditions = []
-        for condition in self.weather_condition_list:
-            if condition.condition_type in requested_item.weather_types:
-                true_conditions.append(condition)
-            else:
-                false_conditions.append(condition)
-
-        if true_conditions:
-            self.speech[ForecastType.ITEM] = random.choice(self.config.locale.general_answers["affirmative"]) + ", " + requested_item.format_for_output(random.choice(self.config.locale.general_answers["item_needed"])) + ". "
+        values = {"weather": self.format_conditions(), "when": self.get_output_date_and_time(), "where": self.get_output_location(),
+                  **requested_item.get_template_values()}
+        if any(condition.condition_type in requested_item.weather_types for condition in self.weather_condition_list):
+            answer = utils.fill_placeholders(random.choice(locale.general_answers["affirmative"]), **values) + ", " + utils.fill_placeholders(random.choice(locale.general_answers["item_needed"]), **values) + ". "
         else:
-            self.speech[ForecastType.ITEM] = random.choice(self.config.locale.general_answers["negative"]) + ", " + requested_item.format_for_output(random.choice(self.config.locale.general_answers["item_not_needed"])) + ". "
+            answer = utils.fill_placeholders(random.choice(locale.general_answers["negative"]), **values) + ", " + utils.fill_placeholders(random.choice(locale.general_answers["item_not_needed"]), **values) + ". "
 
-        self.speech[ForecastType.ITEM] = self.speech[ForecastType.ITEM] + random.choice(self.config.locale.general_answers["weather"])
-        self.speech[ForecastType.ITEM] = self.speech[ForecastType.ITEM].format(weather=self.format_conditions(), when="{when}", where="{where}")
+        answer = answer + utils.fill_placeholders(random.choice(locale.general_answers["weather"]), **values)
+        self.__speech[ForecastType.ITEM] = utils.format_string(answer)
 
-    @staticmethod
-    def format_when_and_where(answer: str, when: str = "", where: str = "") -> str:
+    def format_conditions(self) -> str:
         """
-        Method that replaces {when} and {where} in a string while leaving {temperature} and {weather} alone
-
-        Args:
-            answer: the string to replace in
-            when: value to replace {when} with, default is an empty string
-            where: value to replace {where} with, default is an empty string
+        Formats conditions with combining words according to locale
 
         Returns:
-            The formatted string
+            the formatted string
 
         """
-        answer = answer.format(when=when, where=where, temperature="{temperature}", weather="{weather}")
-        answer = utils.format_string(answer)
-        return answer
+        return self.__data.format_conditions(self.config.locale)
 
-    def format_conditions(self) -> str:
-        """
-        Formats conditions with combining words according to locale
+    @property
+    def min_temperature(self) -> float:
+        return self.__data.summary.aggregate.min_temperature
 
-        Returns:
-            the formatted string
+    @property
+    def max_temperature(self) -> float:
+        return self.__data.summary.aggregate.max_temperature
+
+    @property
+    def min_pressure(self) -> float:
+        return self.__data.summary.aggregate.min_pressure
+
+    @property
+    def max_pressure(self) -> float:
+        return self.__data.summary.aggregate.max_pressure
+
+    @property
+    def min_humidity(self) -> float:
+        return self.__data.summary.aggregate.min_humidity
+
+    @property
+    def max_humidity(self) -> float:
+        return self.__data.summary.aggregate.max_humidity
 
+    @property
+    def days(self) -> List[dict]:
         """
-        return self.config.locale.combine_conditions(self.get_output_condition_list())
-
-    def __apply_weather(self):
-        for weather_at_time in self.__weather:
-            self.__change_count = self.__change_count + 1
-            if weather_at_time.temperature > self.max_temperature:
-                self.max_temperature = weather_at_time.temperature
-            if weather_at_time.temperature < self.min_temperature:
-                self.min_temperature = weather_at_time.temperature
-            if weather_at_time.pressure > self.max_pressure:
-                self.max_pressure = weather_at_time.pressure
-            if weather_at_time.pressure < self.min_pressure:
-                self.min_pressure = weather_at_time.pressure
-            if weather_at_time.humidity > self.max_humidity:
-                self.max_humidity = weather_at_time.humidity
-            if weather_at_time.humidity < self.min_humidity:
-                self.min_humidity = weather_at_time.humidity
-
-            # TODO: maybe do something about the order
-            for condition in [weather_at_time.main_condition] + weather_at_time.other_conditions:
-                condition_type_list = [x.condition_type for x in self.weather_condition_list]
-                if condition.condition_type not in condition_type_list:
-                    self.weather_condition_list.append(condition)
-                else:
-                    condition_in_list = next(x for x in self.weather_condition_list if x.condition_type == condition.condition_type)
-                    if condition.severity > condition_in_list.severity:
-                        self.weather_condition_list.remove(condition_in_list)
-                        self.weather_condition_list.append(condition)
-                self.__increase_counter(condition.condition_type)
-
-    def __increase_counter(self, condition_type: ConditionType):
-        """counts how many occurrences of a certain weather type there are"""
-        if condition_type not in self.__condition_counts:
-            self.__condition_counts[condition_type] = 0
-        self.__condition_counts[condition_type] = self.__condition_counts[condition_type] + 1
+        the weather of every day of a request over several days as a table, one row per day with date, weekday,
+        minimum and maximum temperature and the conditions as they are said. Empty for a single day.
+        """
+        locale = self.config.locale
+        return [{"date": date.strftime("%Y-%m-%d"), "weekday": locale.weekday_names[date.weekday()],
+                 "min_temperature": data.summary.aggregate.min_temperature, "max_temperature": data.summary.aggregate.max_temperature,
+                 "conditions": data.format_conditions(locale)} for date, data in self.__data.days or []]
+
+    @property
+    def weather_condition_list(self) -> List[WeatherCondition]:
+        return list(self.__data.conditions.values())
 
     def is_weather_chance(self, condition_type: ConditionType) -> bool:
         """
@@ -214,7 +371,7 @@ class WeatherReport:
             True if condition can occur, else False
 
         """
-        return self.__condition_counts.get(condition_type, 0) > 0
+        return self.__data.summary.condition_counts.get(condition_type, 0) > 0
 
     def get_output_condition_list(self, clouds_and_clear_exclusive: bool = False) -> List[str]:
         """
@@ -230,25 +387,7 @@ class WeatherReport:
             A list containing the descriptions of the weather conditions that apply
 
         """
-        if len(self.weather_condition_list) == 1:
-            return [self.weather_condition_list[0].description]
-
-        selected = []
-        for x in self.weather_condition_list:
-            if clouds_and_clear_exclusive:
-                if x.condition_type == ConditionType.CLOUDS:
-                    if self.__condition_counts[ConditionType.CLOUDS] >= self.__condition_counts[ConditionType.CLEAR]:
-                        self.__add_element_to_condition_list(x, selected)
-                if x.condition_type == ConditionType.CLEAR:
-                    if self.__condition_counts[ConditionType.CLEAR] > self.__condition_counts[ConditionType.CLOUDS]:
-                        self.__add_element_to_condition_list(x, selected)
-            else:
-                self.__add_element_to_condition_list(x, selected)
-
-        conditions = []
-        for x in selected:
-            conditions.append(x.description)
-        return conditions
+        return self.__data.get_output_condition_list(clouds_and_clear_exclusive)
 
     def get_output_date_and_time(self) -> str:
         """
@@ -260,6 +399,8 @@ class WeatherReport:
         """
         if self.request.date_specified != "":
             date = self.request.date_specified
+        elif self.request.grain == Grain.WEEK:
+            date = self.config.locale.format_output_date_range(self.request)
         else:
             date = self.config.locale.format_output_date(self.request)
         if self.request.time_specified != "":
@@ -277,25 +418,17 @@ class WeatherReport:
     def get_output_location(self):
         return self.config.locale.format_output_location(self.request.location.name) if self.request.location_specified else ""
 
-    @staticmethod
-    def __add_element_to_condition_list(element, condition_list):
-        """makes sure that only one element of a condition type is in the list (the most severe one)"""
-        if len(condition_list) == 0:
-            condition_list.append(element)
-        else:
-            if element.condition_type in [x.condition_type for x in condition_list]:
-                for x in condition_list[:]:
-                    if x.condition_type == element.condition_type:
-                        if element.severity > x.severity:
-                            condition_list.remove(x)
-                            condition_list.append(element)
-            else:
-                condition_list.append(element)
-
     @property
     def weather(self):
+        if self.__weather is None:
+            if self.request.grain == Grain.WEEK:
+                self.__weather = self.__weather_information.get_weather_between(
+                    datetime.datetime.combine(self.request.request_date, datetime.time.min),
+                    datetime.datetime.combine(self.request.end_date, datetime.time.max))
+            else:
+                self.__weather = self.__weather_information.get_weather_at_interval(self.request.request_date, self.interval)
         return self.__weather
 
     def set_weather(self, key, value):
         if value is not None:
-            self.__weather[key] = value
+            self.weather[key] = value
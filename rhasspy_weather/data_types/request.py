@@ -20,7 +20,9 @@ class WeatherRequest:
     grain : Grain
         How specific should the request be, days, hours
     request_date : datetime.date
-        For when is the request
+        For when is the request, the first day for a request over several days
+    end_date : datetime.date
+        The last day for a request over several days (Grain.WEEK), None for a single day
     location : Location
         Object containing location information
     requested : str
@@ -33,6 +35,10 @@ class WeatherRequest:
         True if the location was specified, False if default location is used (used for output)
     forecast_type : ForecastType
         Type of request, full, temperature, condition or item
+    detail : bool
+        True if a day is reported split into morning, afternoon and evening (level_of_detail in the config)
+    times : list
+        Intervals of the day to report, the FixedTimes for a detailed report
     start_time : datetime.time
     end_time : datetime.time
     weekday : str
@@ -43,6 +49,7 @@ class WeatherRequest:
     string_end_time : str
     readable_end_time : str
     time_difference : int
+    fingerprint : tuple
     """
 
     def __init__(self, date_type, grain, request_date, forecast_type):
@@ -60,6 +67,7 @@ class WeatherRequest:
         self.date_type = date_type
         self.grain = grain
         self.request_date = request_date
+        self.end_date = None
         self.requested = ""
         self.start_time = None
         self.end_time = None
@@ -71,6 +79,7 @@ class WeatherRequest:
         self.__timezone = config.timezone
         self.__locale = config.locale
         self.times = []
+        self.__update_times()
 
         # weather apis don't have weather for the past, so no no need checking
         if self.request_date < datetime.datetime.now(self.__timezone).date():
@@ -82,7 +91,8 @@ class WeatherRequest:
                ", " + str(self.end_time) + ", " + self.location.name + ", " + self.requested + ", " + str(self.detail) + ")"
 
     def __update_times(self):
-        if self.detail and self.forecast_type is not ForecastType.ITEM:
+        # the detailed report splits a day into morning, afternoon and evening, hours aren't split any further
+        if self.detail and self.grain == Grain.DAY and self.forecast_type is not ForecastType.ITEM:
             if not self.times:
                 for fixed_time in [FixedTimes.MORNING, FixedTimes.AFTERNOON, FixedTimes.EVENING]:
                     self.times.append(fixed_time.value)
@@ -90,7 +100,7 @@ class WeatherRequest:
             if self.grain == Grain.HOUR:
                 self.times = []
                 self.times.append((self.start_time, self.end_time))
-            elif self.grain == Grain.DAY:
+            elif self.grain == Grain.DAY or self.grain == Grain.WEEK:
                 self.times = []
                 self.times.append((datetime.time.min, datetime.time.max))
 
@@ -116,7 +126,33 @@ class WeatherRequest:
             return time
         raise WeatherError(ErrorCode.TIME_ERROR)
 
+    def set_date(self, date, str_date):
+        """
+        Sets the date of the request. A tuple of first and last day makes it a request over several days,
+        the days that have already passed are left out.
+
+        Args:
+            date: datetime.date or tuple of first and last day
+            str_date: the date as it was specified (used for output)
+
+        """
+        if isinstance(date, tuple):
+            today = datetime.datetime.now(self.__timezone).date()
+            if date[1] < today:
+                raise WeatherError(ErrorCode.PAST_WEATHER_ERROR)
+            self.grain = Grain.WEEK
+            self.date_type = DateType.INTERVAL
+            self.request_date = max(date[0], today)
+            self.end_date = date[1]
+        else:
+            self.request_date = date
+        self.date_specified = str_date
+        self.__update_times()
+
     def set_time(self, time, str_time):
+        # times of day are not supported for several days
+        if self.grain == Grain.WEEK:
+            raise WeatherError(ErrorCode.NOT_IMPLEMENTED_ERROR)
         self.grain = Grain.HOUR
         if isinstance(time, tuple):
             self.date_type = DateType.INTERVAL
@@ -216,6 +252,15 @@ class WeatherRequest:
             return self.end_time.strftime("%H:%M")
         return ""
 
+    @property
+    def fingerprint(self) -> tuple:
+        """
+        Hashable summary of what was asked for: date (or range of days), time window, location, forecast type and the requested
+        condition, temperature or item. Requests with the same fingerprint only differ in how they were phrased.
+        """
+        return (self.request_date, self.end_date, self.date_type, self.grain, self.start_time, self.end_time, self.location.key,
+                self.forecast_type, self.requested, self.detail)
+
     @property
     def time_difference(self):
         time_difference = (self.request_date - datetime.datetime.now(self.__timezone).date()).days
@@ -1,16 +1,82 @@
 import datetime
-from typing import Tuple
+import itertools
+from bisect import bisect_right
+from typing import List, Optional, Tuple
 
+from rhasspy_weather.data_types.forecast_columns import ForecastColumns, find_index_range, to_timestamp
+from rhasspy_weather.data_types.fixed_times import FixedTimes
+from rhasspy_weather.data_types.range_index import ForecastRangeIndex
 from rhasspy_weather.data_types.weather_at_time import WeatherAtTime
+from rhasspy_weather.data_types.weather_summary import SummaryTable, WeatherSummary
+
+# summaries for these intervals are calculated for every day when the forecast is ingested
+summary_intervals = [(datetime.time.min, datetime.time.max)] + [fixed_time.value for fixed_time in FixedTimes]
+
+__versions = itertools.count(1)
+
+
+def next_forecast_version() -> int:
+    """a number that is unique for every state of every forecast in this process"""
+    return next(__versions)
 
 
 class Weather:
+    """
+    Forecast for a location. The entries of every day are kept sorted by time, together with lists of their start
+    and end times, so entries for a time can be found with a binary search.
+    Summaries for whole days and for the FixedTimes of every day are calculated once and kept compactly, see summarize.
+    Every change of the forecast gives it a new version, so anything derived from it can be keyed by the version.
+    """
     def __init__(self):
+        self.__version = next_forecast_version()
         self.__weather = {}
+        self.__times = {}
+        self.__end_times = {}
+        self.__columns = None
+        self.__range_index = None
+        self.__summaries = None
+
+    def __getstate__(self):
+        # columns, range index and summaries are rebuilt from the entries when they are needed, no need to store them
+        state = self.__dict__.copy()
+        state["_Weather__columns"] = None
+        state["_Weather__range_index"] = None
+        state["_Weather__summaries"] = None
+        return state
+
+    def __setstate__(self, state):
+        # versions are only unique within a process, a forecast loaded from the store gets a new one
+        self.__dict__.update(state)
+        self.__version = next_forecast_version()
+
+    @property
+    def version(self) -> int:
+        return self.__version
 
     def add_weather(self, date: datetime.date, weather_at_time: WeatherAtTime):
-        self.__weather[date] = self.__weather.get(date, [])
-        self.__weather[date].append(weather_at_time)
+        times = self.__times.setdefault(date, [])
+        index = bisect_right(times, weather_at_time.time)
+        times.insert(index, weather_at_time.time)
+        self.__end_times.setdefault(date, []).insert(index, weather_at_time.end_time)
+        self.__weather.setdefault(date, []).insert(index, weather_at_time)
+        self.__version = next_forecast_version()
+        self.__columns = None
+        self.__range_index = None
+        self.__summaries = None
+
+    @property
+    def columns(self) -> ForecastColumns:
+        """columnar version of the whole forecast, built on first use after the forecast changed"""
+        if self.__columns is None:
+            self.__columns = ForecastColumns([x for entries in self.__weather.values() for x in entries])
+        return self.__columns
+
+    @property
+    def range_index(self) -> ForecastRangeIndex:
+        """range query structure for the whole forecast, built on first use after the forecast changed"""
+        if self.__range_index is None:
+            self.__range_index = ForecastRangeIndex(self.columns)
+        return self.__range_index
 
     def get_weather_for_date(self, date: datetime.date):
         return self.__weather.get(date, [])
@@ -19,8 +85,122 @@ class Weather:
         return self.get_weather_at_interval(date, (time, time))
 
     def get_weather_at_interval(self, date: datetime.date, interval: Tuple[datetime.time, datetime.time]):
-        output = []
-        for weather_at_time in self.__weather.get(date, []):
-            if interval[0] <= weather_at_time.time < interval[1] or weather_at_time.time <= interval[1] <= weather_at_time.end_time:
-                output.append(weather_at_time)
-        return output
+        """
+        Entries of a day that start during the interval or are still going on at its end.
+        If the interval ends before it starts it goes on past midnight, into the next day.
+
+        Args:
+            date: the day
+            interval: tuple of start and end time
+
+        Returns:
+            list of WeatherAtTime objects, sorted by time
+
+        """
+        if interval[1] < interval[0]:
+            return self.get_weather_between(datetime.datetime.combine(date, interval[0]),
+                                            datetime.datetime.combine(date + datetime.timedelta(days=1), interval[1]))
+        if date not in self.__weather:
+            return []
+        first, last = find_index_range(self.__times[date], self.__end_times[date], interval[0], interval[1])
+        return self.__weather[date][first:last]
+
+    def get_weather_between(self, start: datetime.datetime, end: datetime.datetime):
+        """
+        Entries that start between start and end or are still going on at end, the range can span several days
+
+        Args:
+            start: local start of the range
+            end: local end of the range
+
+        Returns:
+            list of WeatherAtTime objects, sorted by time
+
+        """
+        columns = self.columns
+        first, last = columns.get_index_range(to_timestamp(start.date(), start.time()), to_timestamp(end.date(), end.time()))
+        return columns.entries[first:last]
+
+    def summarize(self):
+        """
+        Calculates the summaries for every day of the forecast and for the FixedTimes (morning, afternoon, evening)
+        of every day. Is called when a forecast is ingested, if it isn't (or the forecast was loaded from the store)
+        the summaries are calculated on first use. The columns are only needed for this, so they are released
+        afterwards unless the range index uses them.
+        """
+        columns = self.columns
+        summaries = SummaryTable()
+        for date in self.__weather:
+            for interval in summary_intervals:
+                first, last = columns.get_index_range(to_timestamp(date, interval[0]), to_timestamp(date, interval[1]))
+                if first < last:
+                    summaries.add((date, interval), WeatherSummary.from_entries(columns.aggregate(first, last), columns.entries[first:last]))
+        self.__summaries = summaries
+        if self.__range_index is None:
+            self.__columns = None
+
+    def get_summary(self, date: datetime.date, interval: Tuple[datetime.time, datetime.time] = (datetime.time.min, datetime.time.max)) -> Optional[WeatherSummary]:
+        """
+        Summary of the weather for the same entries get_weather_at_interval returns. Summaries of whole days and
+        of FixedTimes are looked up, all other intervals are calculated.
+
+        Args:
+            date: the day
+            interval: (optional) tuple of start and end time, default is the whole day
+
+        Returns:
+            WeatherSummary or None if there is no weather for the interval
+
+        """
+        if self.__summaries is None:
+            self.summarize()
+        summary = self.__summaries.get((date, interval))
+        if summary is None and interval not in summary_intervals:
+            summary = self.__calculate_summary(date, interval)
+        return summary
+
+    def get_daily_summaries(self, start: datetime.date, end: datetime.date) -> List[Tuple[datetime.date, WeatherSummary]]:
+        """
+        Summaries of the whole days from start to end, looked up from the ones calculated when the forecast was
+        ingested. Days without weather (past the end of the forecast) are left out.
+
+        Args:
+            start: first day
+            end: last day (included)
+
+        Returns:
+            list of tuples of date and WeatherSummary, sorted by date
+
+        """
+        summaries = []
+        date = start
+        while date <= end:
+            summary = self.get_summary(date)
+            if summary is not None:
+                summaries.append((date, summary))
+            date = date + datetime.timedelta(days=1)
+        return summaries
+
+    def query(self, start: datetime.datetime, end: datetime.datetime) -> Optional[WeatherSummary]:
+        """
+        Summary of the weather for the same entries get_weather_between returns, calculated in constant time
+        (per condition type) with the range index
+
+        Args:
+            start: local start of the range
+            end: local end of the range
+
+        Returns:
+            WeatherSummary or None if there is no weather for the range
+
+        """
+        first, last = self.columns.get_index_range(to_timestamp(start.date(), start.time()), to_timestamp(end.date(), end.time()))
+        if first >= last:
+            return None
+        range_index = self.range_index
+        return WeatherSummary(range_index.aggregate(first, last), range_index.get_conditions(first, last),
+                              range_index.get_condition_counts(first, last))
+
+    def __calculate_summary(self, date: datetime.date, interval: Tuple[datetime.time, datetime.time]) -> Optional[WeatherSummary]:
+        end_date = date + datetime.timedelta(days=1) if interval[1] < interval[0] else date
+        return self.query(datetime.datetime.combine(date, interval[0]), datetime.datetime.combine(end_date, interval[1]))
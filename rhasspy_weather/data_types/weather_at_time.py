@@ -1,9 +1,13 @@
 import datetime
 
-from rhasspy_weather.data_types.condition import WeatherCondition, ConditionType, WindCondition
+from rhasspy_weather.data_types.condition import ConditionType, WindCondition, get_condition, get_wind_condition
 
 
 class WeatherAtTime:
+    # there are a lot of these in every cached forecast, slots keep them small
+    __slots__ = ("interval", "date", "__time", "end_time", "temperature", "main_condition", "other_conditions", "pressure",
+                 "humidity", "wind_speed", "wind_deg", "location")
+
     def __init__(self, date, time, temperature, main_condition, pressure, humidity, wind_speed, wind_direction, interval,
                  location):
         self.interval = interval
@@ -11,15 +15,17 @@ class WeatherAtTime:
         self.time = time
         self.temperature = temperature
         self.main_condition = main_condition
-        self.other_conditions = [WindCondition(wind_speed, wind_direction)]
+        self.wind_speed = wind_speed
+        self.wind_deg = wind_direction
+        self.other_conditions = [get_wind_condition(wind_speed)]
         self.pressure = pressure
         self.humidity = humidity
         self.location = location
         if self.main_condition.condition_type == ConditionType.CLEAR:
             if self.is_during_day:
-                self.other_conditions.append(WeatherCondition(0, "", ConditionType.SUN))
-            if self.is_during_night:
-                self.other_conditions.append(WeatherCondition(0, "", ConditionType.STARS))
+                self.other_conditions.append(get_condition(0, ConditionType.SUN))
+            elif self.is_during_night:
+                self.other_conditions.append(get_condition(0, ConditionType.STARS))
 
     def __str__(self):
         return "[" + str(self.string_time) + ", " + str(self.temperature) + ", " + str(self.weather_condition) + \
@@ -28,6 +34,10 @@ class WeatherAtTime:
     def __repr__(self):
         return self.weather_condition
 
+    @property
+    def wind_direction(self):
+        return WindCondition.get_compass_direction(self.wind_deg)
+
     @property
     def weather_condition(self):
         return self.main_condition.condition_type
@@ -59,10 +69,20 @@ class WeatherAtTime:
     def string_time(self):
         return self.__time.strftime("%H:%M:%S")
 
+    @property
+    def sunrise_and_sunset(self):
+        return self.location.get_sunrise_and_sunset(self.date)
+
     @property
     def is_during_day(self):
-        return self.location.sunrise <= self.time <= self.location.sunset
+        sunrise, sunset = self.sunrise_and_sunset
+        if sunrise is None or sunset is None:
+            return False
+        return sunrise <= self.time <= sunset
 
     @property
     def is_during_night(self):
-        return self.location.sunset <= self.time <= self.location.sunrise
+        sunrise, sunset = self.sunrise_and_sunset
+        if sunrise is None or sunset is None:
+            return False
+        return self.time < sunrise or self.time > sunset
@@ -0,0 +1,102 @@
+from array import array
+from typing import Dict, Hashable, List, Optional
+
+from rhasspy_weather.data_types.condition import ConditionType, WeatherCondition
+from rhasspy_weather.data_types.forecast_columns import ForecastAggregate
+from rhasspy_weather.data_types.weather_at_time import WeatherAtTime
+
+
+class WeatherSummary:
+    """
+    Summary of the weather for a time range, everything a WeatherReport needs: the aggregated values, the conditions
+    (only the most severe one of every condition type) and how often each condition type occurs.
+    """
+    def __init__(self, aggregate: ForecastAggregate, conditions: List[WeatherCondition], condition_counts: Dict[ConditionType, int]):
+        self.count = aggregate.count
+        self.aggregate = aggregate
+        self.conditions = conditions
+        self.condition_counts = condition_counts
+
+    @classmethod
+    def from_entries(cls, aggregate: ForecastAggregate, entries: List[WeatherAtTime]):
+        """
+        Summarizes entries in one pass. The conditions are in the same order the range index returns them:
+        ordered by the first entry with the most severe condition of a type, the main condition first.
+
+        Args:
+            aggregate: the aggregated values of the entries
+            entries: the WeatherAtTime objects, sorted by time
+
+        Returns:
+            WeatherSummary
+
+        """
+        most_severe = {}
+        condition_counts = {}
+        for index, weather_at_time in enumerate(entries):
+            for position, condition in enumerate([weather_at_time.main_condition] + weather_at_time.other_conditions):
+                condition_type = condition.condition_type
+                known = most_severe.get(condition_type)
+                if known is None or condition.severity > known[2].severity:
+                    most_severe[condition_type] = (index, position, condition)
+                condition_counts[condition_type] = condition_counts.get(condition_type, 0) + 1
+        conditions = [x[2] for x in sorted(most_severe.values(), key=lambda x: x[:2])]
+        return cls(aggregate, conditions, condition_counts)
+
+    def __str__(self):
+        return f"[count: {self.count}, min_temp: {self.aggregate.min_temperature}, max_temp: {self.aggregate.max_temperature}]"
+
+
+class SummaryTable:
+    """
+    Compact storage for the precomputed summaries of a forecast. The aggregated values of all summaries are kept
+    in one array, row after row. For every summary (row) there is a tuple of its conditions in conditions and a flat
+    tuple of condition types and counts in condition_counts. WeatherSummary objects are only created when a summary
+    is looked up.
+    """
+    __slots__ = ("rows", "values", "conditions", "condition_counts")
+
+    # the values of a ForecastAggregate in the order of its constructor
+    fields = ForecastAggregate.__slots__
+
+    def __init__(self):
+        self.rows = {}
+        self.values = array("d")
+        self.conditions = []
+        self.condition_counts = []
+
+    def __len__(self):
+        return len(self.rows)
+
+    def add(self, key: Hashable, summary: WeatherSummary):
+        """
+        Adds a summary
+
+        Args:
+            key: key to look the summary up by
+            summary: the WeatherSummary
+
+        """
+        self.rows[key] = len(self.conditions)
+        self.values.extend([getattr(summary.aggregate, field) for field in self.fields])
+        self.conditions.append(tuple(summary.conditions))
+        self.condition_counts.append(tuple(x for item in summary.condition_counts.items() for x in item))
+
+    def get(self, key: Hashable) -> Optional[WeatherSummary]:
+        """
+        Looks up a summary
+
+        Args:
+            key: key the summary was added with
+
+        Returns:
+            WeatherSummary or None if there is no summary for key
+
+        """
+        row = self.rows.get(key)
+        if row is None:
+            return None
+        values = self.values[row * len(self.fields):(row + 1) * len(self.fields)]
+        aggregate = ForecastAggregate(int(values[0]), *values[1:])
+        counts = self.condition_counts[row]
+        return WeatherSummary(aggregate, list(self.conditions[row]), dict(zip(counts[::2], counts[1::2])))
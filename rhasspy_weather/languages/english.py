@@ -18,6 +18,10 @@ month_names = ["January", "February", "March", "April", "May", "June", "July", "
                "November", "December"]
 named_days = {"today": 0, "tomorrow": 1, "the day after tomorrow": 2}
 named_days_synonyms = {}
+# first and last weekday (0 is Monday) or number of days starting today, keys are used for output
+named_ranges = {"this week": (0, 6), "this weekend": (5, 6), "in the next days": 5}
+named_ranges_synonyms = {"the week": "this week", "the weekend": "this weekend", "weekend": "this weekend",
+                         "the next days": "in the next days"}
 named_times = {
     "morning": (datetime.time(6, 0), datetime.time(12, 0)),
     "midday": datetime.time(12, 0),
@@ -146,6 +150,10 @@ def format_output_time(request):
     return "at " + request.readable_start_time + " o'clock"
 
 
+def format_output_date_range(request):
+    return "from " + request.weekday + " to " + weekday_names[request.end_date.weekday()]
+
+
 # used for detailed report of the day
 fixed_times = {
     FixedTimes.MORNING: "Morning",
@@ -153,6 +161,22 @@ fixed_times = {
     FixedTimes.EVENING: "Evening"
 }
 
+# one sentence for every part of the day in a detailed report, after general_temperature_full or general_weather_full
+detail_answers = {
+    "full": ["{period}: {weather}, {temperature}."],
+    "temperature": ["{period}: {temperature}."],
+    "condition": ["{period}: {weather}."]
+}
+
+# sentences about single days of a report over several days, after the answer for all of them
+range_answers = {
+    "warmest": ["The warmest day is {day} with {temperature}."],
+    "coldest": ["The coldest day is {day} with {temperature}."],
+    ConditionType.RAIN: ["Rain is expected on {days}."],
+    ConditionType.SNOW: ["Snow is expected on {days}."],
+    ConditionType.THUNDERSTORM: ["Thunderstorms are expected on {days}."]
+}
+
 # temperature report
 temperature_answers = {
     "general_temperature_full": ["The temperature {when} {where}: "],
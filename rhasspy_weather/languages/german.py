@@ -17,6 +17,9 @@ month_names = ["Januar", "Februar", "März", "April", "Mai", "Juni", "Juli", "Au
                "November", "Dezember"]
 named_days = {"heute": 0, "morgen": 1, "übermorgen": 2, "weihnachten": (24, 12)}
 named_days_synonyms = {"heilig abend": "weihnachten"}
+# first and last weekday (0 is Monday) or number of days starting today, keys are used for output
+named_ranges = {"diese Woche": (0, 6), "am Wochenende": (5, 6), "in den nächsten Tagen": 5}
+named_ranges_synonyms = {"die woche": "diese Woche", "wochenende": "am Wochenende", "die nächsten tage": "in den nächsten Tagen"}
 named_times = {
     "Morgen": (datetime.time(6, 0), datetime.time(10, 0)),
     "Vormittag": (datetime.time(10, 0), datetime.time(12, 0)),
@@ -149,6 +152,10 @@ def format_output_time(request):
     return "um " + request.readable_start_time + " Uhr"
 
 
+def format_output_date_range(request):
+    return "von " + request.weekday + " bis " + weekday_names[request.end_date.weekday()]
+
+
 # used for detailed report of the day
 fixed_times = {
     FixedTimes.MORNING: "Morgens",
@@ -156,6 +163,22 @@ fixed_times = {
     FixedTimes.EVENING: "Abends"
 }
 
+# one sentence for every part of the day in a detailed report, after general_temperature_full or general_weather_full
+detail_answers = {
+    "full": ["{period} {weather}, {temperature}."],
+    "temperature": ["{period} {temperature}."],
+    "condition": ["{period} {weather}."]
+}
+
+# sentences about single days of a report over several days, after the answer for all of them
+range_answers = {
+    "warmest": ["Am wärmsten wird es am {day} mit {temperature}."],
+    "coldest": ["Am kältesten wird es am {day} mit {temperature}."],
+    ConditionType.RAIN: ["Regen gibt es am {days}."],
+    ConditionType.SNOW: ["Schnee gibt es am {days}."],
+    ConditionType.THUNDERSTORM: ["Gewitter gibt es am {days}."]
+}
+
 # temperature report
 temperature_answers = {
     "general_temperature_full": ["Die Temperaturen {when} {where}: ", "Temperaturen für {when} {where}: "],
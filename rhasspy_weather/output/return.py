@@ -8,6 +8,10 @@ def output_response(output):
     return output
 
 
+async def output_response_async(output):
+    return output_response(output)
+
+
 def parse_config(config):
     pass
 
@@ -1,11 +1,13 @@
 import logging
 import requests
 
-from rhasspy_weather.data_types.error import ConfigError
+from rhasspy_weather.data_types.error import ConfigError, WeatherError, ErrorCode
+from rhasspy_weather.utils import http
 
 log = logging.getLogger(__name__)
 
 rhasspy_url = None
+timeout = http.default_timeout
 
 
 def output_response(output):
@@ -14,11 +16,14 @@ def output_response(output):
         raise ConfigError("No URL found", "No rhasspy server url found.")
     headers = {"Content-Type": "text/plain"}
     url = rhasspy_url + "/api/text-to-speech?play=true"
-    response = requests.post(url, data=output.encode(), headers=headers)
+    try:
+        http.get_session().post(url, data=output.encode(), headers=headers, timeout=timeout)
+    except requests.exceptions.RequestException as e:
+        raise WeatherError(ErrorCode.GENERAL_ERROR, f"Can't reach the rhasspy server: {e}")
 
 
 def parse_config(config):
-    global rhasspy_url
+    global rhasspy_url, timeout
 
     section = config.get_external_section("rhasspy")
 
@@ -26,6 +31,7 @@ def parse_config(config):
         rhasspy_url = section.get("address")
         if rhasspy_url is None or rhasspy_url is "":
             raise ConfigError("RHASSPY_TTS ERROR", "No URL set for the rhasspy server.")
+        timeout = http.parse_timeout(section)
 
 
 def get_template():
@@ -46,7 +46,8 @@ def parse_general_intent(args: json) -> WeatherRequest:
     new_request = WeatherRequest(DateType.FIXED, Grain.DAY, today, ForecastType.FULL)
 
     if hasattr(args, "day") and args.day is not None:
-        new_request.request_date, new_request.date_specified = parse_date(args.day, config.locale)
+        date, str_date = parse_date(args.day, config.locale)
+        new_request.set_date(date, str_date)
 
     if hasattr(args, "time") and args.time is not None:
         time, str_time = parse_time(args.time, config.locale)
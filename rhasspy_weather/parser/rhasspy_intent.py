@@ -58,7 +58,8 @@ def parse_general_intent(intent_message: dict) -> WeatherRequest:
     slots = intent_message["slots"]
 
     if slot_names["day"] in slots and slots[slot_names["day"]] != "":
-        new_request.request_date, new_request.date_specified = parse_date(slots[slot_names["day"]], config.locale)
+        date, str_date = parse_date(slots[slot_names["day"]], config.locale)
+        new_request.set_date(date, str_date)
 
     if slot_names["time"] in slots and slots[slot_names["time"]] != "":
         time, str_time = parse_time(slots[slot_names["time"]], config.locale)
@@ -0,0 +1,96 @@
+import logging
+import threading
+import time
+from typing import List, Optional
+
+from rhasspy_weather import cache
+from rhasspy_weather.data_types.config import get_config
+from rhasspy_weather.data_types.error import WeatherError, ConfigError
+from rhasspy_weather.data_types.location import Location
+
+log = logging.getLogger(__name__)
+
+
+class Prefetcher(threading.Thread):
+    """
+    Background thread that keeps the forecasts for a list of locations in the cache.
+
+    The api publishes a new forecast every update_interval seconds (aligned to UTC midnight), the prefetcher
+    fetches it delay seconds after each update and nowhere in between, the forecast doesn't change until then.
+    Prefetched forecasts stay valid in the cache until the next refresh (plus a margin for the refresh itself),
+    even if the cache ttl is shorter, so requests for those locations never wait for the api.
+    """
+    # how long a prefetched forecast stays valid after the next refresh is due
+    refresh_margin = 60
+
+    def __init__(self, locations: List[Location], update_interval: int = 10800, delay: int = 600):
+        super().__init__(name="rhasspy_weather_prefetcher", daemon=True)
+        self.locations = locations
+        self.update_interval = update_interval
+        self.delay = delay
+        self.__stop_event = threading.Event()
+
+    def run(self):
+        log.info(f"Prefetching weather for {len(self.locations)} location(s)")
+        self.refresh()
+        while not self.__stop_event.wait(self.seconds_until_next_refresh()):
+            self.refresh()
+
+    def stop(self):
+        self.__stop_event.set()
+
+    def refresh(self):
+        """Fetches the weather for all locations, errors are only logged"""
+        now = time.time()
+        expires = now + self.seconds_until_next_refresh(now) + self.refresh_margin
+        for location in self.locations:
+            try:
+                cache.refresh_weather(location, expires)
+            except (WeatherError, ConfigError) as e:
+                log.warning(f"Prefetching weather for '{location.name}' failed: {e.description}")
+
+    def seconds_until_next_refresh(self, now: float = None) -> float:
+        """
+        Calculates how long to wait until the next refresh
+
+        Args:
+            now: (optional) current timestamp, default is now
+
+        Returns:
+            seconds until the next refresh
+
+        """
+        if now is None:
+            now = time.time()
+        next_update = ((now - self.delay) // self.update_interval + 1) * self.update_interval + self.delay
+        return next_update - now
+
+
+__prefetcher = None
+
+
+def start_prefetcher() -> Optional[Prefetcher]:
+    """
+    Starts prefetching the default location from the config as well as the prefetch_locations, if prefetch is enabled.
+    Only meant for long running processes, calling it a second time returns the running prefetcher.
+
+    Returns:
+        the Prefetcher or None if prefetching is disabled
+
+    """
+    global __prefetcher
+    config = get_config()
+    if not config.prefetch:
+        log.info("Prefetching is disabled in the config")
+        return None
+    if __prefetcher is None or not __prefetcher.is_alive():
+        __prefetcher = Prefetcher([config.location] + config.prefetch_locations, config.update_interval, config.prefetch_delay)
+        __prefetcher.start()
+    return __prefetcher
+
+
+def stop_prefetcher():
+    global __prefetcher
+    if __prefetcher is not None:
+        __prefetcher.stop()
+        __prefetcher = None
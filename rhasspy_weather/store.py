@@ -0,0 +1,131 @@
+import logging
+import os
+import pickle
+import sqlite3
+import time
+from contextlib import closing
+from typing import Optional, Tuple
+
+from rhasspy_weather.data_types.weather import Weather
+
+log = logging.getLogger(__name__)
+
+default_store_path = os.path.join(os.path.expanduser("~"), ".config", "rhasspy_weather", "forecast_cache.sqlite")
+
+# increase this whenever the data types that end up in the store change, older entries are ignored then
+store_format_version = 7
+
+
+class ForecastStore:
+    """
+    Persistent forecast store backed by a sqlite database, so forecasts survive the (often very short lived) process.
+    It also remembers the coordinates of city names and zipcodes.
+
+    Every access opens its own connection, which keeps the store usable from several threads and processes at once.
+    Problems with the database are logged and treated like an empty store, they never fail a request.
+    """
+    def __init__(self, path: str = default_store_path):
+        self.path = path
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with closing(self.__connect()) as connection, connection:
+                connection.execute("CREATE TABLE IF NOT EXISTS forecasts "
+                                   "(key TEXT PRIMARY KEY, fetched REAL NOT NULL, version INTEGER NOT NULL, data BLOB NOT NULL)")
+                connection.execute("CREATE TABLE IF NOT EXISTS locations (key TEXT PRIMARY KEY, lat REAL NOT NULL, lon REAL NOT NULL)")
+        except (OSError, sqlite3.Error) as e:
+            log.warning(f"Forecast store at '{path}' can't be used: {e}")
+
+    def __connect(self):
+        return sqlite3.connect(self.path, timeout=1)
+
+    def get(self, key: str, max_age: float) -> Optional[Tuple[float, Weather]]:
+        """
+        Loads a forecast from the store
+
+        Args:
+            key: cache key, see cache.get_cache_key
+            max_age: entries fetched more than max_age seconds ago are ignored
+
+        Returns:
+            a tuple of the time the forecast was fetched and the Weather object, or None if there is no valid entry
+
+        """
+        try:
+            with closing(self.__connect()) as connection, connection:
+                row = connection.execute("SELECT fetched, data FROM forecasts WHERE key = ? AND version = ? AND fetched >= ?",
+                                         (key, store_format_version, time.time() - max_age)).fetchone()
+            if row is None:
+                return None
+            return row[0], pickle.loads(row[1])
+        except (sqlite3.Error, pickle.UnpicklingError, AttributeError, EOFError, ImportError, TypeError) as e:
+            log.warning(f"Can't read '{key}' from forecast store: {e}")
+            return None
+
+    def put(self, key: str, weather: Weather, fetched: float = None):
+        """
+        Saves a forecast to the store, replacing an older forecast with the same key
+
+        Args:
+            key: cache key, see cache.get_cache_key
+            weather: the parsed forecast
+            fetched: (optional) timestamp of when the forecast was fetched, default is now
+
+        """
+        if fetched is None:
+            fetched = time.time()
+        try:
+            data = pickle.dumps(weather, pickle.HIGHEST_PROTOCOL)
+            with closing(self.__connect()) as connection, connection:
+                connection.execute("INSERT OR REPLACE INTO forecasts (key, fetched, version, data) VALUES (?, ?, ?, ?)",
+                                   (key, fetched, store_format_version, data))
+        except (sqlite3.Error, pickle.PicklingError) as e:
+            log.warning(f"Can't write '{key}' to forecast store: {e}")
+
+    def remove_expired(self, max_age: float):
+        """
+        Deletes all entries that were fetched more than max_age seconds ago or were written in an old format
+
+        Args:
+            max_age: maximum age of an entry in seconds
+
+        """
+        try:
+            with closing(self.__connect()) as connection, connection:
+                connection.execute("DELETE FROM forecasts WHERE fetched < ? OR version != ?", (time.time() - max_age, store_format_version))
+        except sqlite3.Error as e:
+            log.warning(f"Can't clean up forecast store: {e}")
+
+    def get_coordinates(self, key: str) -> Optional[Tuple[float, float]]:
+        """
+        Looks up the coordinates of a location
+
+        Args:
+            key: normalized city name or zipcode, see Location.key
+
+        Returns:
+            tuple of latitude and longitude or None if the location is unknown
+
+        """
+        try:
+            with closing(self.__connect()) as connection, connection:
+                row = connection.execute("SELECT lat, lon FROM locations WHERE key = ?", (key,)).fetchone()
+            return row
+        except sqlite3.Error as e:
+            log.warning(f"Can't read coordinates of '{key}' from forecast store: {e}")
+            return None
+
+    def put_coordinates(self, key: str, lat: float, lon: float):
+        """
+        Saves the coordinates of a location
+
+        Args:
+            key: normalized city name or zipcode, see Location.key
+            lat: latitude
+            lon: longitude
+
+        """
+        try:
+            with closing(self.__connect()) as connection, connection:
+                connection.execute("INSERT OR REPLACE INTO locations (key, lat, lon) VALUES (?, ?, ?)", (key, lat, lon))
+        except sqlite3.Error as e:
+            log.warning(f"Can't write coordinates of '{key}' to forecast store: {e}")
@@ -3,6 +3,7 @@ import json
 import logging
 from enum import Enum
 from string import Template
+from typing import FrozenSet, Optional, Set
 
 
 from rhasspy_weather.data_types.config import get_config
@@ -21,12 +22,14 @@ def fill_template(weather_input, result, template_override=None, remove_not_repl
         template = Template(config.output_template)
     else:
         template = Template(template_override)
-    template_values = {}
+    # only the values the template actually uses are worked out
+    placeholders = get_placeholders(template.template)
     if type(result) == WeatherError:
-        template_values = {**template_values, **weather_error_to_template_values(result)}
+        template_values = weather_error_to_template_values(result)
     else:
-        template_values = {**template_values, **weather_report_to_template_values(result), **weather_object_to_template_values(result.request, "request")}
-    template_values = {**template_values, **config.parser.get_template_values(weather_input)}
+        template_values = weather_report_to_template_values(result, placeholders)
+    if any(x.startswith("intent_") for x in placeholders):
+        template_values = {**template_values, **config.parser.get_template_values(weather_input)}
     output = template.safe_substitute(template_values)
     if "\n" in output and remove_not_replaced_lines:
         output_array = output.splitlines()
@@ -46,18 +49,48 @@ def fill_template(weather_input, result, template_override=None, remove_not_repl
     return output
 
 
-__template_values = {}
-__report_speech = None
+__placeholders = {}
 
 
-def weather_report_to_template_values(report: WeatherReport) -> dict:
-    global __report_speech
-    if __report_speech is None or __report_speech != report.speech[report.request.forecast_type]:
-        __report_speech = report.speech[report.request.forecast_type]
-    template_values = {
-        "speech": __report_speech
-    }
-    template_values = {**template_values, ** weather_object_to_template_values(report, "report")}
+def get_placeholders(template: str) -> FrozenSet[str]:
+    """
+    Finds the names of all placeholders in a template, the result is kept for every template string
+
+    Args:
+        template: the template string
+
+    Returns:
+        set of placeholder names without the $
+
+    """
+    if template not in __placeholders:
+        names = set()
+        for match in Template.pattern.finditer(template):
+            name = match.group("named") or match.group("braced")
+            if name is not None:
+                names.add(name)
+        __placeholders[template] = frozenset(names)
+    return __placeholders[template]
+
+
+def weather_report_to_template_values(report: WeatherReport, placeholders: Optional[Set[str]] = None) -> dict:
+    """
+    Template values of a report and its request
+
+    Args:
+        report: the WeatherReport
+        placeholders: (optional) placeholders used by the template, only those values are worked out. Without it
+        all values are returned
+
+    Returns:
+        dict of placeholder names and values
+
+    """
+    template_values = {}
+    if placeholders is None or "speech" in placeholders:
+        template_values["speech"] = report.speech[report.request.forecast_type]
+    template_values = {**template_values, **weather_object_to_template_values(report, "report", placeholders),
+                       **weather_object_to_template_values(report.request, "request", placeholders)}
     return template_values
 
 
@@ -68,27 +101,70 @@ def weather_error_to_template_values(error: WeatherError) -> dict:
     return template_values
 
 
-def weather_object_to_template_values(weather_object, name) -> dict:
-    global __template_values
-    if name not in __template_values:
-        __template_values[name] = {}
+def weather_object_to_template_values(weather_object, name, placeholders: Optional[Set[str]] = None) -> dict:
+    """
+    Template values of the attributes of an object, the keys are name_attribute. Locations are split up into
+    name_attribute_location-attribute.
+
+    Args:
+        weather_object: the object
+        name: prefix of the keys
+        placeholders: (optional) placeholders used by the template, only those values are worked out. Without it
+        the values of all attributes are returned
+
+    Returns:
+        dict of placeholder names and values
+
+    """
+    prefix = name + "_"
+    template_values = {}
+    if placeholders is None:
         for key, value in weather_object.__dict__.items():
-            new_key = name + "_" + key.replace("_" + type(weather_object).__name__ + "__", "")
-            if isinstance(value, str) and not value == "":
-                __template_values[name][new_key] = value
-            elif isinstance(value, bool):
-                __template_values[name][new_key] = value
-            elif isinstance(value, int):
-                __template_values[name][new_key] = value
-            elif isinstance(value, float):
-                __template_values[name][new_key] = value
-            elif isinstance(value, Enum):
-                __template_values[name][new_key] = str(value)
-            elif isinstance(value, datetime.time) or isinstance(value, datetime.date):
-                __template_values[name][new_key] = str(value)
-            elif isinstance(value, Location):
-                for l_key, l_value in value.__dict__.items():
-                    new_l_key = new_key + "_" + l_key
-                    __template_values[name][new_l_key] = l_value
-    return __template_values[name]
+            __add_template_value(template_values, prefix + key.replace("_" + type(weather_object).__name__ + "__", ""), value)
+        for key in dir(type(weather_object)):
+            if not key.startswith("_") and isinstance(getattr(type(weather_object), key), property):
+                __add_template_value(template_values, prefix + key, getattr(weather_object, key))
+        return template_values
+
+    for placeholder in placeholders:
+        if not placeholder.startswith(prefix):
+            continue
+        key = placeholder[len(prefix):]
+        if __has_attribute(weather_object, key):
+            __add_template_value(template_values, placeholder, __get_attribute(weather_object, key))
+            continue
+        # placeholders of a location look like name_attribute_location-attribute
+        position = key.find("_")
+        while position != -1:
+            attribute = key[:position]
+            if __has_attribute(weather_object, attribute):
+                value = __get_attribute(weather_object, attribute)
+                if isinstance(value, Location) and key[position + 1:] in value.__dict__:
+                    template_values[placeholder] = value.__dict__[key[position + 1:]]
+                    break
+            position = key.find("_", position + 1)
+    return template_values
+
+
+def __has_attribute(weather_object, key: str) -> bool:
+    return hasattr(weather_object, key) or hasattr(weather_object, "_" + type(weather_object).__name__ + "__" + key)
+
+
+def __get_attribute(weather_object, key: str):
+    if hasattr(weather_object, key):
+        return getattr(weather_object, key)
+    return getattr(weather_object, "_" + type(weather_object).__name__ + "__" + key)
+
 
+def __add_template_value(template_values: dict, key: str, value):
+    if isinstance(value, str) and not value == "":
+        template_values[key] = value
+    elif isinstance(value, (bool, int, float)):
+        template_values[key] = value
+    elif isinstance(value, Enum):
+        template_values[key] = str(value)
+    elif isinstance(value, datetime.time) or isinstance(value, datetime.date):
+        template_values[key] = str(value)
+    elif isinstance(value, Location):
+        for l_key, l_value in value.__dict__.items():
+            template_values[key + "_" + l_key] = l_value
@@ -89,6 +89,66 @@ def named_day_to_str(named_day: str) -> str:
     return named_day
 
 
+def named_range_to_dates(named_range: str) -> Tuple[datetime.date, datetime.date]:
+    """
+    Parses a string containing a named range of days to the first and last day. Ranges are specified in the locale
+    either as a tuple of the first and last weekday (0 is Monday) of this week, or of next week if the last one
+    has already passed, or as a number of days starting today.
+
+    Args:
+        named_range: string containing a valid named range (locale.named_ranges and locale.named_ranges_synonyms)
+
+    Returns: tuple of the first and the last day
+    """
+    config = get_config()
+    locale = config.locale
+    named_ranges_lowercase = [x.lower() for x in locale.named_ranges]
+    named_ranges_synonyms_lowercase = [x.lower() for x in locale.named_ranges_synonyms]
+    value = None
+    if named_range.lower() in named_ranges_synonyms_lowercase:
+        index = named_ranges_synonyms_lowercase.index(named_range.lower())
+        name = list(locale.named_ranges_synonyms.keys())[index]
+        value = locale.named_ranges[locale.named_ranges_synonyms[name]]
+    elif named_range.lower() in named_ranges_lowercase:
+        index = named_ranges_lowercase.index(named_range.lower())
+        value = list(locale.named_ranges.values())[index]
+    today = datetime.datetime.now(config.timezone).date()
+    if isinstance(value, Tuple):
+        first = today + datetime.timedelta(value[0] - today.weekday())
+        last = today + datetime.timedelta(value[1] - today.weekday())
+        if last < today:
+            first, last = first + datetime.timedelta(7), last + datetime.timedelta(7)
+        return first, last
+    elif isinstance(value, int):
+        return today, today + datetime.timedelta(value - 1)
+    else:
+        log.error("Invalid range specified in locale.named_ranges or locale.named_ranges_synonyms")
+        raise WeatherError(ErrorCode.DATE_ERROR)
+
+
+def named_range_to_str(named_range: str) -> str:
+    """
+    Takes a named range of days and formats it for output.
+    If named range is not in locale, returns the input
+
+    Args:
+        named_range: string containing a valid named range (locale.named_ranges and locale.named_ranges_synonyms)
+
+    Returns: named_range formatted for output
+    """
+    locale = get_config().locale
+    named_ranges_lowercase = [x.lower() for x in locale.named_ranges]
+    named_ranges_synonyms_lowercase = [x.lower() for x in locale.named_ranges_synonyms]
+    if named_range.lower() in named_ranges_synonyms_lowercase:
+        index = named_ranges_synonyms_lowercase.index(named_range.lower())
+        return locale.named_ranges_synonyms[list(locale.named_ranges_synonyms.keys())[index]]
+    elif named_range.lower() in named_ranges_lowercase:
+        index = named_ranges_lowercase.index(named_range.lower())
+        return list(locale.named_ranges.keys())[index]
+
+    return named_range
+
+
 def weekday_to_date(weekday: str, next_week: bool = False) -> datetime.date:
     """
     Takes a string containing a valid weekday (in weekday_names of locale) and returns the date based on today.
@@ -0,0 +1,53 @@
+import configparser
+import logging
+import threading
+from typing import Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+log = logging.getLogger(__name__)
+
+default_timeout = (3.05, 10)
+
+__session = None
+__session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Returns the shared http session. Connections in it are kept alive and reused, so apis and outputs
+    talking to the same server only pay for the connection setup once.
+
+    Returns: requests.Session
+    """
+    global __session
+    with __session_lock:
+        if __session is None:
+            log.debug("Creating http session")
+            __session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            __session.mount("http://", adapter)
+            __session.mount("https://", adapter)
+    return __session
+
+
+def parse_timeout(section: configparser.SectionProxy, default: Tuple[float, float] = default_timeout) -> Tuple[float, float]:
+    """
+    Reads the options connect_timeout and read_timeout from a config section.
+
+    Args:
+        section: the config section of the api or output
+        default: (optional) the timeouts to use if an option is missing or invalid
+
+    Returns: tuple of connect and read timeout in seconds, like requests expects it
+    """
+    connect_timeout, read_timeout = default
+    if section is not None:
+        try:
+            connect_timeout = section.getfloat("connect_timeout", fallback=connect_timeout)
+            read_timeout = section.getfloat("read_timeout", fallback=read_timeout)
+        except ValueError:
+            log.warning(f"Invalid timeout in section '{section.name}', using {default}.")
+            return default
+    return connect_timeout, read_timeout
@@ -16,6 +16,13 @@ InputTime = TypeVar("InputTime", str, int)
 def parse_date(date: str, locale):
     log.debug(f"parse date - {date}")
 
+    named_ranges_lowercase = [x.lower() for x in locale.named_ranges.keys()]
+    named_ranges_synonyms_lowercase = [x.lower() for x in locale.named_ranges_synonyms.keys()]
+    # is it a named range of days (this week, etc.)?
+    if date.lower() in named_ranges_lowercase + named_ranges_synonyms_lowercase:
+        log.debug("date is a range of days specified by name")
+        return dt_utils.named_range_to_dates(date), dt_utils.named_range_to_str(date)
+
     named_days_lowercase = [x.lower() for x in locale.named_days.keys()]
     named_days_synonyms_lowercase = [x.lower() for x in locale.named_days_synonyms.keys()]
     # is it a named day (tomorrow, etc.)?
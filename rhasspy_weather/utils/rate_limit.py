@@ -0,0 +1,168 @@
+import configparser
+import email.utils
+import logging
+import random
+import threading
+import time
+from typing import Optional
+
+log = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    Client side rate limiting for an api with a call quota.
+
+    Calls are limited by a token bucket that holds up to burst tokens and refills with calls_per_minute tokens per
+    minute. When the api says it is overloaded (http 429) or fails, calls are blocked for the time the api asks for
+    (Retry-After) or an exponentially growing time with jitter, whichever is longer. A successful call resets the
+    backoff.
+
+    All counters can be read with the stats property.
+    """
+    def __init__(self, calls_per_minute: float = 50, burst: int = 10, base_backoff: float = 1.0, max_backoff: float = 600.0):
+        self.calls_per_minute = calls_per_minute
+        self.burst = burst
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.__tokens = float(burst)
+        self.__last_refill = time.monotonic()
+        self.__blocked_until = 0.0
+        self.__failures = 0
+        self.__lock = threading.Lock()
+        self.__window_start = time.monotonic()
+        self.calls_allowed = 0
+        self.calls_this_minute = 0
+        self.calls_rejected = 0
+        self.throttled_responses = 0
+
+    def __refill(self, now: float):
+        self.__tokens = min(self.burst, self.__tokens + (now - self.__last_refill) * self.calls_per_minute / 60)
+        self.__last_refill = now
+        if now - self.__window_start >= 60:
+            self.__window_start = now
+            self.calls_this_minute = 0
+
+    def acquire(self) -> bool:
+        """
+        Takes a token for a call to the api. Never waits, so a throttled request can be answered from the cache right away.
+
+        Returns:
+            True if the call may be made, False if the bucket is empty or calls are blocked because of a backoff
+
+        """
+        with self.__lock:
+            now = time.monotonic()
+            self.__refill(now)
+            if now < self.__blocked_until or self.__tokens < 1:
+                self.calls_rejected += 1
+                return False
+            self.__tokens -= 1
+            self.calls_allowed += 1
+            self.calls_this_minute += 1
+            return True
+
+    def throttled(self, retry_after: Optional[float] = None):
+        """
+        Records that the api refused a call because of its rate limit and blocks further calls for a while
+
+        Args:
+            retry_after: (optional) seconds the api asked to wait
+
+        """
+        with self.__lock:
+            self.throttled_responses += 1
+            delay = self.__backoff()
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            self.__tokens = 0
+            self.__blocked_until = max(self.__blocked_until, time.monotonic() + delay)
+        log.warning(f"Rate limit of the weather api reached, pausing calls for {delay:.0f}s")
+
+    def failed(self):
+        """Records a failed call (no network, server error), calls are blocked for an exponentially growing time"""
+        with self.__lock:
+            delay = self.__backoff()
+            self.__blocked_until = max(self.__blocked_until, time.monotonic() + delay)
+        log.info(f"Weather api call failed, pausing calls for {delay:.1f}s")
+
+    def succeeded(self):
+        """Records a successful call, which ends the backoff"""
+        with self.__lock:
+            self.__failures = 0
+
+    def __backoff(self) -> float:
+        """next backoff delay, full jitter on an exponentially growing upper bound"""
+        upper_bound = min(self.max_backoff, self.base_backoff * 2 ** self.__failures)
+        self.__failures += 1
+        return random.uniform(upper_bound / 2, upper_bound)
+
+    @property
+    def is_blocked(self) -> bool:
+        return time.monotonic() < self.__blocked_until
+
+    @property
+    def stats(self) -> dict:
+        """
+        Counters to see how close the client is to the quota
+
+        Returns:
+            dict with the number of allowed, rejected and throttled calls, the calls in the current minute,
+            the quota per minute, the tokens left and the seconds calls are still blocked
+
+        """
+        with self.__lock:
+            now = time.monotonic()
+            self.__refill(now)
+            return {
+                "calls_allowed": self.calls_allowed,
+                "calls_rejected": self.calls_rejected,
+                "throttled_responses": self.throttled_responses,
+                "calls_this_minute": self.calls_this_minute,
+                "calls_per_minute": self.calls_per_minute,
+                "tokens": int(self.__tokens),
+                "blocked_for": max(0.0, self.__blocked_until - now)
+            }
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses a Retry-After header, which is either a number of seconds or a http date
+
+    Args:
+        value: the header value or None
+
+    Returns:
+        seconds to wait or None if the header is missing or invalid
+
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        log.debug(f"Invalid Retry-After header: {value}")
+        return None
+
+
+def parse_rate_limit(section: configparser.SectionProxy) -> RateLimiter:
+    """
+    Creates a rate limiter from the options calls_per_minute, burst and max_backoff of a config section
+
+    Args:
+        section: the config section of the api
+
+    Returns:
+        RateLimiter
+
+    """
+    try:
+        return RateLimiter(section.getfloat("calls_per_minute", fallback=50), section.getint("burst", fallback=10),
+                           max_backoff=section.getfloat("max_backoff", fallback=600))
+    except ValueError:
+        log.warning(f"Invalid rate limit in section '{section.name}', using default rate limit.")
+        return RateLimiter()
@@ -0,0 +1,79 @@
+import datetime
+import logging
+import threading
+from typing import Iterable, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+SunTimes = Tuple[Optional[datetime.time], Optional[datetime.time]]
+
+# coordinates are rounded to this many decimals, two decimals are roughly one kilometer, the times barely change in that distance
+precision = 2
+max_entries = 4096
+
+__sun_times = {}
+__lock = threading.Lock()
+
+
+def get_sun_times(lat: float, lon: float, dates: Iterable[datetime.date]) -> dict:
+    """
+    Calculates sunrise and sunset for several days at a location. Results are memoized per
+    (rounded latitude, rounded longitude, date), only missing days are calculated.
+
+    Args:
+        lat: latitude
+        lon: longitude
+        dates: the days to calculate sunrise and sunset for
+
+    Returns:
+        dict mapping each date to a tuple of local sunrise and sunset time (both None if the sun doesn't rise or set that day)
+
+    """
+    lat = round(float(lat), precision)
+    lon = round(float(lon), precision)
+    result = {}
+    missing = []
+    with __lock:
+        for date in dates:
+            sun_times = __sun_times.get((lat, lon, date))
+            if sun_times is None:
+                missing.append(date)
+            else:
+                result[date] = sun_times
+
+    if missing:
+        import suntime
+
+        sun = suntime.Sun(lat, lon)
+        calculated = {}
+        for date in missing:
+            try:
+                calculated[date] = (sun.get_local_sunrise_time(date).time(), sun.get_local_sunset_time(date).time())
+            except suntime.SunTimeException as e:
+                log.debug(f"No sunrise or sunset at {lat}, {lon} on {date}: {e}")
+                calculated[date] = (None, None)
+        with __lock:
+            if len(__sun_times) + len(calculated) > max_entries:
+                __sun_times.clear()
+            for date, sun_times in calculated.items():
+                __sun_times[(lat, lon, date)] = sun_times
+        result.update(calculated)
+    return result
+
+
+def get_sunrise_and_sunset(lat: float, lon: float, date: datetime.date = None) -> SunTimes:
+    """
+    Calculates sunrise and sunset for one day, see get_sun_times
+
+    Args:
+        lat: latitude
+        lon: longitude
+        date: (optional) the day, default is today
+
+    Returns:
+        tuple of local sunrise and sunset time
+
+    """
+    if date is None:
+        date = datetime.date.today()
+    return get_sun_times(lat, lon, [date])[date]
@@ -1,5 +1,6 @@
 import logging
 import math
+import re
 
 log = logging.getLogger(__name__)
 
@@ -10,17 +11,31 @@ def normal_round(n):
     return math.ceil(n)
 
 
+# everything that is cleaned up is removed in a single pass over the string: spaces in front of another space,
+# a dot or a colon, and dots in front of another dot (the spaces between them are dropped as well)
+__excessive_whitespaces = re.compile(r" (?=[ .:])")
+__excessive_whitespaces_and_dots = re.compile(r" (?=[ .:])|\.(?= *\.)")
+
+
 def remove_excessive_whitespaces(input_string):
-    while "  " in input_string:
-        input_string = input_string.replace("  ", " ")
-    input_string = input_string.replace(" .", ".")
-    input_string = input_string.replace(" :", ":")
-    return input_string
+    return __excessive_whitespaces.sub("", input_string)
 
 
 def format_string(input_string):
-    input_string = remove_excessive_whitespaces(input_string)
-    while ".." in input_string:
-        input_string = input_string.replace("..", ".")
+    # most strings are clean already
+    if "  " in input_string or " ." in input_string or " :" in input_string or ".." in input_string:
+        input_string = __excessive_whitespaces_and_dots.sub("", input_string)
     input_string = input_string[0].capitalize() + input_string[1:]
     return input_string
+
+
+class __Placeholders(dict):
+    # placeholders without a value are left empty, format_string cleans up the spaces around them
+    __slots__ = ()
+
+    def __missing__(self, key):
+        return ""
+
+
+def fill_placeholders(input_string, **values):
+    return input_string.format_map(__Placeholders(values))
@@ -1,10 +1,13 @@
 # -*- encoding: utf-8 -*-
+import asyncio
 import logging
-from typing import Union
+from typing import Dict, Union, Optional, List, Tuple
 
+from rhasspy_weather import cache, prefetch
 from rhasspy_weather.data_types.report import WeatherReport
 import rhasspy_weather.data_types.config as cf
 from rhasspy_weather.data_types.error import WeatherError, ConfigError
+from rhasspy_weather.data_types.location import Location
 from rhasspy_weather.data_types.request import WeatherRequest
 from rhasspy_weather.data_types.weather import Weather
 from rhasspy_weather.templates import fill_template
@@ -13,9 +16,6 @@ log = logging.getLogger(__name__)
 
 
 # TODO: find a better name for this file
-# TODO: write something that replaced detail since that doesn't work with the current system
-# maybe similar to get_weather_forecast but with a separate request for morning, afternoon and night
-# that or just remove that logic completely
 
 
 def get_weather_forecast(weather_input, config_path: str = None):
@@ -84,13 +84,32 @@ def get_weather(request: WeatherRequest, config_path: str = None) -> Weather:
     if config_path is not None and cf.config_path is not config_path:
         cf.set_config_path(config_path)
 
-    config = cf.get_config()
     log.info("Requesting weather")
-    forecast = config.api.get_weather(request.location)
+    forecast = cache.get_weather(request.location)
 
     return forecast
 
 
+def get_weather_many(locations: List[Location], config_path: str = None) -> List[Union[Weather, WeatherError]]:
+    """
+    Function getting the weather for several locations at once, for example for a dashboard. Locations are fetched
+    in parallel, so this is about as fast as a single request.
+
+    Args:
+        locations: list of Location objects
+        config_path: optional path to a config file
+
+    Returns:
+        list with a Weather object or the WeatherError for each location, in the same order as locations
+
+    """
+    if config_path is not None and cf.config_path is not config_path:
+        cf.set_config_path(config_path)
+
+    log.info(f"Requesting weather for {len(locations)} locations")
+    return cache.get_weather_many(locations)
+
+
 def get_report(request: WeatherRequest, weather_information: Weather, config_path: str = None) -> WeatherReport:
     """
     Function that takes a WeatherRequest and a Weather object and turns those into a finished WeatherReport
@@ -115,6 +134,56 @@ def get_report(request: WeatherRequest, weather_information: Weather, config_pat
     return report
 
 
+def get_reports(requests: List[WeatherRequest], config_path: str = None) -> List[Union[WeatherReport, WeatherError]]:
+    """
+    Function that answers many requests at once, for example a morning briefing or every day of the week.
+    Requests are grouped by location, every forecast is only fetched once (in parallel for several locations)
+    and all reports for a location are built from the same forecast.
+
+    Args:
+        requests: list of WeatherRequest objects
+        config_path: optional path to a config file
+
+    Returns:
+        list with a WeatherReport or the WeatherError for each request, in the same order as requests
+
+    """
+    if config_path is not None and cf.config_path is not config_path:
+        cf.set_config_path(config_path)
+
+    keys, locations = __group_by_location(requests)
+    log.info(f"Requesting weather for {len(requests)} requests at {len(locations)} locations")
+    forecasts = dict(zip(locations, cache.get_weather_many(list(locations.values()))))
+    return __build_reports(requests, keys, forecasts)
+
+
+def __group_by_location(requests: List[WeatherRequest]) -> Tuple[List[str], Dict[str, Location]]:
+    """
+    the location key of every request and one location per key, the first one of every key is used for fetching
+    the forecast. The keys are taken before fetching, fetching adds the coordinates to the location.
+    """
+    keys = [request.location.key for request in requests]
+    locations = {}
+    for key, request in zip(keys, requests):
+        locations.setdefault(key, request.location)
+    return keys, locations
+
+
+def __build_reports(requests: List[WeatherRequest], keys: List[str], forecasts: Dict[str, Union[Weather, WeatherError]]) -> List[Union[WeatherReport, WeatherError]]:
+    log.info("Formulating answers")
+    reports = []
+    for key, request in zip(keys, requests):
+        forecast = forecasts[key]
+        if isinstance(forecast, WeatherError):
+            reports.append(forecast)
+            continue
+        try:
+            reports.append(WeatherReport(request, forecast))
+        except WeatherError as e:
+            reports.append(e)
+    return reports
+
+
 def answer(weather_input, output, config_path: str = None) -> Union[WeatherReport, WeatherError]:
     """
     Function that combines information into the form specified in config and outputs them to where is should go
@@ -142,3 +211,138 @@ def answer(weather_input, output, config_path: str = None) -> Union[WeatherRepor
             log.error(f"Can't output response on {output_item.__name__}: {e.description}")
 
     return return_value
+
+
+def start_prefetcher(config_path: str = None) -> Optional[prefetch.Prefetcher]:
+    """
+    Starts refreshing the forecasts for the configured locations in the background, see prefetch.start_prefetcher.
+    Only useful in long running processes.
+
+    Args:
+        config_path: optional path to a config file
+
+    Returns:
+        the running Prefetcher or None if prefetching is disabled in the config
+
+    """
+    if config_path is not None and cf.config_path is not config_path:
+        cf.set_config_path(config_path)
+
+    return prefetch.start_prefetcher()
+
+
+async def get_weather_forecast_async(weather_input, config_path: str = None):
+    """
+    Coroutine version of get_weather_forecast. Network access and blocking outputs don't block the event loop,
+    so one loop can answer many requests at the same time.
+
+    Args:
+        weather_input: anything that a parser exists for
+        config_path: optional path to a config file
+
+    Returns:
+        output, unless one of the selected outputs has a specified return value. If there is one, it will return that instead
+
+    """
+    try:
+        request = await get_request_async(weather_input, config_path)
+        forecast = await get_weather_async(request, config_path)
+        output = await get_report_async(request, forecast)
+    except WeatherError as error:
+        output = error
+
+    answer_value = await answer_async(weather_input, output, config_path)
+
+    return answer_value
+
+
+async def get_request_async(weather_input, config_path: str = None) -> WeatherRequest:
+    """
+    Coroutine version of get_request, see there.
+    """
+    return get_request(weather_input, config_path)
+
+
+async def get_weather_async(request: WeatherRequest, config_path: str = None) -> Weather:
+    """
+    Coroutine version of get_weather, see there.
+    """
+    if config_path is not None and cf.config_path is not config_path:
+        cf.set_config_path(config_path)
+
+    log.info("Requesting weather")
+    forecast = await cache.get_weather_async(request.location)
+
+    return forecast
+
+
+async def get_weather_many_async(locations: List[Location], config_path: str = None) -> List[Union[Weather, WeatherError]]:
+    """
+    Coroutine version of get_weather_many, see there.
+    """
+    if config_path is not None and cf.config_path is not config_path:
+        cf.set_config_path(config_path)
+
+    log.info(f"Requesting weather for {len(locations)} locations")
+
+    async def get_weather_or_error(location: Location) -> Union[Weather, WeatherError]:
+        try:
+            return await cache.get_weather_async(location)
+        except WeatherError as e:
+            return e
+
+    return list(await asyncio.gather(*[get_weather_or_error(location) for location in locations]))
+
+
+async def get_report_async(request: WeatherRequest, weather_information: Weather, config_path: str = None) -> WeatherReport:
+    """
+    Coroutine version of get_report, see there.
+    """
+    return get_report(request, weather_information, config_path)
+
+
+async def get_reports_async(requests: List[WeatherRequest], config_path: str = None) -> List[Union[WeatherReport, WeatherError]]:
+    """
+    Coroutine version of get_reports, see there.
+    """
+    if config_path is not None and cf.config_path is not config_path:
+        cf.set_config_path(config_path)
+
+    keys, locations = __group_by_location(requests)
+    log.info(f"Requesting weather for {len(requests)} requests at {len(locations)} locations")
+    forecasts = dict(zip(locations, await get_weather_many_async(list(locations.values()))))
+    return __build_reports(requests, keys, forecasts)
+
+
+async def answer_async(weather_input, output, config_path: str = None) -> Union[WeatherReport, WeatherError]:
+    """
+    Coroutine version of answer. Outputs that have an output_response_async coroutine are awaited,
+    the others are run in the default executor.
+
+    Args:
+        weather_input: anything that a parser exists for
+        output: either a WeatherReport or a WeatherError that contains information
+        config_path: optional path to a config file
+
+    Returns:
+        output, unless one of the selected outputs has a specified return value. If there is one, it will return that instead
+
+    """
+    if config_path is not None and cf.config_path is not config_path:
+        cf.set_config_path(config_path)
+
+    config = cf.get_config()
+    log.info("Answering")
+    loop = asyncio.get_running_loop()
+    return_value = output
+    for output_item in config.output:
+        try:
+            filled_template = fill_template(weather_input, output, output_item.get_template())
+            if hasattr(output_item, "output_response_async"):
+                return_value = await output_item.output_response_async(filled_template)
+            else:
+                return_value = await loop.run_in_executor(None, output_item.output_response, filled_template)
+        except (WeatherError, ConfigError) as e:
+            log.error(f"Can't output response on {output_item.__name__}: {e.description}")
+
+    return return_value
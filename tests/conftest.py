@@ -67,6 +67,38 @@ class MockConfig:
     def location(self):
         return Location("Berlin")
 
+    @property
+    def cache_enabled(self):
+        return True
+
+    @property
+    def cache_ttl(self):
+        return 600
+
+    @property
+    def cache_max_entries(self):
+        return 32
+
+    @property
+    def cache_persistent(self):
+        return False
+
+    @property
+    def cache_path(self):
+        return None
+
+    @property
+    def stale_while_revalidate(self):
+        return True
+
+    @property
+    def max_stale(self):
+        return 3600
+
+    @property
+    def latency_budget(self):
+        return 0.1
+
     @property
     def api_key(self):
         return "test_config"
@@ -100,7 +132,7 @@ def mock_request_401(monkeypatch):
         return MockResponse("response_401")
 
     import requests
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(requests.Session, "get", mock_get)
 
 
 @pytest.fixture
@@ -109,7 +141,7 @@ def mock_request_404(monkeypatch):
         return MockResponse("response_404")
 
     import requests
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(requests.Session, "get", mock_get)
 
 
 @pytest.fixture
@@ -123,8 +155,8 @@ def mock_request_200(monkeypatch):
             {"temp": 15, "f_temp": 18, "min_temp": 14, "max_temp": 17, "pressure": 1020, "humidity": 33, "weather_id": 800},
             {"temp": 18, "f_temp": 16, "min_temp": 17, "max_temp": 18, "pressure": 1019, "humidity": 35, "weather_id": 803}
         ]
-        return MockResponse("response_404", data_input)
+        return MockResponse("response_200", data_input)
 
     import requests
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(requests.Session, "get", mock_get)
 
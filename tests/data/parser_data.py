@@ -28,7 +28,16 @@ rhasspy_intent = {
                                          '"raw_tokens": ["wie", "wird", "das", "wetter", "heute", "mittag"], "recognize_seconds": 0.11356039298698306, '
                                          '"slots": {"when_day": "heute", "when_time": "Mittag"}, "speech_confidence": 1, '
                                          '"text": "wie wird das wetter heute Mittag", "tokens": ["wie", "wird", "das", "wetter", "heute", "Mittag"], '
-                                         '"wakeword_id": null}'
+                                         '"wakeword_id": null}',
+        "request_weather_full_range": '{"entities": [{"end": 41, "entity": "when_day", "raw_end": 41, "raw_start": 20, '
+                                      '"raw_value": "in den nächsten tagen", "start": 20, "value": "in den nächsten Tagen", '
+                                      '"value_details": {"kind": "Unknown", "value": "in den nächsten Tagen"}}], '
+                                      '"intent": {"confidence": 1, "name": "GetWeatherForecast"}, '
+                                      '"raw_text": "wie wird das wetter in den nächsten tagen", '
+                                      '"raw_tokens": ["wie", "wird", "das", "wetter", "in", "den", "nächsten", "tagen"], '
+                                      '"recognize_seconds": 0.12083745002746582, "slots": {"when_day": "in den nächsten Tagen"}, '
+                                      '"speech_confidence": 1, "text": "wie wird das wetter in den nächsten Tagen", '
+                                      '"tokens": ["wie", "wird", "das", "wetter", "in", "den", "nächsten", "Tagen"], "wakeword_id": null}'
     }
 
 day_slot = Slot(entity="test", slot_name="when_day", value={"value": "heute"}, raw_value="heute")
@@ -0,0 +1,339 @@
+import asyncio
+import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from rhasspy_weather import cache
+from rhasspy_weather.cache import ForecastCache, ReportCache, get_cache_key
+from rhasspy_weather.data_types.error import WeatherError, ErrorCode
+from rhasspy_weather.data_types.location import Location
+from rhasspy_weather.data_types.weather import Weather
+from rhasspy_weather.store import ForecastStore
+from tests.conftest import MockConfig
+
+
+def test_forecast_cache_ttl(monkeypatch):
+    now = time.time()
+    monkeypatch.setattr(cache.time, "time", lambda: now)
+    forecast_cache = ForecastCache(ttl=60, max_entries=4)
+    weather = Weather()
+    forecast_cache.put("berlin", weather)
+    assert forecast_cache.get("berlin") is weather
+
+    monkeypatch.setattr(cache.time, "time", lambda: now + 61)
+    assert forecast_cache.get("berlin") is None
+    assert len(forecast_cache) == 0
+
+
+def test_forecast_cache_eviction():
+    forecast_cache = ForecastCache(ttl=60, max_entries=2)
+    for key in ["a", "b"]:
+        forecast_cache.put(key, Weather())
+    forecast_cache.get("a")
+    forecast_cache.put("c", Weather())
+    assert len(forecast_cache) == 2
+    assert forecast_cache.get("b") is None
+    assert forecast_cache.get("a") is not None
+    assert forecast_cache.get("c") is not None
+
+
+@pytest.mark.parametrize("test_data", [(Location("Berlin"), Location(" berlin ")),
+                                       (Location("Berlin", lat=52.52, lon=13.405), Location("Somewhere", lat=52.521, lon=13.4049)),
+                                       (Location("Berlin", "10115", "DE"), Location("Berlin", "10115", "de"))])
+def test_get_cache_key(test_data):
+    assert get_cache_key(test_data[0], "metric", "de") == get_cache_key(test_data[1], "metric", "de")
+    assert get_cache_key(test_data[0], "metric", "de") != get_cache_key(test_data[1], "imperial", "de")
+    assert get_cache_key(test_data[0], "metric", "de") != get_cache_key(test_data[1], "metric", "en")
+
+
+def test_get_weather_uses_cache(mock_config_detail_false, monkeypatch):
+    calls = []
+
+    def mock_get_weather(location):
+        calls.append(location)
+        location.set_lat_and_lon(52.52, 13.405)
+        return Weather()
+
+    from rhasspy_weather.api import openweathermap
+    monkeypatch.setattr(openweathermap, "get_weather", mock_get_weather)
+    monkeypatch.setattr(cache, "__forecast_cache", ForecastCache())
+    monkeypatch.setattr(cache, "__coordinates", {})
+
+    location = Location("Berlin")
+    weather = cache.get_weather(location)
+    assert cache.get_weather(location) is weather
+    assert cache.get_weather(Location("berlin")) is weather
+    assert len(calls) == 1
+
+
+def test_forecast_store(tmp_path):
+    store = ForecastStore(str(tmp_path / "forecast_cache.sqlite"))
+    weather = Weather()
+    weather.add_weather(datetime.date.today(), SimpleNamespace(time=datetime.time(12), end_time=datetime.time(14, 59)))
+    store.put("berlin", weather, time.time() - 30)
+
+    fetched, stored_weather = store.get("berlin", 60)
+    assert stored_weather.get_weather_for_date(datetime.date.today())[0].time == datetime.time(12)
+    assert store.get("berlin", 10) is None
+    assert store.get("london", 60) is None
+
+    store.remove_expired(10)
+    assert store.get("berlin", 60) is None
+
+
+def test_get_weather_async(mock_config_detail_false, monkeypatch):
+    calls = []
+
+    def mock_get_weather(location):
+        calls.append(location)
+        return Weather()
+
+    from rhasspy_weather.api import openweathermap
+    monkeypatch.setattr(openweathermap, "get_weather", mock_get_weather)
+    monkeypatch.setattr(cache, "__forecast_cache", ForecastCache())
+    monkeypatch.setattr(cache, "__coordinates", {})
+
+    async def get_twice():
+        first = await cache.get_weather_async(Location("Berlin"))
+        second = await cache.get_weather_async(Location("Berlin"))
+        return first, second
+
+    first, second = asyncio.get_event_loop().run_until_complete(get_twice())
+    assert first is second
+    assert len(calls) == 1
+
+
+def test_concurrent_requests_share_fetch(mock_config_detail_false, monkeypatch):
+    calls = []
+    release = threading.Event()
+
+    def mock_get_weather(location):
+        calls.append(location)
+        release.wait(5)
+        return Weather()
+
+    from rhasspy_weather.api import openweathermap
+    monkeypatch.setattr(openweathermap, "get_weather", mock_get_weather)
+    monkeypatch.setattr(cache, "__forecast_cache", ForecastCache())
+    monkeypatch.setattr(cache, "__coordinates", {})
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(cache.get_weather, Location("Berlin")) for _ in range(4)]
+        time.sleep(0.1)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_new_leader_checks_cache(mock_config_detail_false, monkeypatch):
+    calls = []
+    fetching = threading.Event()
+    missed = threading.Event()
+    stored = threading.Event()
+
+    def mock_get_weather(location):
+        calls.append(location)
+        fetching.set()
+        missed.wait(5)
+        return Weather()
+
+    forecast_cache = ForecastCache()
+    get_entry = forecast_cache.get_entry
+
+    def get_entry_and_wait(key):
+        # the late request misses the cache and only goes on after the first request stored its forecast
+        entry = get_entry(key)
+        if threading.current_thread().name == "late":
+            missed.set()
+            stored.wait(5)
+        return entry
+
+    from rhasspy_weather.api import openweathermap
+    monkeypatch.setattr(openweathermap, "get_weather", mock_get_weather)
+    monkeypatch.setattr(cache, "__forecast_cache", forecast_cache)
+    monkeypatch.setattr(cache, "__coordinates", {})
+    monkeypatch.setattr(forecast_cache, "get_entry", get_entry_and_wait)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        first = executor.submit(cache.get_weather, Location("Berlin", lat=52.52, lon=13.405))
+        fetching.wait(5)
+        results = []
+        late = threading.Thread(target=lambda: results.append(cache.get_weather(Location("Berlin", lat=52.52, lon=13.405))), name="late")
+        late.start()
+        weather = first.result(5)
+        stored.set()
+        late.join(5)
+
+    assert results == [weather]
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("api_behaviour", ["slow", "error"])
+def test_stale_while_revalidate(mock_config_detail_false, monkeypatch, api_behaviour):
+    new_weather = Weather()
+    refreshed = threading.Event()
+
+    def mock_get_weather(location):
+        if api_behaviour == "error":
+            raise WeatherError(ErrorCode.NO_NETWORK_ERROR)
+        time.sleep(0.3)
+        refreshed.set()
+        return new_weather
+
+    from rhasspy_weather.api import openweathermap
+    monkeypatch.setattr(openweathermap, "get_weather", mock_get_weather)
+    forecast_cache = ForecastCache(ttl=600, max_stale=3600)
+    monkeypatch.setattr(cache, "__forecast_cache", forecast_cache)
+    monkeypatch.setattr(cache, "__coordinates", {})
+    stale_weather = Weather()
+    forecast_cache.put(get_cache_key(Location("Berlin"), "metric", "de"), stale_weather, time.time() - 700)
+
+    assert cache.get_weather(Location("Berlin")) is stale_weather
+    if api_behaviour == "slow":
+        assert refreshed.wait(2)
+        time.sleep(0.05)
+        assert cache.get_weather(Location("Berlin")) is new_weather
+
+
+def test_resolve_coordinates(mock_config_detail_false, monkeypatch, tmp_path):
+    store = ForecastStore(str(tmp_path / "forecast_cache.sqlite"))
+    monkeypatch.setattr(cache, "__forecast_store", store)
+    monkeypatch.setattr(cache, "__coordinates", {})
+    monkeypatch.setattr(MockConfig, "cache_persistent", True)
+
+    location = Location("Hamburg")
+    assert not cache.resolve_coordinates(location)
+    cache.remember_coordinates(location.key, 53.55, 9.99)
+
+    monkeypatch.setattr(cache, "__coordinates", {})
+    location = Location(" hamburg")
+    assert cache.resolve_coordinates(location)
+    assert (location.lat, location.lon) == (53.55, 9.99)
+    assert location.name == " hamburg"
+    assert location.key == "53.55,9.99"
+
+
+def test_expired_forecast_while_rate_limited(mock_config_detail_false, monkeypatch):
+    def mock_get_weather(location):
+        raise WeatherError(ErrorCode.API_TIMEOUT_ERROR)
+
+    from rhasspy_weather.api import openweathermap
+    monkeypatch.setattr(openweathermap, "get_weather", mock_get_weather)
+    monkeypatch.setattr(MockConfig, "stale_while_revalidate", False)
+    forecast_cache = ForecastCache(ttl=600, max_stale=3600)
+    monkeypatch.setattr(cache, "__forecast_cache", forecast_cache)
+    monkeypatch.setattr(cache, "__coordinates", {})
+    stale_weather = Weather()
+    forecast_cache.put(get_cache_key(Location("Berlin"), "metric", "de"), stale_weather, time.time() - 700)
+
+    assert cache.get_weather(Location("Berlin")) is stale_weather
+    with pytest.raises(WeatherError):
+        cache.get_weather(Location("Hamburg"))
+
+
+def test_get_weather_many(mock_config_detail_false, monkeypatch):
+    weathers = {"Berlin": Weather(), "Hamburg": Weather()}
+
+    def mock_get_weather(location):
+        time.sleep(0.2)
+        if location.city == "Nowhere":
+            raise WeatherError(ErrorCode.LOCATION_ERROR)
+        return weathers[location.city]
+
+    from rhasspy_weather.api import openweathermap
+    monkeypatch.setattr(openweathermap, "get_weather", mock_get_weather)
+    monkeypatch.setattr(cache, "__forecast_cache", ForecastCache())
+    monkeypatch.setattr(cache, "__coordinates", {})
+
+    start = time.monotonic()
+    results = cache.get_weather_many([Location("Hamburg"), Location("Nowhere"), Location("Berlin")])
+    assert time.monotonic() - start < 0.5
+    assert results[0] is weathers["Hamburg"]
+    assert isinstance(results[1], WeatherError) and results[1].error_code == ErrorCode.LOCATION_ERROR
+    assert results[2] is weathers["Berlin"]
+
+
+def test_report_cache():
+    report_cache = ReportCache(max_entries=3)
+    report_cache.put("a", 1, "a1")
+    report_cache.put("b", 1, "b1")
+    report_cache.put("a", 2, "a2")
+    assert report_cache.get("a", 1) == "a1"
+    assert report_cache.get("a", 2) == "a2"
+    assert report_cache.get("b", 2) is None
+
+    report_cache.put("c", 2, "c2")
+    assert report_cache.get("b", 1) is None
+    report_cache.invalidate(2)
+    assert len(report_cache) == 1
+    assert report_cache.get("a", 1) == "a1"
+
+
+def test_reports_dropped_with_forecast(monkeypatch):
+    report_cache = ReportCache()
+    monkeypatch.setattr(cache, "__report_cache", report_cache)
+    forecast_cache = ForecastCache(max_entries=1)
+    old_weather = Weather()
+    forecast_cache.put("berlin", old_weather)
+    report_cache.put("request", old_weather.version, "old report")
+
+    new_weather = Weather()
+    forecast_cache.put("berlin", new_weather)
+    report_cache.put("request", new_weather.version, "new report")
+    assert report_cache.get("request", old_weather.version) is None
+    assert report_cache.get("request", new_weather.version) == "new report"
+
+    forecast_cache.put("hamburg", Weather())
+    assert len(report_cache) == 0
+
+
+def test_get_reports(mock_config_detail_false, monkeypatch):
+    from rhasspy_weather import weather
+    from rhasspy_weather.api import openweathermap
+    from rhasspy_weather.data_types.report import WeatherReport
+    from rhasspy_weather.data_types.request import WeatherRequest, DateType, Grain, ForecastType
+    from tests.test_openweathermap import build_forecast_list
+    calls = []
+    tomorrow = datetime.date.today() + datetime.timedelta(days=1)
+
+    def mock_get_weather(location):
+        calls.append(location.city)
+        if location.city == "Nowhere":
+            raise WeatherError(ErrorCode.LOCATION_ERROR)
+        location.set_lat_and_lon(52.52, 13.405)
+        return openweathermap.parse_forecast(build_forecast_list(datetime.datetime.combine(tomorrow, datetime.time(0)), 8, 3), location)
+
+    monkeypatch.setattr(openweathermap, "get_weather", mock_get_weather)
+    monkeypatch.setattr(cache, "__forecast_cache", ForecastCache())
+    monkeypatch.setattr(cache, "__coordinates", {})
+
+    requests = []
+    for city, date in [("Berlin", tomorrow), ("Nowhere", tomorrow), ("berlin", tomorrow), ("Berlin", tomorrow + datetime.timedelta(days=3))]:
+        request = WeatherRequest(DateType.FIXED, Grain.DAY, date, ForecastType.FULL)
+        request.location = Location(city)
+        requests.append(request)
+    reports = weather.get_reports(requests)
+    assert sorted(calls) == ["Berlin", "Nowhere"]
+    assert isinstance(reports[0], WeatherReport) and reports[0].request is requests[0]
+    assert isinstance(reports[1], WeatherError) and reports[1].error_code == ErrorCode.LOCATION_ERROR
+    assert isinstance(reports[2], WeatherReport) and reports[2].request is requests[2]
+    assert isinstance(reports[3], WeatherError) and reports[3].error_code == ErrorCode.NO_WEATHER_FOR_DAY_ERROR
+
+    async_reports = asyncio.get_event_loop().run_until_complete(weather.get_reports_async(requests))
+    assert [type(x) for x in async_reports] == [type(x) for x in reports]
+    assert len(calls) == 3
+
+
+def test_revalidate_executor_created_once(monkeypatch):
+    monkeypatch.setattr(cache, "__revalidate_executor", None)
+    get_revalidate_executor = getattr(cache, "__get_revalidate_executor")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        executors = list(executor.map(lambda _: get_revalidate_executor(), range(8)))
+    assert all(x is executors[0] for x in executors)
+    executors[0].shutdown()
@@ -0,0 +1,23 @@
+import pytest
+
+from rhasspy_weather.data_types.condition import ConditionType, WindCondition, get_condition, get_wind_condition
+
+
+def test_get_condition_is_shared(mock_config_detail_false):
+    condition = get_condition(1, ConditionType.RAIN, "moderate rain")
+    assert get_condition(1, ConditionType.RAIN, "moderate rain") is condition
+    assert get_condition(2, ConditionType.RAIN, "moderate rain") is not condition
+    assert get_condition(0, ConditionType.SUN) is get_condition(0, ConditionType.SUN)
+
+
+@pytest.mark.parametrize("wind_speed, severity", [(0, 0), (1.6, 1), (10, 8), (40, 32)])
+def test_get_wind_condition(mock_config_detail_false, wind_speed, severity):
+    condition = get_wind_condition(wind_speed)
+    assert isinstance(condition, WindCondition)
+    assert condition.severity == severity
+    assert condition is get_wind_condition(wind_speed)
+
+
+@pytest.mark.parametrize("wind_direction, compass_direction", [(0, "N"), (168, "S"), (350, "N"), (300, "NW")])
+def test_get_compass_direction(wind_direction, compass_direction):
+    assert WindCondition.get_compass_direction(wind_direction) == compass_direction
@@ -6,7 +6,7 @@ from rhasspy_weather.data_types.config import get_config
 from rhasspy_weather.data_types.error import WeatherError, ErrorCode
 
 from rhasspy_weather.utils.dt_utils import get_date_with_year, named_day_to_date, weekday_to_date, date_string_to_date, \
-    named_time_to_time
+    named_time_to_time, named_range_to_dates, named_range_to_str
 
 
 def test_get_date_with_year(mock_config_detail_true):
@@ -60,6 +60,26 @@ def test_named_day_to_date(mock_config_detail_true):
     assert type(error.value.error_code) == ErrorCode
 
 
+def test_named_range_to_dates(mock_config_detail_true):
+    config = get_config()
+    today = datetime.datetime.now(tz=config.timezone).date()
+    for named_range, value in config.locale.named_ranges.items():
+        first, last = named_range_to_dates(named_range)
+        assert named_range_to_str(named_range) == named_range
+        if type(value) == int:
+            assert (first, last) == (today, today + datetime.timedelta(value - 1))
+        else:
+            assert (first.weekday(), last.weekday()) == value
+            assert today <= last < today + datetime.timedelta(7)
+
+    for synonym, named_range in config.locale.named_ranges_synonyms.items():
+        assert named_range_to_dates(synonym.upper()) == named_range_to_dates(named_range)
+        assert named_range_to_str(synonym) == named_range
+
+    with pytest.raises(WeatherError):
+        named_range_to_dates("blah")
+
+
 def test_weekday_to_date(mock_config_detail_true):
     config = get_config()
     for weekday in config.locale.weekday_names:
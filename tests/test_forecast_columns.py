@@ -0,0 +1,47 @@
+import datetime
+
+import pytest
+
+from rhasspy_weather.api.openweathermap import parse_forecast
+from rhasspy_weather.data_types.forecast_columns import to_timestamp
+from rhasspy_weather.data_types.location import Location
+from tests.test_openweathermap import build_forecast_list
+
+start = datetime.datetime.combine(datetime.date.today(), datetime.time(12, 0))
+
+
+@pytest.fixture
+def weather(mock_config_detail_false):
+    location = Location("Berlin", lat=52.52, lon=13.405)
+    return parse_forecast(build_forecast_list(start, 40, 3), location)
+
+
+@pytest.mark.parametrize("interval", [(datetime.time.min, datetime.time.max), (datetime.time(14), datetime.time(14)),
+                                      (datetime.time(15), datetime.time(15)), (datetime.time(14), datetime.time(20)),
+                                      (datetime.time(6), datetime.time(10)), (datetime.time(23), datetime.time.max)])
+def test_get_index_range_matches_get_weather_at_interval(weather, interval):
+    columns = weather.columns
+    for days in range(6):
+        date = start.date() + datetime.timedelta(days=days)
+        first, last = columns.get_index_range(to_timestamp(date, interval[0]), to_timestamp(date, interval[1]))
+        assert columns.entries[first:last] == weather.get_weather_at_interval(date, interval)
+
+
+def test_aggregate_between(weather):
+    # temperature and pressure grow by one with every entry
+    aggregate = weather.columns.aggregate_between(start, start + datetime.timedelta(days=1))
+    assert aggregate.count == 9
+    assert (aggregate.min_temperature, aggregate.max_temperature, aggregate.mean_temperature) == (0, 8, 4)
+    assert (aggregate.min_pressure, aggregate.max_pressure) == (1000, 1008)
+    assert aggregate.max_wind_speed == 1.6
+    assert weather.columns.aggregate_between(start - datetime.timedelta(days=2), start - datetime.timedelta(days=1)) is None
+
+
+def test_columns_follow_changes(weather):
+    columns = weather.columns
+    assert len(columns) == 40
+    assert len(columns.conditions) == 1
+    entry = weather.get_weather_for_date(start.date())[0]
+    weather.add_weather(start.date(), entry)
+    assert weather.columns is not columns
+    assert len(weather.columns) == 41
@@ -61,3 +61,14 @@ def test_get_request_rhasspy_full(input_key, import_data):
                 assert result.date_type == DateType.FIXED
             else:
                 assert result.date_type == DateType.INTERVAL
+
+
+def test_get_request_rhasspy_range():
+    input_data = json.loads(intent.intents["rhasspy_intent"]["request_weather_full_range"])
+    result = weather.get_request(input_data, "test_config_parser_rhasspy.ini")
+    assert result.forecast_type == ForecastType.FULL
+    assert result.grain == Grain.WEEK
+    assert result.date_type == DateType.INTERVAL
+    assert result.request_date == datetime.date.today()
+    assert result.end_date == datetime.date.today() + datetime.timedelta(days=4)
+    assert result.date_specified == "in den nächsten Tagen"
@@ -0,0 +1,109 @@
+import datetime
+import pickle
+
+import pytest
+
+from rhasspy_weather.api import openweathermap
+from rhasspy_weather.api.openweathermap import parse_forecast
+from rhasspy_weather.data_types.condition import ConditionType
+from rhasspy_weather.data_types.error import ErrorCode, WeatherError
+from rhasspy_weather.data_types.location import Location
+
+
+def build_forecast_list(start: datetime.datetime, count: int, step_hours: int):
+    forecast_list = []
+    for x in range(count):
+        date_and_time = start + datetime.timedelta(hours=x * step_hours)
+        forecast_list.append({
+            "dt": int(date_and_time.timestamp()),
+            "main": {"temp": x, "pressure": 1000 + x, "humidity": 50},
+            "weather": [{"id": 501, "main": "Rain", "description": "Mäßiger Regen"}],
+            "wind": {"speed": 1.6, "deg": 168},
+            "dt_txt": str(date_and_time)
+        })
+    return forecast_list
+
+
+def test_parse_forecast(mock_config_detail_false):
+    location = Location("Berlin")
+    location.set_lat_and_lon(52.52, 13.405)
+    start = datetime.datetime.combine(datetime.date.today(), datetime.time(12, 0))
+    weather = parse_forecast(build_forecast_list(start, 10, 3), location)
+
+    today = weather.get_weather_for_date(start.date())
+    tomorrow = weather.get_weather_for_date(start.date() + datetime.timedelta(days=1))
+    assert [x.time for x in today] == [datetime.time(12), datetime.time(15), datetime.time(18), datetime.time(21)]
+    assert len(tomorrow) == 6
+    assert tomorrow[0].temperature == 4
+    assert tomorrow[0].main_condition.condition_type == ConditionType.RAIN
+    assert tomorrow[0].main_condition.severity == 1
+    assert tomorrow[0].end_time == datetime.time(3, 59)
+
+
+def test_parse_forecast_hourly(mock_config_detail_false):
+    location = Location("Berlin")
+    location.set_lat_and_lon(52.52, 13.405)
+    start = datetime.datetime.combine(datetime.date.today(), datetime.time(0, 0))
+    weather = parse_forecast(build_forecast_list(start, 24, 1), location)
+
+    today = weather.get_weather_for_date(start.date())
+    assert len(today) == 24
+    assert today[0].end_time == datetime.time(1, 59)
+
+
+def test_parsed_forecast_is_compact(mock_config_detail_false):
+    location = Location("Berlin")
+    location.set_lat_and_lon(52.52, 13.405)
+    start = datetime.datetime.combine(datetime.date.today(), datetime.time(12, 0))
+    weather = parse_forecast(build_forecast_list(start, 10, 3), location)
+
+    entries = weather.get_weather_for_date(start.date())
+    assert not hasattr(entries[0], "__dict__")
+    assert not hasattr(entries[0].main_condition, "__dict__")
+    assert entries[0].location is entries[1].location
+    assert entries[0].main_condition is entries[1].main_condition
+
+    restored = pickle.loads(pickle.dumps(weather, pickle.HIGHEST_PROTOCOL))
+    restored_entry = restored.get_weather_for_date(start.date())[0]
+    assert restored_entry.time == entries[0].time
+    assert restored_entry.end_time == entries[0].end_time
+    assert restored_entry.wind_direction == entries[0].wind_direction == "S"
+
+
+@pytest.mark.parametrize("mock_request, error_code", [("mock_request_401", ErrorCode.API_ERROR),
+                                                      ("mock_request_404", ErrorCode.LOCATION_ERROR)])
+def test_get_weather_error(mock_config_detail_false, mock_request, error_code, request, monkeypatch):
+    request.getfixturevalue(mock_request)
+    monkeypatch.setattr(openweathermap, "rate_limiter", openweathermap.RateLimiter())
+    with pytest.raises(WeatherError) as error:
+        openweathermap.get_weather(Location("Frankfurt"))
+    assert error.value.error_code == error_code
+
+
+def test_get_weather(mock_config_detail_false, mock_request_200, monkeypatch):
+    monkeypatch.setattr(openweathermap, "rate_limiter", openweathermap.RateLimiter())
+    location = Location("Frankfurt")
+    weather = openweathermap.get_weather(location)
+    assert (location.lat, location.lon) == (50.1167, 8.6833)
+    entries = weather.get_weather_between(datetime.datetime.min, datetime.datetime.max)
+    assert [x.temperature for x in entries] == [30, 25, 0, 5, 15, 18]
+    assert entries[2].main_condition.condition_type == ConditionType.SNOW
+
+
+def test_get_weather_malformed_forecast(mock_config_detail_false, monkeypatch):
+    class MalformedResponse:
+        status_code = 200
+        headers = {}
+
+        @staticmethod
+        def json():
+            return {"cod": "200", "city": {"coord": {"lat": 50.1167, "lon": 8.6833}}, "list": [{"dt": "not a timestamp"}]}
+
+    import requests
+    monkeypatch.setattr(requests.Session, "get", lambda *args, **kwargs: MalformedResponse())
+    rate_limiter = openweathermap.RateLimiter()
+    monkeypatch.setattr(openweathermap, "rate_limiter", rate_limiter)
+    with pytest.raises(WeatherError) as error:
+        openweathermap.get_weather(Location("Frankfurt"))
+    assert error.value.error_code == ErrorCode.API_ERROR
+    assert not rate_limiter.is_blocked
@@ -0,0 +1,39 @@
+import time
+
+import pytest
+
+from rhasspy_weather import cache
+from rhasspy_weather.cache import ForecastCache
+from rhasspy_weather.data_types.location import Location
+from rhasspy_weather.data_types.weather import Weather
+from rhasspy_weather.prefetch import Prefetcher
+
+
+@pytest.mark.parametrize("test_data", [(0, 600), (600, 10800), (601, 10799), (10799, 601), (10800 + 600, 10800)])
+def test_seconds_until_next_refresh(test_data):
+    prefetcher = Prefetcher([], update_interval=10800, delay=600)
+    midnight = 1600000000 - 1600000000 % 86400
+    assert prefetcher.seconds_until_next_refresh(midnight + test_data[0]) == test_data[1]
+
+
+def test_refresh(monkeypatch):
+    refreshed = []
+    monkeypatch.setattr(cache, "refresh_weather", lambda location, expires: refreshed.append((location.name, expires)))
+    midnight = 1600000000 - 1600000000 % 86400
+    monkeypatch.setattr(time, "time", lambda: midnight + 700)
+    prefetcher = Prefetcher([Location("Berlin"), Location("Hamburg")], update_interval=10800, delay=600)
+    prefetcher.refresh()
+    # valid until the next refresh, not just for the cache ttl
+    expires = midnight + 10800 + 600 + Prefetcher.refresh_margin
+    assert refreshed == [("Berlin", expires), ("Hamburg", expires)]
+
+
+def test_prefetched_forecast_stays_valid(monkeypatch):
+    now = time.time()
+    forecast_cache = ForecastCache(ttl=600)
+    weather = Weather()
+    forecast_cache.put("berlin", weather, now, now + 10800)
+    monkeypatch.setattr(cache.time, "time", lambda: now + 5000)
+    assert forecast_cache.get("berlin") is weather
+    monkeypatch.setattr(cache.time, "time", lambda: now + 10801)
+    assert forecast_cache.get("berlin") is None
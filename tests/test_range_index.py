@@ -0,0 +1,65 @@
+import datetime
+import random
+
+import pytest
+
+from rhasspy_weather.api.openweathermap import parse_forecast
+from rhasspy_weather.data_types.location import Location
+from rhasspy_weather.data_types.range_index import SparseTable
+from rhasspy_weather.data_types.weather_summary import WeatherSummary
+from tests.test_openweathermap import build_forecast_list
+
+
+@pytest.mark.parametrize("combine", [min, max])
+def test_sparse_table(combine):
+    values = [random.Random(x).uniform(-10, 30) for x in range(37)]
+    table = SparseTable(values, combine)
+    for first in range(len(values)):
+        for last in range(first + 1, len(values) + 1):
+            assert table.query(first, last) == combine(values[first:last])
+
+
+def collect_conditions(entries):
+    conditions = []
+    for weather_at_time in entries:
+        for condition in [weather_at_time.main_condition] + weather_at_time.other_conditions:
+            in_list = [x for x in conditions if x.condition_type == condition.condition_type]
+            if not in_list:
+                conditions.append(condition)
+            elif condition.severity > in_list[0].severity:
+                conditions.remove(in_list[0])
+                conditions.append(condition)
+    return conditions
+
+
+def test_range_index(mock_config_detail_false):
+    rng = random.Random(3)
+    start = datetime.datetime.combine(datetime.date.today(), datetime.time(12, 0))
+    forecast_list = build_forecast_list(start, 40, 3)
+    for forecast in forecast_list:
+        forecast["main"]["temp"] = rng.uniform(-5, 30)
+        forecast["weather"][0]["id"] = rng.choice([500, 501, 502, 600, 601, 741, 800, 801, 804, 200])
+        forecast["wind"]["speed"] = rng.uniform(0, 20)
+    weather = parse_forecast(forecast_list, Location("Berlin", lat=52.52, lon=13.405))
+    range_index = weather.range_index
+    entries = weather.columns.entries
+
+    for first in range(0, len(entries), 3):
+        for last in range(first + 1, len(entries) + 1):
+            aggregate = range_index.aggregate(first, last)
+            assert aggregate.min_temperature == min(x.temperature for x in entries[first:last])
+            assert aggregate.max_wind_speed == max(x.wind_speed for x in entries[first:last])
+            assert aggregate.mean_pressure == pytest.approx(sum(x.pressure for x in entries[first:last]) / (last - first))
+            assert range_index.get_conditions(first, last) == collect_conditions(entries[first:last])
+            assert WeatherSummary.from_entries(aggregate, entries[first:last]).conditions == collect_conditions(entries[first:last])
+            counts = range_index.get_condition_counts(first, last)
+            assert sum(counts.values()) == sum(1 + len(x.other_conditions) for x in entries[first:last])
+
+
+def test_query(mock_config_detail_false):
+    start = datetime.datetime.combine(datetime.date.today(), datetime.time(12, 0))
+    weather = parse_forecast(build_forecast_list(start, 40, 3), Location("Berlin", lat=52.52, lon=13.405))
+    summary = weather.query(start + datetime.timedelta(hours=10), start + datetime.timedelta(days=2, hours=1))
+    assert summary.count == len(weather.get_weather_between(start + datetime.timedelta(hours=10), start + datetime.timedelta(days=2, hours=1)))
+    assert summary.aggregate.min_temperature == 4
+    assert weather.query(start - datetime.timedelta(days=2), start - datetime.timedelta(days=1)) is None
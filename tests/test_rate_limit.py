@@ -0,0 +1,49 @@
+import email.utils
+import time
+
+import pytest
+
+from rhasspy_weather.utils.rate_limit import RateLimiter, parse_retry_after
+
+
+def test_token_bucket():
+    rate_limiter = RateLimiter(calls_per_minute=60, burst=3)
+    assert [rate_limiter.acquire() for _ in range(4)] == [True, True, True, False]
+    stats = rate_limiter.stats
+    assert stats["calls_allowed"] == 3
+    assert stats["calls_rejected"] == 1
+    assert stats["calls_this_minute"] == 3
+    time.sleep(1.05)
+    assert rate_limiter.acquire()
+
+
+def test_throttled_blocks_calls():
+    rate_limiter = RateLimiter(calls_per_minute=6000, burst=10, base_backoff=0.01)
+    rate_limiter.throttled(retry_after=30)
+    assert not rate_limiter.acquire()
+    assert rate_limiter.is_blocked
+    assert 29 < rate_limiter.stats["blocked_for"] <= 30
+    assert rate_limiter.stats["throttled_responses"] == 1
+
+
+def test_backoff_grows_and_resets():
+    rate_limiter = RateLimiter(base_backoff=1, max_backoff=4)
+    delays = []
+    for _ in range(4):
+        rate_limiter.failed()
+        delays.append(rate_limiter.stats["blocked_for"])
+    assert 0.5 <= delays[0] <= 1
+    assert 2 <= delays[2] <= 4
+    assert delays[3] <= 4
+    rate_limiter.succeeded()
+    rate_limiter.failed()
+    assert rate_limiter.stats["blocked_for"] <= delays[3]
+
+
+@pytest.mark.parametrize("value, expected", [(None, None), ("120", 120), ("-5", 0), ("soon", None)])
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_date():
+    assert parse_retry_after(email.utils.formatdate(time.time() + 60, usegmt=True)) == pytest.approx(60, abs=2)
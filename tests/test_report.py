@@ -0,0 +1,165 @@
+import datetime
+
+import pytest
+
+from rhasspy_weather import cache
+from rhasspy_weather.api.openweathermap import parse_forecast
+from rhasspy_weather.cache import ReportCache
+from rhasspy_weather.data_types.condition import ConditionType
+from rhasspy_weather.data_types.config import get_config
+from rhasspy_weather.data_types.error import WeatherError, ErrorCode
+from rhasspy_weather.data_types.fixed_times import FixedTimes
+from rhasspy_weather.data_types.location import Location
+from rhasspy_weather.data_types.report import WeatherReport
+from rhasspy_weather.data_types.request import WeatherRequest, DateType, Grain, ForecastType
+from rhasspy_weather.data_types.weather import summary_intervals
+from rhasspy_weather.templates import get_placeholders, weather_report_to_template_values
+from tests.test_openweathermap import build_forecast_list
+
+tomorrow = datetime.date.today() + datetime.timedelta(days=1)
+
+
+@pytest.fixture
+def weather(mock_config_detail_false):
+    # tomorrow: light rain, clouds, heavy rain, clouds, clouds, clear sky, clear sky, light rain
+    forecast_list = build_forecast_list(datetime.datetime.combine(tomorrow, datetime.time(0)), 8, 3)
+    for forecast, owm_id in zip(forecast_list, [500, 803, 502, 804, 801, 800, 800, 500]):
+        forecast["weather"][0]["id"] = owm_id
+        forecast["weather"][0]["description"] = str(owm_id)
+    return parse_forecast(forecast_list, Location("Berlin", lat=52.52, lon=13.405))
+
+
+def test_conditions(weather):
+    report = WeatherReport(WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.CONDITION), weather)
+    conditions = report.weather_condition_list
+    # most severe condition of every type, ordered by the first entry that has it
+    assert [(x.condition_type, x.description) for x in conditions[:3]] == [(ConditionType.WIND, conditions[0].description),
+                                                                           (ConditionType.RAIN, "502"), (ConditionType.CLOUDS, "804")]
+    assert ConditionType.CLEAR in [x.condition_type for x in conditions]
+    assert report.is_weather_chance(ConditionType.RAIN)
+    assert not report.is_weather_chance(ConditionType.SNOW)
+    assert "800" in report.get_output_condition_list()
+    assert "800" not in report.get_output_condition_list(clouds_and_clear_exclusive=True)
+    assert "502" in report.get_output_condition_list(clouds_and_clear_exclusive=True)
+
+
+def test_interval(weather):
+    request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.TEMPERATURE)
+    report = WeatherReport(request, weather, (datetime.time(14), datetime.time(18)))
+    assert (report.min_temperature, report.max_temperature) == (5, 6)
+    assert report.get_output_condition_list() == ["800", "Windstille"]
+
+
+def test_speech_only_for_requested_forecast_type(weather):
+    report = WeatherReport(WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.FULL), weather)
+    speech = report.speech
+    assert list(speech) == [ForecastType.FULL]
+    assert "{" not in speech[ForecastType.FULL]
+    assert "Grad" in speech[ForecastType.FULL]
+
+
+def test_template_values(weather):
+    request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.TEMPERATURE)
+    request.location = Location("Berlin", lat=52.52, lon=13.405)
+    report = WeatherReport(request, weather, (datetime.time(14), datetime.time(18)))
+    placeholders = get_placeholders("$report_min_temperature ${report_max_temperature} $request_location_city $$ignored")
+    assert placeholders == {"report_min_temperature", "report_max_temperature", "request_location_city"}
+
+    values = weather_report_to_template_values(report, placeholders)
+    assert values == {"report_min_temperature": 5, "report_max_temperature": 6, "request_location_city": "Berlin"}
+    assert "speech" in weather_report_to_template_values(report, {"speech"})
+
+
+def test_report_data_cached(weather, monkeypatch):
+    monkeypatch.setattr(cache, "__report_cache", ReportCache())
+    request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.CONDITION)
+    request.location = Location("Berlin", lat=52.52, lon=13.405)
+    same_request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.CONDITION)
+    same_request.location = Location("Berlin", lat=52.5201, lon=13.4049)
+    assert request.fingerprint == same_request.fingerprint
+    same_request.requested = ConditionType.RAIN
+    assert request.fingerprint != same_request.fingerprint
+    same_request.requested = ""
+
+    first = WeatherReport(request, weather)
+    calls = []
+    monkeypatch.setattr(weather, "get_summary", lambda *args: calls.append(args))
+    second = WeatherReport(same_request, weather)
+    assert not calls
+    assert second.weather_condition_list == first.weather_condition_list
+    assert second.speech[ForecastType.CONDITION]
+
+    # a changed forecast is a new version, nothing is reused
+    weather.add_weather(tomorrow + datetime.timedelta(days=1), weather.get_weather_for_date(tomorrow)[0])
+    with pytest.raises(WeatherError):
+        WeatherReport(request, weather)
+    assert len(calls) == 1
+
+
+def test_detail(weather, mock_config_detail_true, monkeypatch):
+    monkeypatch.setattr(cache, "__report_cache", ReportCache())
+    request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.FULL)
+    assert request.times == [fixed_time.value for fixed_time in FixedTimes]
+    calls = []
+    get_summary = weather.get_summary
+    monkeypatch.setattr(weather, "get_summary", lambda *args: calls.append(args) or get_summary(*args))
+
+    report = WeatherReport(request, weather)
+    # the parts of the day come from the summaries calculated when the forecast was ingested
+    assert [interval for date, interval in calls] == summary_intervals
+    speech = report.speech[ForecastType.FULL]
+    assert speech.count("Grad") == 3
+    assert speech.index("Morgens") < speech.index("502") < speech.index("Mittags") < speech.index("Abends")
+    assert "502" not in speech[speech.index("Mittags"):]
+
+    # questions are still answered for the whole day
+    question = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.CONDITION)
+    question.requested = ConditionType.RAIN
+    assert "Morgens" not in WeatherReport(question, weather).speech[ForecastType.CONDITION]
+
+    hour_request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.TEMPERATURE)
+    hour_request.set_time("12:00:00", "um 12 Uhr")
+    assert hour_request.times == [(datetime.time(12), None)]
+    assert "Mittags" not in WeatherReport(hour_request, weather).speech[ForecastType.TEMPERATURE]
+
+
+def test_range(mock_config_detail_false, monkeypatch):
+    monkeypatch.setattr(cache, "__report_cache", ReportCache())
+    # rain tomorrow, clear sky and warmer the day after
+    forecast_list = build_forecast_list(datetime.datetime.combine(tomorrow, datetime.time(0)), 16, 3)
+    for forecast, owm_id in zip(forecast_list, [500] * 8 + [800] * 8):
+        forecast["weather"][0]["id"] = owm_id
+        forecast["weather"][0]["description"] = str(owm_id)
+    weather = parse_forecast(forecast_list, Location("Berlin", lat=52.52, lon=13.405))
+    day_after_tomorrow = tomorrow + datetime.timedelta(days=1)
+
+    request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.FULL)
+    request.set_date((tomorrow - datetime.timedelta(days=7), tomorrow + datetime.timedelta(days=5)), "diese Woche")
+    assert (request.grain, request.request_date) == (Grain.WEEK, datetime.date.today())
+    with pytest.raises(WeatherError):
+        request.set_time("12:00:00", "um 12 Uhr")
+
+    calls = []
+    query = weather.query
+    monkeypatch.setattr(weather, "query", lambda *args: calls.append(args) or query(*args))
+    report = WeatherReport(request, weather)
+    # the whole range in one query, only days with weather
+    assert calls == [(datetime.datetime.combine(tomorrow, datetime.time.min), datetime.datetime.combine(day_after_tomorrow, datetime.time.max))]
+    assert (report.min_temperature, report.max_temperature) == (0, 15)
+    assert [(x["date"], x["min_temperature"], x["max_temperature"]) for x in report.days] == [(str(tomorrow), 0, 7), (str(day_after_tomorrow), 8, 15)]
+    assert len(report.weather) == 16
+
+    weekday_names = get_config().locale.weekday_names
+    speech = report.speech[ForecastType.FULL]
+    assert "diese woche" in speech.lower()
+    assert "am " + weekday_names[day_after_tomorrow.weekday()] + " mit 15 Grad" in speech
+    assert speech.endswith("Regen gibt es am " + weekday_names[tomorrow.weekday()] + ".")
+
+    past = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.FULL)
+    with pytest.raises(WeatherError):
+        past.set_date((tomorrow - datetime.timedelta(days=7), tomorrow - datetime.timedelta(days=2)), "")
+    too_late = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.FULL)
+    too_late.set_date((tomorrow + datetime.timedelta(days=3), tomorrow + datetime.timedelta(days=4)), "")
+    with pytest.raises(WeatherError) as error:
+        WeatherReport(too_late, weather)
+    assert error.value.error_code == ErrorCode.FUTURE_WEATHER_ERROR
@@ -0,0 +1,35 @@
+import datetime
+
+import pytest
+
+from rhasspy_weather.data_types.condition import WeatherCondition, ConditionType
+from rhasspy_weather.data_types.location import Location
+from rhasspy_weather.data_types.weather_at_time import WeatherAtTime
+from rhasspy_weather.utils import sun_times
+
+
+def test_get_sun_times_is_memoized(monkeypatch):
+    monkeypatch.setattr(sun_times, "__sun_times", {})
+    dates = [datetime.date(2030, 6, 21), datetime.date(2030, 12, 21)]
+    result = sun_times.get_sun_times(52.5201, 13.4049, dates)
+    assert result[dates[0]][0] < result[dates[1]][0]
+    assert result[dates[0]][1] > result[dates[1]][1]
+    # close coordinates share the entry
+    assert sun_times.get_sunrise_and_sunset(52.52, 13.40, dates[1]) is result[dates[1]]
+    assert len(sun_times.__dict__["__sun_times"]) == 2
+
+
+@pytest.mark.parametrize("time, expected", [(datetime.time(2, 0), ConditionType.STARS), (datetime.time(12, 0), ConditionType.SUN),
+                                            (datetime.time(23, 0), ConditionType.STARS)])
+def test_sun_and_stars_on_later_days(mock_config_detail_false, time, expected):
+    location = Location("Berlin", lat=52.52, lon=13.405)
+    date = datetime.date.today() + datetime.timedelta(days=4)
+    clear = WeatherCondition(0, "clear sky", ConditionType.CLEAR)
+    weather_at_time = WeatherAtTime(date, time, 20, clear, 1000, 50, 1.6, 168, 1, location)
+    assert [x.condition_type for x in weather_at_time.other_conditions][1:] == [expected]
+
+
+def test_location_without_coordinates(mock_config_detail_false):
+    location = Location("Berlin")
+    assert location.sunrise is None
+    assert location.get_sunrise_and_sunset() == (None, None)
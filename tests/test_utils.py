@@ -1,6 +1,9 @@
+import configparser
+
 import pytest
 
-from rhasspy_weather.utils.utils import normal_round, remove_excessive_whitespaces, format_string
+from rhasspy_weather.utils.http import parse_timeout, default_timeout
+from rhasspy_weather.utils.utils import normal_round, remove_excessive_whitespaces, format_string, fill_placeholders
 
 
 @pytest.mark.parametrize("test_data", [(0.5, 1), (0.4, 0), (0.6, 1), (0, 0), (1, 1)])
@@ -16,3 +19,17 @@ def test_remove_excessive_whitespaces(test_data):
 @pytest.mark.parametrize("test_data", [("Ich bin ein Testsatz..  .", "Ich bin ein Testsatz."), ("ich bin ein Testsatz.", "Ich bin ein Testsatz."), ("Ich bin ein Testsatz... Ich auch .", "Ich bin ein Testsatz. Ich auch.")])
 def test_format_string(test_data):
     assert format_string(test_data[0]) == test_data[1]
+
+
+@pytest.mark.parametrize("test_data", [({"when": "morgen", "weather": "Regen"}, "Morgen ist das Wetter: Regen. 100% {nicht}"),
+                                       ({"where": "in Berlin", "weather": "Regen"}, " in Berlin ist das Wetter: Regen. 100% {nicht}"),
+                                       ({"when": "morgen", "where": "in Berlin"}, "Morgen in Berlin ist das Wetter:. 100% {nicht}")])
+def test_fill_placeholders(test_data):
+    assert format_string(fill_placeholders("{when} {where} ist das Wetter: {weather}. 100% {{nicht}}", **test_data[0])) == test_data[1]
+
+
+@pytest.mark.parametrize("test_data", [("connect_timeout=1\nread_timeout=2.5", (1, 2.5)), ("read_timeout=4", (default_timeout[0], 4)), ("connect_timeout=abc", default_timeout), ("", default_timeout)])
+def test_parse_timeout(test_data):
+    config_parser = configparser.ConfigParser()
+    config_parser.read_string("[api]\n" + test_data[0])
+    assert parse_timeout(config_parser["api"]) == test_data[1]
@@ -0,0 +1,85 @@
+import datetime
+import pickle
+import random
+
+import pytest
+
+from rhasspy_weather.api.openweathermap import parse_forecast
+from rhasspy_weather.data_types.condition import ConditionType
+from rhasspy_weather.data_types.fixed_times import FixedTimes
+from rhasspy_weather.data_types.location import Location
+from rhasspy_weather.data_types.weather import Weather
+from tests.test_openweathermap import build_forecast_list
+
+start = datetime.datetime.combine(datetime.date.today(), datetime.time(12, 0))
+
+
+def scan_interval(entries, interval):
+    return [x for x in entries if interval[0] <= x.time < interval[1] or x.time <= interval[1] <= x.end_time]
+
+
+@pytest.mark.parametrize("step_hours", [1, 3])
+def test_get_weather_at_interval(mock_config_detail_false, step_hours):
+    location = Location("Berlin", lat=52.52, lon=13.405)
+    entries = parse_forecast(build_forecast_list(start, 40, step_hours), location).columns.entries
+    random.Random(1).shuffle(entries)
+    weather = Weather()
+    for entry in entries:
+        weather.add_weather(entry.date, entry)
+
+    times = [datetime.time(hour, minute) for hour in range(24) for minute in (0, 30)] + [datetime.time.max]
+    for date in {x.date for x in weather.columns.entries}:
+        entries = weather.get_weather_for_date(date)
+        assert [x.time for x in entries] == sorted(x.time for x in entries)
+        for first in times[::3]:
+            for last in times:
+                if first <= last:
+                    assert weather.get_weather_at_interval(date, (first, last)) == scan_interval(entries, (first, last))
+        assert weather.get_weather_at_time(date, datetime.time(13)) == scan_interval(entries, (datetime.time(13), datetime.time(13)))
+
+
+def test_get_weather_between(mock_config_detail_false):
+    location = Location("Berlin", lat=52.52, lon=13.405)
+    weather = parse_forecast(build_forecast_list(start, 40, 3), location)
+    tomorrow = start.date() + datetime.timedelta(days=1)
+
+    overnight = weather.get_weather_at_interval(start.date(), (datetime.time(22), datetime.time(4)))
+    assert [(x.date, x.time.hour) for x in overnight] == [(tomorrow, 0), (tomorrow, 3)]
+
+    two_days = weather.get_weather_between(start, start + datetime.timedelta(days=2))
+    assert len(two_days) == 17
+    assert two_days[0].time == datetime.time(12)
+    assert weather.get_weather_between(start - datetime.timedelta(days=3), start - datetime.timedelta(days=2)) == []
+
+
+@pytest.mark.parametrize("interval", [(datetime.time.min, datetime.time.max), FixedTimes.MORNING.value, FixedTimes.AFTERNOON.value,
+                                      FixedTimes.EVENING.value, (datetime.time(14), datetime.time(18))])
+def test_get_summary(mock_config_detail_false, interval):
+    location = Location("Berlin", lat=52.52, lon=13.405)
+    weather = parse_forecast(build_forecast_list(start, 40, 3), location)
+    tomorrow = start.date() + datetime.timedelta(days=1)
+
+    summary = weather.get_summary(tomorrow, interval)
+    entries = weather.get_weather_at_interval(tomorrow, interval)
+    assert summary.count == len(entries)
+    assert summary.aggregate.min_temperature == min(x.temperature for x in entries)
+    assert summary.aggregate.max_temperature == max(x.temperature for x in entries)
+    assert summary.condition_counts[ConditionType.RAIN] == len(entries)
+    assert [x.condition_type for x in summary.conditions][:2] == [ConditionType.RAIN, ConditionType.WIND]
+
+    restored = pickle.loads(pickle.dumps(weather))
+    for other in (weather.get_summary(tomorrow, interval), restored.get_summary(tomorrow, interval)):
+        assert other.count == summary.count
+        assert other.aggregate.mean_temperature == summary.aggregate.mean_temperature
+        assert other.conditions == summary.conditions
+        assert other.condition_counts == summary.condition_counts
+
+
+def test_summary_follows_changes(mock_config_detail_false):
+    location = Location("Berlin", lat=52.52, lon=13.405)
+    weather = parse_forecast(build_forecast_list(start, 40, 3), location)
+    summary = weather.get_summary(start.date())
+    assert summary.count == 4
+    weather.add_weather(start.date(), weather.get_weather_for_date(start.date())[0])
+    assert weather.get_summary(start.date()).count == 5
+    assert weather.get_summary(start.date() - datetime.timedelta(days=1)) is None